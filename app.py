@@ -3,125 +3,144 @@
 Flask 웹 서버 + REST API
 """
 
-from flask import Flask, jsonify, render_template, send_file, send_from_directory
+from flask import Flask, Response, jsonify, render_template, request, send_file, send_from_directory
 from flask_cors import CORS
-from datetime import datetime
-from collections import defaultdict
-import threading
+from datetime import datetime, timedelta
+import json
+import math
+import tempfile
 import time
 import os
+import uuid
 
 # 컬렉터 임포트
 from collectors.system_info import (
-    get_cpu_info, get_memory_info, get_disk_info, 
-    get_network_info, get_system_info, get_process_info, format_bytes
+    get_cpu_info, get_memory_info, get_disk_io, get_partition_usage,
+    get_network_counters, get_process_info, format_bytes
 )
-from collectors.gpu_info import get_gpu_info, get_gpu_summary
-from collectors.temperature import get_cpu_temperature, get_all_temperatures
+from collectors.gpu_info import get_gpu_info
+from collectors.temperature import get_all_temperatures
+from collectors.process_groups import GROUP_BY
+from collectors.pipeline import AdaptiveScheduler, Collector, Sampler, record, sample_due
+from collectors.burst import BurstCapture
 from report.pdf_generator import generate_pdf_report
+from report.html_generator import REPORT_FORMATS, iter_html_report
+from storage.rollup import downsample
+from storage.history_store import HistoryStore
+from storage.series import Series, is_time_series
+from storage.sessions import SessionManager, session_status
+from storage.captures import CaptureStore, capture_summary
+from storage.forecast import (
+    FORECAST_AVAILABLE, FORECAST_HORIZON_DAYS, Forecaster, forecast_path, forecast_summary
+)
+from report.exporter import (
+    EXPORT_FORMATS, CONTENT_TYPES, PARQUET_AVAILABLE,
+    parse_time, iter_points, export_stream, write_parquet
+)
 
 
 app = Flask(__name__, static_folder='static', static_url_path='')
 CORS(app)
 
-# 데이터 히스토리 저장소
-history = defaultdict(list)
-last_network = None
-last_disk_io = None
-monitoring_active = False
-monitoring_start_time = None
+# 하위 cgroup까지 수집할지 여부 (컨테이너 호스트 / Kubernetes 노드)
+CGROUP_CHILDREN = os.environ.get('MONITOR_CGROUP_CHILDREN', '0') == '1'
+
+# 히스토리에 저장하는 프로세스 그룹 기준 (name / parent / user / cgroup)
+PROCESS_GROUP_BY = os.environ.get('MONITOR_PROCESS_GROUP_BY', 'name')
+
+# 수집 주기 (초) - 신호 변동성 / 호스트 부하에 따라 소스별로 최소~최대 사이에서 조절
+SAMPLE_INTERVAL = 1
+SAMPLE_INTERVAL_MAX = 10
+
+# 공유 히스토리 보존 기간 (초) - 대시보드 최장 표시 기간과 같음
+HISTORY_RETENTION = 24 * 3600
+
+# 버스트 캡처 (고주파 링 버퍼, MONITOR_BURST=0이면 끔) - 주기 / 트리거 전후 구간 (초)
+BURST_CAPTURE = os.environ.get('MONITOR_BURST', '1') == '1'
+BURST_INTERVAL = 0.1
+BURST_PRE_SECONDS = 10
+BURST_POST_SECONDS = 10
 
-# 시스템 정보 캐시
-system_info_cache = None
+# 수동 트리거 사유 최대 길이 (보고서 / 대시보드에 그대로 표시됨)
+MAX_CAPTURE_REASON = 64
+
+# 데이터 히스토리 저장소 (항상 켜져 있는 수집기 하나가 기록)
+history = HistoryStore(retention_seconds=HISTORY_RETENTION)
+collector = Collector(cgroup_children=CGROUP_CHILDREN, process_group_by=PROCESS_GROUP_BY)
+scheduler = AdaptiveScheduler(SAMPLE_INTERVAL, SAMPLE_INTERVAL_MAX)
+
+# 녹화 세션 (공유 히스토리 위의 시간 범위)
+sessions = SessionManager()
+
+# 버스트 캡처 이벤트 (일반 히스토리와 별도 보관)
+captures = CaptureStore()
+burst = BurstCapture(captures, BURST_INTERVAL, BURST_PRE_SECONDS, BURST_POST_SECONDS)
+
+# 추세 / 용량 예측 (장기 롤업은 히스토리 보존 기간보다 길게 유지)
+forecaster = Forecaster(history)
 
 # 5분 = 300초
 MONITORING_DURATION = 300
 
+# 다운샘플링 히스토리의 최대 구간 수
+MAX_HISTORY_POINTS = 2000
+
 
 def collect_data():
     """데이터 수집"""
-    global last_network, last_disk_io, system_info_cache
-    
-    now = datetime.now()
+    sample = sample_due(collector, scheduler)
+    if sample:
+        with history.lock:
+            record(history, sample)
+        # 롤업은 보존 기간이 지나 정리되기 전에 (구간이 닫힐 때만 실제로 계산)
+        forecaster.update(sample['time'])
+        history.trim(sample['time'])
     
-    # CPU
-    cpu = get_cpu_info()
-    history['cpu'].append({'time': now, 'value': cpu['usage_percent']})
-    
-    # 메모리
-    mem = get_memory_info()
-    history['memory'].append({'time': now, 'value': mem['percent']})
-    
-    # 네트워크 (초당 전송량 계산)
-    net = get_network_info()
-    if last_network:
-        sent_per_sec = (net['bytes_sent'] - last_network['bytes_sent']) / 1024 / 1024  # MB/s
-        recv_per_sec = (net['bytes_recv'] - last_network['bytes_recv']) / 1024 / 1024  # MB/s
-        history['network_sent'].append({'time': now, 'value': max(0, sent_per_sec)})
-        history['network_recv'].append({'time': now, 'value': max(0, recv_per_sec)})
-    last_network = net
-    
-    # 디스크 I/O (초당 전송량 계산)
-    disk = get_disk_info()
-    if last_disk_io:
-        read_per_sec = (disk['io']['read_bytes'] - last_disk_io['read_bytes']) / 1024 / 1024
-        write_per_sec = (disk['io']['write_bytes'] - last_disk_io['write_bytes']) / 1024 / 1024
-        history['disk_read'].append({'time': now, 'value': max(0, read_per_sec)})
-        history['disk_write'].append({'time': now, 'value': max(0, write_per_sec)})
-    last_disk_io = disk['io']
-    
-    # 디스크 파티션 정보 (가장 최근 것만)
-    history['disk_partitions'] = disk['partitions']
-    
-    # GPU
-    gpu = get_gpu_summary()
-    if gpu:
-        history['gpu'].append({'time': now, 'value': gpu['usage_percent']})
-        history['gpu_temp'].append({'time': now, 'value': gpu['temperature'] or 0})
-        history['gpu_memory'].append({'time': now, 'value': gpu['memory_percent']})
-    
-    # CPU 온도
-    temp = get_cpu_temperature()
-    if temp['available']:
-        history['cpu_temp'].append({'time': now, 'value': temp['temperature']})
-    
-    # 시스템 정보 캐시
-    if not system_info_cache:
-        system_info_cache = get_system_info()
-    history['system_info'] = system_info_cache
-
-
-def monitoring_thread():
-    """백그라운드 모니터링 스레드"""
-    global monitoring_active
-    
-    while monitoring_active:
-        collect_data()
-        time.sleep(1)
+    # 시스템 정보 (메타데이터 캐시, 바뀌었을 때만 다시 읽음)
+    history['system_info'] = collector.metadata.system_info()
+
+
+sampler = Sampler(collect_data, SAMPLE_INTERVAL)
 
 
 def start_monitoring():
-    """모니터링 시작"""
-    global monitoring_active, monitoring_start_time, history
-    global last_network, last_disk_io, system_info_cache
-    
-    # 이전 데이터 초기화
-    history = defaultdict(list)
-    last_network = None
-    last_disk_io = None
-    system_info_cache = None
-    
-    monitoring_active = True
-    monitoring_start_time = datetime.now()
-    
-    thread = threading.Thread(target=monitoring_thread, daemon=True)
-    thread.start()
+    """공유 수집기 시작 (이미 실행 중이면 그대로 둠)"""
+    if BURST_CAPTURE:
+        burst.start()
+    return sampler.start()
 
 
 def stop_monitoring():
-    """모니터링 중지"""
-    global monitoring_active
-    monitoring_active = False
+    """공유 수집기 중지 (서버 종료 시)"""
+    sampler.stop()
+    burst.stop()
+
+
+def report_data(start=None, end=None):
+    """보고서용 히스토리 구간 (구간 안의 버스트 캡처, 현재 예측 포함)"""
+    data = history.window(start, end)
+    data['captures'] = captures.between(start, end)
+    data['forecasts'] = forecaster.forecast()
+    return data
+
+
+def latest_snapshot():
+    """시리즈별 최근 값 (스트리밍 / 비동기 서버 공용)"""
+    values = {}
+    for name, data in list(history.items()):
+        if is_time_series(data):
+            values[name] = data[-1]['value']
+    
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'active': sampler.running,
+        'values': values
+    }
+
+
+def snapshot_event():
+    """최근 값을 Server-Sent Events 메시지로 직렬화"""
+    return f"data: {json.dumps(latest_snapshot())}\n\n"
 
 
 @app.route('/')
@@ -134,76 +153,213 @@ def index():
 def get_status():
     """모니터링 상태"""
     elapsed = 0
-    if monitoring_start_time:
-        elapsed = (datetime.now() - monitoring_start_time).seconds
+    if sampler.started_at:
+        elapsed = (datetime.now() - sampler.started_at).seconds
     
     return jsonify({
-        'active': monitoring_active,
+        'active': sampler.running,
         'elapsed_seconds': elapsed,
         'target_seconds': MONITORING_DURATION,
-        'data_points': len(history.get('cpu', []))
+        'data_points': len(history.get('cpu', [])),
+        'sessions': [session_status(s) for s in sessions.list()],
+        'burst': {'active': burst.running, 'capturing': burst.capturing}
     })
 
 
 @app.route('/api/start')
 def api_start():
-    """모니터링 시작 API"""
-    start_monitoring()
-    return jsonify({'status': 'started'})
+    """세션 시작 API (?name= 생략 시 자동 이름, 공유 수집기는 한 번만 실행)
+
+    자동 이름은 같은 초에 여러 요청이 와도 겹치지 않도록 임의 접미사를 붙인다.
+    """
+    name = request.args.get('name') or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+    return start_session(name)
 
 
 @app.route('/api/stop')
 def api_stop():
-    """모니터링 중지 API"""
-    stop_monitoring()
-    return jsonify({'status': 'stopped'})
+    """세션 중지 API (?name= 필수, 다른 사용자의 세션은 건드리지 않음)"""
+    name = request.args.get('name')
+    if not name:
+        return jsonify({'error': 'name is required (the session returned by /api/start)'}), 400
+    return stop_session(name)
+
+
+@app.route('/api/sessions')
+def list_sessions():
+    """세션 목록"""
+    return jsonify([session_status(s) for s in sessions.list()])
+
+
+@app.route('/api/sessions/<name>')
+def get_session(name):
+    """세션 상태"""
+    session = sessions.get(name)
+    if not session:
+        return jsonify({'error': f'Unknown session: {name}'}), 404
+    
+    status = session_status(session)
+    cpu = history.get('cpu')
+    status['data_points'] = cpu.count(session['start'], session['end']) if isinstance(cpu, Series) else 0
+    return jsonify(status)
+
+
+@app.route('/api/sessions/<name>', methods=['DELETE'])
+def delete_session(name):
+    """세션 삭제 (북마크만 지우며 공유 히스토리는 그대로)"""
+    session = sessions.remove(name)
+    if not session:
+        return jsonify({'error': f'Unknown session: {name}'}), 404
+    return jsonify({'status': 'deleted', 'session': session_status(session)})
+
+
+@app.route('/api/sessions/<name>/start', methods=['GET', 'POST'])
+def start_session(name):
+    """세션 시작 (수집 비용 없음: 공유 히스토리의 시작 시각만 기록)"""
+    start_monitoring()
+    try:
+        session = sessions.start(name)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 409
+    return jsonify({'status': 'started', 'session': session_status(session)})
+
+
+@app.route('/api/sessions/<name>/stop', methods=['GET', 'POST'])
+def stop_session(name):
+    """세션 중지"""
+    try:
+        session = sessions.stop(name)
+    except KeyError:
+        return jsonify({'error': f'Unknown session: {name}'}), 404
+    return jsonify({'status': 'stopped', 'session': session_status(session)})
+
+
+@app.route('/api/sessions/<name>/report')
+def session_report(name):
+    """세션 구간의 보고서 (?format=pdf|html)"""
+    session = sessions.get(name)
+    if not session:
+        return jsonify({'error': f'Unknown session: {name}'}), 404
+    
+    return send_report(report_data(session['start'], session['end']), prefix=f'session_{name}')
 
 
 @app.route('/api/data')
 def get_data():
-    """실시간 데이터 API"""
+    """실시간 데이터 API (카운터만, 정적 정보는 /api/meta)
+
+    meta_version이 바뀌면 클라이언트가 /api/meta를 다시 받는다.
+    """
+    metadata = collector.metadata
+
     # 최신 데이터 수집
     cpu = get_cpu_info()
     mem = get_memory_info()
-    disk = get_disk_info()
-    net = get_network_info()
     gpu = get_gpu_info()
     temp = get_all_temperatures()
     procs = get_process_info(10)
-    sys_info = get_system_info()
+    partitions = [
+        {key: part[key] for key in ('mountpoint', 'total', 'used', 'free', 'percent')}
+        for part in get_partition_usage(metadata.partitions())
+    ]
     
-    # 네트워크 속도 계산
-    global last_network
-    net_sent_speed = 0
-    net_recv_speed = 0
-    if last_network:
-        net_sent_speed = (net['bytes_sent'] - last_network['bytes_sent']) / 1024 / 1024
-        net_recv_speed = (net['bytes_recv'] - last_network['bytes_recv']) / 1024 / 1024
+    # 네트워크 속도 (수집 스레드가 경과 시간으로 계산한 최근 값)
+    net_sent_speed = history['network_sent'][-1]['value'] if history.get('network_sent') else 0
+    net_recv_speed = history['network_recv'][-1]['value'] if history.get('network_recv') else 0
+    disk_read_speed = history['disk_read'][-1]['value'] if history.get('disk_read') else 0
+    disk_write_speed = history['disk_write'][-1]['value'] if history.get('disk_write') else 0
     
     return jsonify({
         'timestamp': datetime.now().isoformat(),
+        'meta_version': metadata.refresh(),
         'cpu': cpu,
         'memory': mem,
-        'disk': disk,
+        'disk': {
+            'partitions': partitions,
+            'io': get_disk_io(),
+            'speed_read': disk_read_speed,
+            'speed_write': disk_write_speed
+        },
         'network': {
-            **net,
+            **get_network_counters(),
             'speed_sent': max(0, net_sent_speed),
             'speed_recv': max(0, net_recv_speed)
         },
         'gpu': gpu,
         'temperature': temp,
         'processes': procs,
-        'system': sys_info
+        'cgroups': collector.last_cgroups,
+        'system': metadata.live_system()
     })
 
 
+@app.route('/api/meta')
+def get_meta():
+    """호스트 메타데이터 (시스템 정보, 인터페이스, 파티션 목록)
+
+    버전을 ETag로 보내므로 If-None-Match가 같으면 본문 없이 304를 반환한다.
+    """
+    meta = collector.metadata.snapshot()
+    etag = f'"{meta["version"]}"'
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status=304, headers={'ETag': etag})
+    
+    response = jsonify(meta)
+    response.headers['ETag'] = etag
+    return response
+
+
+@app.route('/api/processes/groups')
+def get_process_groups():
+    """프로세스 그룹별 사용량 (?by=name|parent|user|cgroup&limit=)"""
+    by = request.args.get('by', 'name')
+    limit = request.args.get('limit', 20, type=int)
+    if by not in GROUP_BY:
+        return jsonify({'error': f'Unsupported group: {by}'}), 400
+    
+    return jsonify(collector.processes.groups(by, limit))
+
+
 @app.route('/api/history')
 def get_history():
-    """히스토리 데이터 API (차트용)"""
+    """히스토리 데이터 API (차트용)
+
+    기본은 최근 60개 포인트. ?window=<초>&points=<개수>를 주면 해당 기간을
+    points개 구간(평균/최소/최대)으로 다운샘플링하여 반환한다.
+    ?capture=<id>를 주면 해당 버스트 캡처 구간을 원래 해상도로 반환한다.
+    'captures'에는 조회 기간 안의 캡처 요약이 담긴다.
+    """
+    capture_id = request.args.get('capture', type=int)
+    if capture_id is not None:
+        return capture_history(capture_id)
+    
+    window = request.args.get('window', type=float)
+    if window is not None:
+        if not math.isfinite(window) or window < 0:
+            return jsonify({'error': 'window must be a non-negative finite number of seconds'}), 400
+        # 보존 기간보다 긴 구간은 의미가 없고 timedelta 범위도 넘을 수 있음
+        window = min(window, HISTORY_RETENTION)
+    points = min(max(request.args.get('points', 300, type=int), 1), MAX_HISTORY_POINTS)
+    end = datetime.now()
+    
     def serialize(data_list):
+        if window:
+            return [{'time': d['time'].isoformat(), 'value': d['value'], 'min': d['min'], 'max': d['max']}
+                    for d in downsample(data_list, end - timedelta(seconds=window), end, points)]
         return [{'time': d['time'].isoformat(), 'value': d['value']} for d in data_list[-60:]]
     
+    # cgroup / 프로세스 그룹별 시리즈 ('cgroup:<경로>:<지표>', 'process:<그룹>:<지표>')
+    cgroups = {name: serialize(data) for name, data in list(history.items())
+               if name.startswith('cgroup:')}
+    processes = {name: serialize(data) for name, data in list(history.items())
+                 if name.startswith('process:')}
+    
+    start = end - timedelta(seconds=window) if window else None
+    
     return jsonify({
+        'captures': [capture_summary(event) for event in captures.between(start, end)],
+        'cgroups': cgroups,
+        'processes': processes,
         'cpu': serialize(history.get('cpu', [])),
         'memory': serialize(history.get('memory', [])),
         'network_sent': serialize(history.get('network_sent', [])),
@@ -212,32 +368,180 @@ def get_history():
         'disk_write': serialize(history.get('disk_write', [])),
         'gpu': serialize(history.get('gpu', [])),
         'gpu_temp': serialize(history.get('gpu_temp', [])),
+        'gpu_memory': serialize(history.get('gpu_memory', [])),
         'cpu_temp': serialize(history.get('cpu_temp', []))
     })
 
 
+def capture_history(capture_id):
+    """버스트 캡처 구간 (/api/history와 같은 시리즈 형식, 원래 해상도)"""
+    event = captures.get(capture_id)
+    if not event:
+        return jsonify({'error': f'Unknown capture: {capture_id}'}), 404
+    
+    result = {
+        name: [{'time': d['time'].isoformat(), 'value': d['value']} for d in data]
+        for name, data in event['series'].items()
+    }
+    result['capture'] = capture_summary(event)
+    result['process_snapshot'] = event['processes']
+    return jsonify(result)
+
+
+@app.route('/api/forecast')
+def get_forecast():
+    """추세 / 용량 예측 API
+
+    메모리, 파티션 사용률('disk_usage:<마운트>'), 인터페이스별 전송량('nic:<인터페이스>:<방향>')의
+    추세(per_day / per_week), 하루 주기 폭, 한계 도달 시점(limit_at)을 한계가 가까운 순으로 반환한다.
+    롤업 구간이 새로 닫히기 전까지는 캐시된 결과를 쓴다.
+    ?series=<이름>&horizon=<일>을 주면 해당 시리즈의 예측 경로(±2σ)도 'points'에 담는다.
+    """
+    if not FORECAST_AVAILABLE:
+        return jsonify({'error': 'numpy not installed'}), 400
+    
+    results = forecaster.forecast()
+    name = request.args.get('series')
+    if name is None:
+        return jsonify({'forecasts': [forecast_summary(result) for result in results]})
+    
+    result = next((result for result in results if result['series'] == name), None)
+    if result is None:
+        return jsonify({'error': f'No forecast for series: {name}'}), 404
+    
+    horizon = request.args.get('horizon', FORECAST_HORIZON_DAYS, type=float)
+    if not math.isfinite(horizon):
+        return jsonify({'error': 'horizon must be a finite number of days'}), 400
+    horizon = min(max(horizon, 0.1), 90)
+    summary = forecast_summary(result)
+    summary['points'] = [
+        {'time': d['time'].isoformat(), 'value': d['value'], 'min': d['min'], 'max': d['max']}
+        for d in forecast_path(result, horizon)
+    ]
+    return jsonify(summary)
+
+
+@app.route('/api/captures')
+def list_captures():
+    """버스트 캡처 목록 (요약)"""
+    return jsonify([capture_summary(event) for event in captures.between()])
+
+
+@app.route('/api/captures/trigger', methods=['GET', 'POST'])
+def trigger_capture():
+    """수동 트리거 (캡처 중이거나 버스트 캡처가 꺼져 있으면 409)"""
+    reason = request.args.get('reason', 'manual').strip()
+    if not reason or len(reason) > MAX_CAPTURE_REASON or not reason.isprintable():
+        return jsonify({'error': f'reason must be 1-{MAX_CAPTURE_REASON} printable characters'}), 400
+    if not burst.running:
+        return jsonify({'error': 'Burst capture is not running'}), 409
+    if not burst.trigger(reason):
+        return jsonify({'error': 'Capture already in progress'}), 409
+    return jsonify({'status': 'triggered', 'post_seconds': burst.post_seconds})
+
+
+@app.route('/api/stream')
+def stream():
+    """실시간 스트림 (Server-Sent Events)
+
+    스레드 모드에서는 연결마다 스레드 하나를 점유한다.
+    동시 접속이 많으면 app_async.py (이벤트 루프에서 다중화)를 사용한다.
+    """
+    def events():
+        while True:
+            yield snapshot_event()
+            time.sleep(SAMPLE_INTERVAL)
+    
+    return Response(events(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
+
 @app.route('/api/report')
 def generate_report():
-    """PDF 보고서 생성 API"""
-    global history
-    
-    if not history.get('cpu'):
+    """보고서 생성 API (보존 중인 전체 히스토리, ?format=pdf|html)"""
+    return send_report(report_data())
+
+
+def send_report(history_data, prefix='system_report'):
+    """히스토리 구간으로 보고서를 만들어 응답 (HTML은 파일 없이 스트리밍)"""
+    fmt = request.args.get('format', 'pdf')
+    if fmt not in REPORT_FORMATS:
+        return jsonify({'error': f'Unsupported format: {fmt}'}), 400
+
+    if not history_data.get('cpu'):
         return jsonify({'error': 'No data collected. Start monitoring first.'}), 400
+
+    if fmt == 'html':
+        filename = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+        return Response(iter_html_report(history_data), mimetype='text/html',
+                        headers={'Content-Disposition': f'inline; filename="{filename}"'})
     
     # 보고서 저장 경로
     output_dir = os.path.join(os.path.dirname(__file__), 'reports')
     os.makedirs(output_dir, exist_ok=True)
     
-    filename = f"system_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    filename = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
     output_path = os.path.join(output_dir, filename)
     
     try:
-        generate_pdf_report(dict(history), output_path)
+        generate_pdf_report(history_data, output_path)
         return send_file(output_path, as_attachment=True, download_name=filename)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/export')
+def export_history():
+    """히스토리 내보내기 API (CSV / NDJSON / Parquet)"""
+    fmt = request.args.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': f'Unsupported format: {fmt}'}), 400
+
+    series = request.args.get('series')
+    series = [s for s in series.split(',') if s] if series else None
+
+    try:
+        start = parse_time(request.args.get('from'))
+        end = parse_time(request.args.get('to'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    # ?session= 지정 시 세션 구간
+    session_name = request.args.get('session')
+    if session_name:
+        session = sessions.get(session_name)
+        if not session:
+            return jsonify({'error': f'Unknown session: {session_name}'}), 404
+        start, end = session['start'], session['end']
+
+    rows = iter_points(history, series, start, end)
+    filename = f"history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{fmt}"
+
+    if fmt == 'parquet':
+        if not PARQUET_AVAILABLE:
+            return jsonify({'error': 'pyarrow not installed'}), 400
+
+        # 임시 파일에 기록하고 응답을 다 보낸 뒤 삭제
+        fd, output_path = tempfile.mkstemp(suffix='.parquet')
+        os.close(fd)
+        try:
+            write_parquet(rows, output_path)
+            response = send_file(output_path, as_attachment=True, download_name=filename,
+                                 mimetype=CONTENT_TYPES[fmt])
+        except Exception:
+            os.remove(output_path)
+            raise
+        # direct_passthrough 응답은 close 콜백을 부르지 않으므로 끄고 파일을 닫은 뒤 삭제
+        response.direct_passthrough = False
+        response.call_on_close(lambda: os.remove(output_path))
+        return response
+
+    return Response(
+        export_stream(rows, fmt),
+        mimetype=CONTENT_TYPES[fmt],
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
+
 if __name__ == '__main__':
     print("\n" + "="*60)
     print("  시스템 리소스 모니터링 서버")
@@ -0,0 +1,226 @@
+"""
+시스템 리소스 모니터링 서버 (비동기 모드)
+ASGI + asyncio: 기존 Flask 라우트를 재사용하고 스트림 클라이언트는 이벤트 루프에서 다중화
+
+실행:
+    python app_async.py --port 5000
+    uvicorn app_async:application --port 5000
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import app as monitor
+
+
+# 최대 동시 연결 수 (초과 시 503)
+MAX_CONNECTIONS = 1000
+
+# 일반 라우트를 실행하는 스레드 수
+WSGI_WORKERS = 8
+
+# 보고서 / 내보내기처럼 오래 걸리는 라우트 전용 스레드 수 (일반 라우트를 막지 않도록 분리)
+HEAVY_WORKERS = 2
+HEAVY_PATHS = ('/api/report', '/api/export')
+
+# 스트림 클라이언트별 대기 메시지 수 (느린 클라이언트는 오래된 메시지를 버림)
+STREAM_QUEUE_SIZE = 1
+
+light_executor = ThreadPoolExecutor(max_workers=WSGI_WORKERS, thread_name_prefix='wsgi')
+heavy_executor = ThreadPoolExecutor(max_workers=HEAVY_WORKERS, thread_name_prefix='heavy')
+
+# 연결된 스트림 클라이언트의 메시지 큐
+stream_clients = set()
+active_connections = 0
+
+
+def is_heavy(path):
+    """전용 스레드에서 실행할 라우트 (세션 보고서 '/api/sessions/<이름>/report' 포함)"""
+    return path.startswith(HEAVY_PATHS) or (path.startswith('/api/sessions/') and path.endswith('/report'))
+
+
+async def broadcast():
+    """스냅샷을 틱마다 한 번만 직렬화하여 모든 스트림 클라이언트에 전달"""
+    while True:
+        if stream_clients:
+            payload = monitor.snapshot_event().encode()
+            for queue in stream_clients:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(payload)
+        await asyncio.sleep(monitor.SAMPLE_INTERVAL)
+
+
+async def stream(scope, receive, send):
+    """/api/stream: Server-Sent Events (스레드를 점유하지 않음)"""
+    queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+    queue.put_nowait(monitor.snapshot_event().encode())
+    stream_clients.add(queue)
+
+    await send({
+        'type': 'http.response.start',
+        'status': 200,
+        'headers': [
+            (b'content-type', b'text/event-stream'),
+            (b'cache-control', b'no-cache'),
+            (b'access-control-allow-origin', b'*')
+        ]
+    })
+
+    disconnected = asyncio.ensure_future(wait_disconnect(receive))
+    try:
+        while True:
+            message = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({message, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected in done:
+                message.cancel()
+                break
+            await send({'type': 'http.response.body', 'body': message.result(), 'more_body': True})
+    finally:
+        stream_clients.discard(queue)
+        disconnected.cancel()
+
+
+async def wait_disconnect(receive):
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return
+
+
+def build_environ(scope, body):
+    """ASGI scope → WSGI environ (PEP 3333)"""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', ''),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope['query_string'].decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False
+    }
+
+    for name, value in scope['headers']:
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name == 'CONTENT_TYPE':
+            environ['CONTENT_TYPE'] = value
+        elif name == 'CONTENT_LENGTH':
+            environ['CONTENT_LENGTH'] = value
+        else:
+            key = f'HTTP_{name}'
+            environ[key] = f'{environ[key]},{value}' if key in environ else value
+
+    return environ
+
+
+async def run_wsgi(scope, receive, send):
+    """기존 Flask 라우트를 스레드 풀에서 실행하고 응답을 청크 단위로 전달"""
+    body = b''
+    while True:
+        message = await receive()
+        body += message.get('body', b'')
+        if not message.get('more_body'):
+            break
+
+    executor = heavy_executor if is_heavy(scope['path']) else light_executor
+    loop = asyncio.get_running_loop()
+    response = {}
+
+    def start_response(status, headers, exc_info=None):
+        response['status'] = int(status.split(' ', 1)[0])
+        response['headers'] = [(k.lower().encode('latin-1'), v.encode('latin-1')) for k, v in headers]
+
+    result = await loop.run_in_executor(executor, monitor.app, build_environ(scope, body), start_response)
+    chunks = iter(result)
+    try:
+        await send({'type': 'http.response.start', 'status': response['status'], 'headers': response['headers']})
+        while True:
+            chunk = await loop.run_in_executor(executor, next, chunks, None)
+            if chunk is None:
+                break
+            if chunk:
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+    finally:
+        if hasattr(result, 'close'):
+            await loop.run_in_executor(executor, result.close)
+
+
+async def lifespan(receive, send):
+    """서버 시작 시 수집 / 브로드캐스트 시작, 종료 시 정리"""
+    task = None
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            monitor.start_monitoring()
+            task = asyncio.ensure_future(broadcast())
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            if task:
+                task.cancel()
+            monitor.stop_monitoring()
+            light_executor.shutdown(wait=False)
+            heavy_executor.shutdown(wait=False)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def application(scope, receive, send):
+    """ASGI 진입점"""
+    global active_connections
+
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    if active_connections >= MAX_CONNECTIONS:
+        await send({'type': 'http.response.start', 'status': 503,
+                    'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': json.dumps({'error': 'Too many connections'}).encode()})
+        return
+
+    active_connections += 1
+    try:
+        if scope['path'] == '/api/stream':
+            await stream(scope, receive, send)
+        else:
+            await run_wsgi(scope, receive, send)
+    finally:
+        active_connections -= 1
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description='시스템 리소스 모니터링 서버 (비동기 모드)')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5000)
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("  시스템 리소스 모니터링 서버 (비동기 모드)")
+    print(f"  http://localhost:{args.port} 에서 대시보드 확인")
+    print("="*60 + "\n")
+
+    uvicorn.run(application, host=args.host, port=args.port, log_level='warning')
+
+
+if __name__ == '__main__':
+    main()
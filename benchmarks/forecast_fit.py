@@ -0,0 +1,64 @@
+"""
+추세 / 용량 예측 벤치마크
+가상의 롤업(추세 + 하루 주기 + 잡음)으로 시리즈 수에 따른 일괄 맞추기 시간 측정
+
+실행:
+    python benchmarks/forecast_fit.py --series 10 100 500 --days 28
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import time
+
+import numpy as np
+
+from storage.forecast import DAY, FORECAST_BUCKET, Rollups, fit, forecast_rollups
+
+
+def synthetic_rollups(count, days, bucket_seconds=FORECAST_BUCKET, seed=0):
+    """시리즈 count개, days일 분량의 롤업 (10%는 관측 누락)"""
+    rng = np.random.default_rng(seed)
+    rollups = Rollups(bucket_seconds, retention_days=days)
+    width = int(days * DAY / bucket_seconds)
+    rollups.closed = 2_000_000
+    buckets = np.arange(rollups.closed - width, rollups.closed)
+    phase = 2 * np.pi * (buckets * bucket_seconds % DAY) / DAY
+    elapsed = (buckets - buckets[0]) * bucket_seconds / DAY
+
+    for index in range(count):
+        keep = rng.random(width) > 0.1
+        values = (rng.uniform(10, 80) + rng.uniform(-0.5, 1.5) * elapsed
+                  + rng.uniform(0, 10) * np.sin(phase) + rng.normal(0, 1, width))
+        rollups.series[f'disk_usage:/mnt/{index}'] = (buckets[keep], values[keep], np.ones(keep.sum()))
+    return rollups
+
+
+def timed(task, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        task()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='추세 / 용량 예측 벤치마크')
+    parser.add_argument('--series', type=int, nargs='+', default=[10, 100, 500])
+    parser.add_argument('--days', type=float, default=28, help='롤업 기간 (일)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'시리즈':>8} {'구간':>8} {'행렬 ms':>10} {'맞추기 ms':>10} {'전체 ms':>10}")
+    for count in args.series:
+        rollups = synthetic_rollups(count, args.days)
+        names = sorted(rollups.series)
+        matrix = rollups.matrix(names)
+        build = timed(lambda: rollups.matrix(names), args.repeat)
+        solve = timed(lambda: fit(*matrix, rollups.bucket_ms), args.repeat)
+        total = timed(lambda: forecast_rollups(rollups), args.repeat)
+        print(f"{count:>8} {matrix[1].shape[1]:>8} {build:10.1f} {solve:10.1f} {total:10.1f}")
+
+
+if __name__ == '__main__':
+    main()
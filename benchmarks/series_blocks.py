@@ -0,0 +1,108 @@
+"""
+압축 시계열 블록 벤치마크
+기록된 수집 파일(monitor.py collect --out)로 메모리 / 디스크 압축률과 디코딩 처리량 측정
+
+실행:
+    python monitor.py collect --duration 1h --interval 0.5 --out run.db
+    python benchmarks/series_blocks.py run.db --block-size 256 1024 4096
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+
+from storage.series import Series, is_time_series
+from storage.sqlite_store import SampleWriter, load_history
+
+
+def fill(history, block_size):
+    """포인트를 새 dict로 복사해 Series에 추가하고 (시리즈, 할당 바이트) 반환"""
+    tracemalloc.start()
+    series = {}
+    for name, points in history.items():
+        data = series[name] = Series(block_size)
+        for point in points:
+            data.append(dict(point))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return series, size
+
+
+def samples(history):
+    """시리즈별 포인트 → 파이프라인 샘플 형식 (시간순)"""
+    by_time = defaultdict(lambda: {'values': {}, 'intervals': {}, 'partitions': None})
+    for name, points in history.items():
+        for point in points:
+            sample = by_time[point['time']]
+            sample['values'][name] = point['value']
+            if 'interval' in point:
+                sample['intervals'][name] = point['interval']
+    return [{'time': t, **by_time[t]} for t in sorted(by_time)]
+
+
+def disk_size(rows, block_size):
+    """SampleWriter로 기록한 파일 크기 (VACUUM 후)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        with SampleWriter(path, commit_every=1000, block_size=block_size) as writer:
+            for sample in rows:
+                writer.write(sample)
+            writer.conn.commit()
+            writer.conn.execute('VACUUM')
+        return os.path.getsize(path)
+
+
+def measure(series, repeat):
+    """(배열 디코딩 포인트/초, dict 포인트/초)"""
+    total = sum(len(data) for data in series.values())
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for data in series.values():
+            data.arrays()
+    arrays_rate = total * repeat / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for data in series.values():
+            data.points()
+    points_rate = total * repeat / (time.perf_counter() - start)
+
+    return arrays_rate, points_rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description='압축 시계열 블록 벤치마크')
+    parser.add_argument('db', help='monitor.py collect로 기록한 파일')
+    parser.add_argument('--block-size', type=int, nargs='+', default=[256, 1024, 4096])
+    parser.add_argument('--repeat', type=int, default=5, help='디코딩 반복 횟수')
+    args = parser.parse_args()
+
+    history = {name: data for name, data in load_history(args.db).items() if is_time_series(data)}
+    total = sum(len(points) for points in history.values())
+    print(f"{args.db}: 시리즈 {len(history)}개, 포인트 {total}개")
+
+    rows = samples(history)
+    _, raw_memory = fill(history, block_size=total + 1)
+    raw_disk = disk_size(rows, block_size=total + 1)
+    print(f"{'블록 크기':>10} {'메모리 B/pt':>12} {'배율':>6} {'블록 B/pt':>10} "
+          f"{'디스크 B/pt':>12} {'배율':>6} {'배열 pt/s':>12} {'dict pt/s':>12}")
+    print(f"{'(봉인 없음)':>10} {raw_memory / total:12.1f} {1:6.1f} {'-':>10} "
+          f"{raw_disk / total:12.1f} {1:6.1f} {'-':>12} {'-':>12}")
+
+    for block_size in args.block_size:
+        series, memory = fill(history, block_size)
+        blocks = sum(data.nbytes() for data in series.values())
+        disk = disk_size(rows, block_size)
+        arrays_rate, points_rate = measure(series, args.repeat)
+        print(f"{block_size:>10} {memory / total:12.1f} {raw_memory / memory:6.1f} {blocks / total:10.2f} "
+              f"{disk / total:12.1f} {raw_disk / disk:6.1f} {arrays_rate:12,.0f} {points_rate:12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
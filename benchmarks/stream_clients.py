@@ -0,0 +1,108 @@
+"""
+비동기 서버 부하 테스트
+/api/stream에 N개 클라이언트를 연결했을 때 서버 프로세스의 CPU / 메모리 / 스레드 수 측정
+
+실행:
+    python benchmarks/stream_clients.py --clients 5 500 --seconds 20
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import asyncio
+import subprocess
+import time
+
+import psutil
+
+
+async def client(host, port, stop, counter):
+    """SSE 연결 하나를 유지하며 받은 이벤트 수 세기"""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f'GET /api/stream HTTP/1.1\r\nHost: {host}\r\nAccept: text/event-stream\r\n\r\n'.encode())
+    await writer.drain()
+    try:
+        while not stop.is_set():
+            line = await asyncio.wait_for(reader.readline(), timeout=5)
+            if not line:
+                break
+            if line.startswith(b'data:'):
+                counter[0] += 1
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        writer.close()
+
+
+async def measure(host, port, server, clients, seconds):
+    stop = asyncio.Event()
+    counter = [0]
+    tasks = [asyncio.ensure_future(client(host, port, stop, counter)) for _ in range(clients)]
+
+    # 연결이 자리 잡을 때까지 대기
+    await asyncio.sleep(2)
+    cpu_start = server.cpu_times()
+    events_start = counter[0]
+    start = time.monotonic()
+
+    await asyncio.sleep(seconds)
+
+    elapsed = time.monotonic() - start
+    cpu_end = server.cpu_times()
+    cpu = (cpu_end.user + cpu_end.system - cpu_start.user - cpu_start.system) / elapsed * 100
+    events = counter[0] - events_start
+
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    return {
+        'clients': clients,
+        'cpu_percent': cpu,
+        'rss_mb': server.memory_info().rss / 1024 / 1024,
+        'threads': server.num_threads(),
+        'events_per_sec': events / elapsed
+    }
+
+
+def wait_ready(host, port, timeout=30):
+    from urllib.request import urlopen
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urlopen(f'http://{host}:{port}/api/status', timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.5)
+    raise RuntimeError('server did not start')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='비동기 서버 스트림 부하 테스트')
+    parser.add_argument('--clients', type=int, nargs='+', default=[5, 500])
+    parser.add_argument('--seconds', type=float, default=20)
+    parser.add_argument('--port', type=int, default=5055)
+    args = parser.parse_args()
+
+    host = '127.0.0.1'
+    root = os.path.join(os.path.dirname(__file__), '..')
+    proc = subprocess.Popen(
+        [sys.executable, 'app_async.py', '--host', host, '--port', str(args.port)],
+        cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_ready(host, args.port)
+        server = psutil.Process(proc.pid)
+
+        print(f"{'클라이언트':>10} {'CPU %':>8} {'RSS MB':>8} {'스레드':>6} {'이벤트/초':>10}")
+        for clients in args.clients:
+            result = asyncio.run(measure(host, args.port, server, clients, args.seconds))
+            print(f"{result['clients']:>10} {result['cpu_percent']:>8.1f} {result['rss_mb']:>8.1f} "
+                  f"{result['threads']:>6} {result['events_per_sec']:>10.1f}")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+"""
+버스트 캡처
+고주파로 몇 가지 카운터(CPU 시간, 디스크 / 네트워크 누적 바이트)만 읽어 링 버퍼에 유지하다가
+규칙이나 급등이 감지되면 트리거 전후 구간을 원래 해상도로 저장
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+import psutil
+
+from collectors.pipeline import Sampler
+
+
+MB = 1024 * 1024
+
+# 버스트 캡처 시리즈 (히스토리와 같은 이름, iowait만 추가)
+BURST_SERIES = ('cpu', 'iowait', 'disk_read', 'disk_write', 'network_sent', 'network_recv')
+
+# 고정 임계값 규칙 (%)
+BURST_THRESHOLDS = {'cpu': 90.0, 'iowait': 30.0}
+
+# 급등 규칙: 링 버퍼 평균 + SPIKE_SIGMA × 표준편차를 넘고, 평균과의 차이가 최소 변화량 이상
+SPIKE_SIGMA = 6.0
+SPIKE_MIN_DELTA = {
+    'cpu': 40.0,
+    'iowait': 20.0,
+    'disk_read': 50.0,
+    'disk_write': 50.0,
+    'network_sent': 50.0,
+    'network_recv': 50.0
+}
+
+# 급등 판단에 필요한 최소 샘플 수
+SPIKE_MIN_SAMPLES = 20
+
+# 캡처가 끝난 뒤 다음 트리거까지 대기 (초, 같은 현상으로 연속 캡처 방지)
+BURST_COOLDOWN = 60
+
+# 프로세스 스냅샷 상위 개수 / CPU 사용률 측정 구간 (초)
+PROCESS_SNAPSHOT_LIMIT = 15
+PROCESS_SNAPSHOT_WINDOW = 0.5
+
+
+class CounterMeter:
+    """누적 카운터를 읽어 직전 값과의 차이로 사용률 / 초당 전송량 계산"""
+
+    def __init__(self):
+        self.last = None
+
+    @staticmethod
+    def read():
+        cpu = psutil.cpu_times()
+        disk = psutil.disk_io_counters()
+        net = psutil.net_io_counters()
+        iowait = getattr(cpu, 'iowait', 0.0)
+        return (
+            time.monotonic(),
+            sum(cpu) - cpu.idle - iowait,
+            sum(cpu),
+            iowait,
+            disk.read_bytes if disk else 0,
+            disk.write_bytes if disk else 0,
+            net.bytes_sent,
+            net.bytes_recv
+        )
+
+    def sample(self):
+        """BURST_SERIES 순서의 값 튜플 (첫 호출은 None)"""
+        current = self.read()
+        last, self.last = self.last, current
+        if last is None:
+            return None
+
+        elapsed = max(current[0] - last[0], 1e-3)
+        total = max(current[2] - last[2], 1e-9)
+        return (
+            max(0.0, (current[1] - last[1]) / total * 100),
+            max(0.0, (current[3] - last[3]) / total * 100),
+            max(0, current[4] - last[4]) / MB / elapsed,
+            max(0, current[5] - last[5]) / MB / elapsed,
+            max(0, current[6] - last[6]) / MB / elapsed,
+            max(0, current[7] - last[7]) / MB / elapsed
+        )
+
+
+class SpikeBuffer:
+    """(시간, 값 튜플) 링 버퍼 + 시리즈별 누적 합 / 제곱합 (평균 / 표준편차를 매 틱 O(1)로)"""
+
+    def __init__(self, capacity):
+        self.points = deque(maxlen=capacity)
+        self.sums = [0.0] * len(BURST_SERIES)
+        self.squares = [0.0] * len(BURST_SERIES)
+        self.appended = 0
+
+    def append(self, t, values):
+        if len(self.points) == self.points.maxlen:
+            _, old = self.points[0]
+            for i, value in enumerate(old):
+                self.sums[i] -= value
+                self.squares[i] -= value * value
+        self.points.append((t, values))
+        for i, value in enumerate(values):
+            self.sums[i] += value
+            self.squares[i] += value * value
+
+        # 부동소수점 오차가 쌓이지 않도록 버퍼 한 바퀴마다 다시 계산
+        self.appended += 1
+        if self.appended >= self.points.maxlen:
+            self.appended = 0
+            self.sums = [sum(v[i] for _, v in self.points) for i in range(len(BURST_SERIES))]
+            self.squares = [sum(v[i] * v[i] for _, v in self.points) for i in range(len(BURST_SERIES))]
+
+    def stats(self, index):
+        """(평균, 표준편차)"""
+        count = len(self.points)
+        mean = self.sums[index] / count
+        variance = max(self.squares[index] / count - mean * mean, 0.0)
+        return mean, math.sqrt(variance)
+
+    def __len__(self):
+        return len(self.points)
+
+
+def process_snapshot(limit=PROCESS_SNAPSHOT_LIMIT, window=PROCESS_SNAPSHOT_WINDOW):
+    """트리거 시점의 프로세스 표 (CPU / 메모리 상위)
+
+    cpu_percent는 직전 호출과의 차이로 계산되므로, 한 번 읽고 window초 뒤 다시 읽는다.
+    """
+    for proc in psutil.process_iter():
+        try:
+            proc.cpu_percent(None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    time.sleep(window)
+
+    processes = []
+    for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'status']):
+        try:
+            info = proc.info
+            processes.append({
+                'pid': info['pid'],
+                'name': info['name'],
+                'user': info['username'],
+                'cpu_percent': info['cpu_percent'] or 0,
+                'memory_percent': info['memory_percent'] or 0,
+                'status': info['status']
+            })
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    processes.sort(key=lambda p: (p['cpu_percent'], p['memory_percent']), reverse=True)
+    return processes[:limit]
+
+
+class BurstCapture:
+    """항상 켜진 고주파 링 버퍼 + 트리거 시 전후 구간 캡처
+
+    매 틱에는 카운터 세 종류(/proc/stat, diskstats, net/dev)만 읽고 링 버퍼에 넣는다.
+    임계값 / 급등 규칙이나 수동 트리거가 발생하면 링 버퍼(트리거 전 pre_seconds)에
+    트리거 후 post_seconds를 이어 붙여 하나의 캡처 이벤트로 저장한다.
+    프로세스 스냅샷은 고주파 틱을 막지 않도록 별도 스레드에서 한 번 읽는다.
+    """
+
+    def __init__(self, store, interval=0.1, pre_seconds=10, post_seconds=10,
+                 thresholds=None, cooldown=BURST_COOLDOWN, on_capture=None):
+        self.store = store
+        self.interval = interval
+        self.pre_seconds = pre_seconds
+        self.post_seconds = post_seconds
+        self.thresholds = BURST_THRESHOLDS if thresholds is None else thresholds
+        self.cooldown = cooldown
+        self.on_capture = on_capture
+
+        self.meter = CounterMeter()
+        self.buffer = SpikeBuffer(max(int(pre_seconds / interval), 1))
+        self.active = None
+        self.pending = None
+        self.cooldown_until = 0.0
+        self.sampler = Sampler(self.tick, interval)
+
+    def start(self):
+        return self.sampler.start()
+
+    def stop(self, flush=False):
+        """중지 (flush=True면 틱 스레드가 끝나길 기다렸다가 진행 중인 캡처를 지금까지의 포인트로 마무리)"""
+        self.sampler.stop()
+        if not flush:
+            return
+        if self.sampler.thread is not None:
+            self.sampler.thread.join()
+        if self.active is not None:
+            self._finish()
+
+    @property
+    def running(self):
+        return self.sampler.running
+
+    @property
+    def capturing(self):
+        return self.active is not None
+
+    def trigger(self, reason='manual'):
+        """수동 트리거 (캡처 중이면 False)"""
+        if self.active is not None or self.pending is not None:
+            return False
+        self.pending = {'reason': reason, 'series': None, 'value': None}
+        return True
+
+    def check(self, values):
+        """규칙 확인 → 트리거 정보 (없으면 None)"""
+        for index, name in enumerate(BURST_SERIES):
+            value = values[index]
+            threshold = self.thresholds.get(name)
+            if threshold is not None and value >= threshold:
+                return {'reason': 'threshold', 'series': name, 'value': value}
+
+        if len(self.buffer) >= SPIKE_MIN_SAMPLES:
+            for index, name in enumerate(BURST_SERIES):
+                mean, std = self.buffer.stats(index)
+                value = values[index]
+                if value - mean >= SPIKE_MIN_DELTA[name] and value > mean + SPIKE_SIGMA * std:
+                    return {'reason': 'spike', 'series': name, 'value': value}
+        return None
+
+    def tick(self):
+        values = self.meter.sample()
+        if values is None:
+            return
+        now = datetime.now()
+
+        if self.active is not None:
+            self.active['points'].append((now, values))
+            if now >= self.active['end']:
+                self._finish()
+        else:
+            trigger, self.pending = self.pending, None
+            if trigger is None and time.monotonic() >= self.cooldown_until:
+                trigger = self.check(values)
+            if trigger is not None:
+                self._begin(now, values, trigger)
+
+        self.buffer.append(now, values)
+
+    def _begin(self, now, values, trigger):
+        capture = {
+            'time': now,
+            'trigger': trigger,
+            'points': list(self.buffer.points) + [(now, values)],
+            'end': now + timedelta(seconds=self.post_seconds),
+            'processes': []
+        }
+        self.active = capture
+
+        def snapshot():
+            capture['processes'] = process_snapshot()
+
+        capture['snapshot'] = threading.Thread(target=snapshot, daemon=True)
+        capture['snapshot'].start()
+
+    def _finish(self):
+        capture, self.active = self.active, None
+        self.cooldown_until = time.monotonic() + self.cooldown
+        capture['snapshot'].join(timeout=5)
+
+        points = capture['points']
+        event = self.store.add({
+            'time': capture['time'],
+            'trigger': capture['trigger'],
+            'start': points[0][0],
+            'end': points[-1][0],
+            'interval': self.interval,
+            'series': {
+                name: [{'time': t, 'value': values[index]} for t, values in points]
+                for index, name in enumerate(BURST_SERIES)
+            },
+            'processes': capture['processes']
+        })
+        if self.on_capture:
+            self.on_capture(event)
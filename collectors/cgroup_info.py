@@ -0,0 +1,308 @@
+"""
+cgroup v2 정보 수집기
+컨테이너 / Kubernetes 환경에서 모니터 자신의 cgroup(및 하위 cgroup) 사용량 모니터링
+"""
+
+import os
+import time
+
+
+# cgroup v2 마운트 위치 후보 (hybrid 구성은 unified 아래)
+CGROUP_ROOTS = ('/sys/fs/cgroup', '/sys/fs/cgroup/unified')
+
+CGROUP_FILES = (
+    'cpu.stat', 'cpu.max',
+    'memory.current', 'memory.max',
+    'io.stat',
+    'cpu.pressure', 'memory.pressure', 'io.pressure'
+)
+
+# 하위 cgroup 목록 재탐색 주기 (초)
+RESCAN_INTERVAL = 10
+
+MB = 1024 * 1024
+
+
+def find_cgroup_root():
+    """cgroup v2 마운트 경로 (없으면 None)"""
+    for root in CGROUP_ROOTS:
+        if os.path.exists(os.path.join(root, 'cgroup.controllers')):
+            return root
+    return None
+
+
+def get_own_cgroup():
+    """/proc/self/cgroup에서 v2 경로('0::' 항목) 읽기"""
+    try:
+        with open('/proc/self/cgroup') as f:
+            for line in f:
+                if line.startswith('0::'):
+                    return line[3:].strip() or '/'
+    except OSError:
+        pass
+    return None
+
+
+def parse_keyed(text):
+    """'key value' 줄 형식 파싱 (cpu.stat 등)"""
+    result = {}
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            result[parts[0]] = int(parts[1])
+    return result
+
+
+def parse_limit(text):
+    """memory.max 형식 ('max'는 제한 없음)"""
+    text = text.strip()
+    return None if text == 'max' else int(text)
+
+
+def parse_cpu_max(text):
+    """cpu.max ('quota period') → 허용 코어 수 (제한 없으면 None)"""
+    quota, _, period = text.strip().partition(' ')
+    if quota == 'max' or not period:
+        return None
+    return int(quota) / int(period)
+
+
+def parse_io_stat(text):
+    """io.stat의 장치별 값을 합산"""
+    totals = {'rbytes': 0, 'wbytes': 0, 'rios': 0, 'wios': 0}
+    for line in text.splitlines():
+        for field in line.split()[1:]:
+            key, _, value = field.partition('=')
+            if key in totals:
+                totals[key] += int(value)
+    return totals
+
+
+def parse_pressure(text):
+    """PSI 파일 파싱 → {'some': {...}, 'full': {...}}"""
+    result = {}
+    for line in text.splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+        result[parts[0]] = {
+            key: float(value)
+            for key, _, value in (p.partition('=') for p in parts[1:])
+        }
+    return result
+
+
+def dir_inode(path):
+    """디렉터리 inode (없으면 None) - 같은 이름으로 다시 만든 cgroup 구분용"""
+    try:
+        return os.stat(path).st_ino
+    except OSError:
+        return None
+
+
+class CgroupFiles:
+    """한 cgroup의 통계 파일 디스크립터 (열어 둔 채로 pread로 재사용)
+
+    cgroup이 삭제되면 열어 둔 디스크립터는 읽기에 실패하고, 같은 이름으로 다시 만들어져도
+    예전 cgroup을 가리키므로 failed / inode로 다시 열어야 하는지 판단한다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.inode = dir_inode(path)
+        self.failed = False
+        self.fds = {}
+        for name in CGROUP_FILES:
+            try:
+                self.fds[name] = os.open(os.path.join(path, name), os.O_RDONLY)
+            except OSError:
+                continue
+
+    def read(self, name):
+        fd = self.fds.get(name)
+        if fd is None:
+            return None
+        try:
+            return os.pread(fd, 65536, 0).decode()
+        except OSError:
+            self.failed = True
+            return None
+
+    def stale(self):
+        """읽기에 실패했거나 디렉터리가 다시 만들어졌으면 True"""
+        return self.failed or dir_inode(self.path) != self.inode
+
+    def close(self):
+        for fd in self.fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self.fds = {}
+
+
+class CgroupCollector:
+    """모니터 자신의 cgroup과 (선택) 하위 cgroup의 사용량을 델타로 계산"""
+
+    def __init__(self, include_children=False):
+        self.root = find_cgroup_root()
+        own = get_own_cgroup() if self.root else None
+        self.base = own
+        self.include_children = include_children
+        self.groups = {}
+        self.last = {}
+        self.last_scan = 0
+
+    @property
+    def available(self):
+        return self.root is not None and self.base is not None
+
+    def _path(self, name):
+        return os.path.join(self.root, name.lstrip('/'))
+
+    def _refresh_groups(self):
+        """감시 대상 cgroup 목록 갱신 (사라진 cgroup은 닫고, 다시 만들어진 cgroup은 다시 엶)"""
+        names = [self.base]
+        if self.include_children:
+            try:
+                with os.scandir(self._path(self.base)) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            names.append(os.path.join(self.base, entry.name))
+            except OSError:
+                pass
+
+        for name in list(self.groups):
+            if name not in names:
+                self.groups.pop(name).close()
+                self.last.pop(name, None)
+
+        for name in names:
+            files = self.groups.get(name)
+            if files is not None and files.stale():
+                # 같은 이름으로 다시 만든 cgroup: 새로 열고 카운터 델타도 처음부터
+                files.close()
+                self.last.pop(name, None)
+                files = None
+            if files is None:
+                self.groups[name] = CgroupFiles(self._path(name))
+
+        self.last_scan = time.monotonic()
+
+    def _read_counters(self, files):
+        """누적 카운터와 현재 값 읽기"""
+        counters = {}
+
+        text = files.read('cpu.stat')
+        if text:
+            stat = parse_keyed(text)
+            counters['cpu_usec'] = stat.get('usage_usec')
+            counters['nr_periods'] = stat.get('nr_periods')
+            counters['nr_throttled'] = stat.get('nr_throttled')
+            counters['throttled_usec'] = stat.get('throttled_usec')
+
+        text = files.read('io.stat')
+        if text is not None:
+            io = parse_io_stat(text)
+            counters['io_rbytes'] = io['rbytes']
+            counters['io_wbytes'] = io['wbytes']
+
+        for resource in ('cpu', 'memory', 'io'):
+            text = files.read(f'{resource}.pressure')
+            if text:
+                psi = parse_pressure(text)
+                counters[f'{resource}_pressure_usec'] = psi.get('some', {}).get('total')
+
+        return counters
+
+    def _delta(self, current, last, key, elapsed_usec):
+        """누적 카운터의 초당(μs 기준) 증가량"""
+        if current.get(key) is None or last.get(key) is None:
+            return None
+        return max(0, current[key] - last[key]) / elapsed_usec
+
+    def sample(self):
+        """cgroup별 사용량 → {cgroup 경로: {지표: 값}}"""
+        if not self.available:
+            return {}
+
+        stale = any(files.failed for files in self.groups.values())
+        if stale or not self.groups or time.monotonic() - self.last_scan >= RESCAN_INTERVAL:
+            self._refresh_groups()
+
+        result = {}
+        for name, files in self.groups.items():
+            now = time.monotonic()
+            counters = self._read_counters(files)
+            info = {}
+
+            # 메모리
+            current = files.read('memory.current')
+            limit = files.read('memory.max')
+            if current:
+                info['memory_current'] = int(current)
+                info['memory_max'] = parse_limit(limit) if limit else None
+                if info['memory_max']:
+                    info['memory_percent'] = info['memory_current'] / info['memory_max'] * 100
+
+            # CPU 제한 (코어 수)
+            cpu_max = files.read('cpu.max')
+            info['cpu_limit'] = parse_cpu_max(cpu_max) if cpu_max else None
+
+            last = self.last.get(name)
+            if last:
+                elapsed_usec = max(now - last['time'], 1e-3) * 1e6
+
+                cpu = self._delta(counters, last, 'cpu_usec', elapsed_usec)
+                if cpu is not None:
+                    # 코어 1개 기준 사용률 (%)
+                    info['cpu_percent'] = cpu * 100
+                    if info['cpu_limit']:
+                        info['cpu_limit_percent'] = cpu * 100 / info['cpu_limit']
+
+                if counters.get('nr_periods') is not None and last.get('nr_periods') is not None:
+                    periods = counters['nr_periods'] - last['nr_periods']
+                    throttled = counters['nr_throttled'] - last['nr_throttled']
+                    info['throttled_percent'] = throttled / periods * 100 if periods > 0 else 0
+
+                for key, metric in (('io_rbytes', 'io_read'), ('io_wbytes', 'io_write')):
+                    rate = self._delta(counters, last, key, elapsed_usec)
+                    if rate is not None:
+                        # MB/s
+                        info[metric] = rate * 1e6 / MB
+
+                for resource in ('cpu', 'memory', 'io'):
+                    # 구간 동안 일부 태스크가 자원 대기로 멈춘 시간 비율 (%)
+                    stall = self._delta(counters, last, f'{resource}_pressure_usec', elapsed_usec)
+                    if stall is not None:
+                        info[f'{resource}_pressure'] = stall * 100
+
+            counters['time'] = now
+            self.last[name] = counters
+            result[name] = info
+
+        return result
+
+    def close(self):
+        for files in self.groups.values():
+            files.close()
+        self.groups = {}
+        self.last = {}
+
+
+# 히스토리에 시계열로 저장하는 cgroup 지표
+CGROUP_SERIES = (
+    'cpu_percent', 'throttled_percent', 'memory_percent',
+    'io_read', 'io_write',
+    'cpu_pressure', 'memory_pressure', 'io_pressure'
+)
+
+
+def cgroup_series_values(cgroups):
+    """cgroup 사용량을 히스토리 시리즈 값으로 변환 ('cgroup:<경로>:<지표>')"""
+    values = {}
+    for name, info in cgroups.items():
+        for metric in CGROUP_SERIES:
+            if info.get(metric) is not None:
+                values[f'cgroup:{name}:{metric}'] = info[metric]
+    return values
@@ -0,0 +1,123 @@
+"""
+호스트 메타데이터 캐시
+시스템 정보, 네트워크 인터페이스, 디스크 파티션처럼 거의 바뀌지 않는 정보를
+변경 감지 / TTL로 무효화하고 버전을 붙여 제공 (매 틱 응답에는 카운터만 싣기 위함)
+"""
+
+import socket
+import threading
+import time
+
+import psutil
+
+from collectors.system_info import get_static_system_info, get_interface_info, list_partitions
+
+
+# 마운트 테이블 (읽기가 싸므로 내용 비교로 변경 감지, Linux 외에는 TTL만 사용)
+MOUNTS_PATH = '/proc/self/mounts'
+
+# 변경 감지가 놓치는 경우(인터페이스 주소 변경 등)를 위한 TTL (초)
+PARTITION_TTL = 300
+INTERFACE_TTL = 60
+SYSTEM_TTL = 3600
+
+# 프로세스 수 갱신 주기 (초, 전체 /proc 목록을 읽으므로 매 요청마다 세지 않음)
+PROCESS_COUNT_TTL = 5
+
+
+def mounts_token():
+    """마운트 테이블 내용 (읽을 수 없으면 None)"""
+    try:
+        with open(MOUNTS_PATH, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def interfaces_token():
+    """인터페이스 (인덱스, 이름) 목록 (지원하지 않으면 None)"""
+    try:
+        return tuple(socket.if_nameindex())
+    except (AttributeError, OSError):
+        return None
+
+
+class MetadataCache:
+    """이름 → 캐시 항목 {'value', 'version', 'token', 'checked'}
+
+    항목마다 싼 변경 감지 토큰(마운트 테이블, 인터페이스 목록)이 바뀌었거나 TTL이 지났을 때만
+    다시 읽는다. 다시 읽은 값이 이전과 다를 때만 전체 버전을 올리므로 클라이언트는
+    버전이 바뀐 경우에만 메타데이터를 다시 받으면 된다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.version = 0
+        self.boot_time = psutil.boot_time()
+        self.process_count_cache = (0, None)
+
+    def _get(self, name, token, ttl, load):
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry and entry['token'] == token and now - entry['checked'] < ttl:
+                return entry['value']
+
+        value = load()
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is None or entry['value'] != value:
+                self.version += 1
+                entry = self.entries[name] = {'value': value, 'version': self.version}
+            entry['token'] = token
+            entry['checked'] = now
+            return entry['value']
+
+    def system(self):
+        """정적 시스템 정보 (호스트명, OS, 부팅 시간 등)"""
+        return self._get('system', None, SYSTEM_TTL, get_static_system_info)
+
+    def interfaces(self):
+        """인터페이스별 상태 / 주소 (인터페이스 목록이 바뀌거나 TTL이 지나면 갱신)"""
+        return self._get('interfaces', interfaces_token(), INTERFACE_TTL, get_interface_info)
+
+    def partitions(self):
+        """파티션 목록 (마운트 테이블이 바뀌거나 TTL이 지나면 갱신)"""
+        return self._get('partitions', mounts_token(), PARTITION_TTL, list_partitions)
+
+    def process_count(self):
+        checked, count = self.process_count_cache
+        now = time.monotonic()
+        if count is None or now - checked >= PROCESS_COUNT_TTL:
+            count = len(psutil.pids())
+            self.process_count_cache = (now, count)
+        return count
+
+    def live_system(self):
+        """매 틱 바뀌는 시스템 값 (가동 시간, 프로세스 수)"""
+        return {
+            'uptime_seconds': time.time() - self.boot_time,
+            'process_count': self.process_count()
+        }
+
+    def system_info(self):
+        """get_system_info()와 같은 형태 (보고서용)"""
+        return {**self.system(), **self.live_system()}
+
+    def refresh(self):
+        """모든 항목의 변경 여부를 확인하고 현재 버전 반환 (캐시가 유효하면 토큰만 읽음)"""
+        self.system()
+        self.interfaces()
+        self.partitions()
+        return self.version
+
+    def snapshot(self):
+        """버전이 붙은 전체 메타데이터 (/api/meta)"""
+        version = self.refresh()
+        return {
+            'version': version,
+            'system': self.system(),
+            'interfaces': self.interfaces(),
+            'partitions': self.partitions()
+        }
@@ -0,0 +1,321 @@
+"""
+공용 수집 파이프라인
+서버와 명령줄 수집기가 함께 사용하는 샘플링 / 주기 실행 로직
+"""
+
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+
+from collectors.system_info import (
+    get_cpu_info, get_memory_info, get_disk_io, get_partition_usage, get_network_counters, get_nic_counters
+)
+from collectors.metadata import MetadataCache
+from collectors.gpu_info import get_gpu_summary
+from collectors.temperature import get_cpu_temperature
+from collectors.cgroup_info import CgroupCollector, cgroup_series_values
+from collectors.process_groups import ProcessAggregator, group_series_values
+
+
+MB = 1024 * 1024
+
+# 수집 소스 (각 소스는 독립적인 수집 주기를 가짐)
+SOURCES = ('cpu', 'memory', 'io', 'gpu', 'temperature', 'cgroup', 'process')
+
+# 히스토리에 시계열로 저장하는 상위 프로세스 그룹 수
+PROCESS_TOP_GROUPS = 5
+
+# 소스별 유의미한 변화량 (%, MB/s, °C 단위)
+SOURCE_TOLERANCE = {
+    'cpu': 5.0,
+    'memory': 1.0,
+    'io': 1.0,
+    'gpu': 5.0,
+    'temperature': 1.0,
+    'cgroup': 5.0,
+    'process': 5.0
+}
+
+
+class Collector:
+    """누적 카운터(네트워크, 디스크 I/O)의 이전 값을 기억하는 수집기"""
+
+    def __init__(self, cgroup_children=False, process_group_by='name'):
+        self.cgroups = CgroupCollector(include_children=cgroup_children)
+        self.processes = ProcessAggregator()
+        self.process_group_by = process_group_by
+        self.metadata = MetadataCache()
+        self.reset()
+
+    def reset(self):
+        """이전 카운터 초기화"""
+        self.last_network = None
+        self.last_nics = None
+        self.last_disk_io = None
+        self.last_counter_time = None
+        self.last_cgroups = {}
+        self.cgroups.last = {}
+
+    def sample(self, sources=SOURCES):
+        """지정한 소스만 수집하여 {'time', 'values', 'sources', 'partitions', 'cgroups'} 반환
+
+        'sources'는 소스별 {시리즈: 값}, 'values'는 이를 펼친 것이다.
+        초당 전송량은 실제 경과 시간으로 나누므로 수집 주기와 무관하게 MB/s 단위가 맞다.
+        """
+        now = datetime.now()
+        grouped = {source: {} for source in sources}
+        partitions = None
+        cgroups = None
+
+        # CPU / 메모리
+        if 'cpu' in grouped:
+            grouped['cpu']['cpu'] = get_cpu_info()['usage_percent']
+        if 'memory' in grouped:
+            grouped['memory']['memory'] = get_memory_info()['percent']
+
+        # 누적 카운터 (같은 시점에 읽도록 연달아 수집)
+        if 'io' in grouped:
+            values = grouped['io']
+            net = get_network_counters()
+            nics = get_nic_counters()
+            disk_io = get_disk_io()
+            counter_time = time.monotonic()
+
+            if self.last_counter_time is not None:
+                elapsed = max(counter_time - self.last_counter_time, 1e-3)
+                values['network_sent'] = max(0, (net['bytes_sent'] - self.last_network['bytes_sent']) / MB / elapsed)
+                values['network_recv'] = max(0, (net['bytes_recv'] - self.last_network['bytes_recv']) / MB / elapsed)
+                values['disk_read'] = max(0, (disk_io['read_bytes'] - self.last_disk_io['read_bytes']) / MB / elapsed)
+                values['disk_write'] = max(0, (disk_io['write_bytes'] - self.last_disk_io['write_bytes']) / MB / elapsed)
+                values.update(nic_series_values(nics, self.last_nics, elapsed))
+
+            self.last_network = net
+            self.last_nics = nics
+            self.last_disk_io = disk_io
+            self.last_counter_time = counter_time
+            # 파티션 목록은 마운트 테이블이 바뀔 때만 다시 읽고 사용량만 매번 갱신
+            partitions = get_partition_usage(self.metadata.partitions())
+            values.update(partition_series_values(partitions))
+
+        # GPU
+        if 'gpu' in grouped:
+            gpu = get_gpu_summary()
+            if gpu:
+                grouped['gpu']['gpu'] = gpu['usage_percent']
+                grouped['gpu']['gpu_temp'] = gpu['temperature'] or 0
+                grouped['gpu']['gpu_memory'] = gpu['memory_percent']
+
+        # CPU 온도
+        if 'temperature' in grouped:
+            temp = get_cpu_temperature()
+            if temp['available']:
+                grouped['temperature']['cpu_temp'] = temp['temperature']
+
+        # cgroup v2 (컨테이너 환경)
+        if 'cgroup' in grouped:
+            cgroups = self.cgroups.sample()
+            grouped['cgroup'] = cgroup_series_values(cgroups)
+            self.last_cgroups = cgroups
+
+        # 프로세스 그룹 (상위 그룹만 시계열로 저장)
+        if 'process' in grouped:
+            self.processes.sample()
+            groups = self.processes.groups(self.process_group_by, PROCESS_TOP_GROUPS)
+            grouped['process'] = group_series_values(groups)
+
+        values = {}
+        for group in grouped.values():
+            values.update(group)
+
+        return {
+            'time': now,
+            'values': values,
+            'sources': grouped,
+            'partitions': partitions,
+            'cgroups': cgroups
+        }
+
+
+def nic_series_values(nics, last, elapsed):
+    """인터페이스별 초당 전송량 (MB/s) 시리즈 값 ('nic:<인터페이스>:sent' / 'nic:<인터페이스>:recv')"""
+    values = {}
+    for name, counters in nics.items():
+        if name not in last:
+            continue
+        values[f'nic:{name}:sent'] = max(0, (counters['bytes_sent'] - last[name]['bytes_sent']) / MB / elapsed)
+        values[f'nic:{name}:recv'] = max(0, (counters['bytes_recv'] - last[name]['bytes_recv']) / MB / elapsed)
+    return values
+
+
+def partition_series_values(partitions):
+    """파티션 사용률 (%) 시리즈 값 ('disk_usage:<마운트 지점>')"""
+    return {f"disk_usage:{p['mountpoint']}": p['percent'] for p in partitions}
+
+
+class AdaptiveScheduler:
+    """소스별 수집 주기를 신호 변동성과 호스트 부하에 따라 조절
+
+    직전 샘플 대비 변화량이 허용치(SOURCE_TOLERANCE)를 넘으면 주기를 절반으로 줄이고,
+    허용치의 1/4 미만이면 1.5배로 늘린다. 호스트 CPU 사용률이 load_threshold 이상이면
+    모든 소스의 주기를 backoff배로 늘려 모니터 자신이 부하가 되지 않도록 한다.
+    주기는 항상 [min_interval, max_interval] 범위로 제한되며, 두 값이 같으면 고정 주기다.
+    """
+
+    def __init__(self, min_interval=1.0, max_interval=10.0, load_threshold=90.0, backoff=2.0):
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.load_threshold = load_threshold
+        self.backoff = backoff
+        self.reset()
+
+    @property
+    def adaptive(self):
+        return self.max_interval > self.min_interval
+
+    def reset(self):
+        self.intervals = {source: self.min_interval for source in SOURCES}
+        self.next_due = {source: 0.0 for source in SOURCES}
+        self.last_time = {}
+        self.last_values = {}
+        self.host_busy = False
+
+    def due(self, now):
+        """지금 수집할 소스 목록 (틱 지터를 감안해 min_interval의 10% 여유)"""
+        slack = self.min_interval * 0.1
+        return [source for source in SOURCES if now >= self.next_due[source] - slack]
+
+    def set_host_load(self, cpu_percent):
+        self.host_busy = cpu_percent >= self.load_threshold
+
+    def update(self, source, values, now):
+        """수집 결과로 다음 주기를 정하고, 이 샘플이 대표하는 실제 간격(초)을 반환"""
+        elapsed = now - self.last_time[source] if source in self.last_time else self.intervals[source]
+        self.last_time[source] = now
+
+        if self.adaptive:
+            last = self.last_values.get(source, {})
+            changes = [abs(value - last[name]) for name, value in values.items()
+                       if name in last and value is not None and last[name] is not None]
+            if changes:
+                score = max(changes) / SOURCE_TOLERANCE[source]
+                interval = self.intervals[source]
+                if score > 1:
+                    interval /= 2
+                elif score < 0.25:
+                    interval *= 1.5
+                self.intervals[source] = min(max(interval, self.min_interval), self.max_interval)
+            self.last_values[source] = dict(values)
+
+        interval = self.intervals[source]
+        if self.adaptive and self.host_busy:
+            interval = min(interval * self.backoff, self.max_interval)
+        self.next_due[source] = now + interval
+
+        return elapsed
+
+
+def sample_due(collector, scheduler):
+    """주기가 된 소스만 수집하고 시리즈별 실제 수집 간격을 'intervals'에 기록 (없으면 None)"""
+    now = time.monotonic()
+    sources = scheduler.due(now)
+    if not sources:
+        return None
+
+    sample = collector.sample(sources)
+    if 'cpu' in sample['values']:
+        scheduler.set_host_load(sample['values']['cpu'])
+
+    intervals = {}
+    for source, values in sample['sources'].items():
+        elapsed = scheduler.update(source, values, now)
+        for name in values:
+            intervals[name] = elapsed
+    sample['intervals'] = intervals
+
+    return sample
+
+
+def record(history, sample):
+    """수집 결과를 히스토리(dict of list)에 추가"""
+    now = sample['time']
+    intervals = sample.get('intervals', {})
+    for name, value in sample['values'].items():
+        point = {'time': now, 'value': value}
+        if name in intervals:
+            point['interval'] = intervals[name]
+        history[name].append(point)
+
+    # 디스크 파티션 정보 (가장 최근 것만)
+    if sample['partitions'] is not None:
+        history['disk_partitions'] = sample['partitions']
+
+
+def run_periodic(task, interval, is_active=lambda: True, duration=None):
+    """데드라인 기반 주기 실행
+
+    매 틱의 시작 시각을 interval 간격으로 고정하므로 task 실행 시간만큼 주기가 밀리지 않는다.
+    task가 interval보다 오래 걸리면 밀린 틱은 건너뛴다.
+    한 틱의 예외는 기록만 하고 다음 틱을 계속 실행한다 (수집 스레드가 조용히 죽지 않도록).
+    """
+    start = time.monotonic()
+    deadline = start
+
+    while is_active():
+        if duration is not None and deadline - start >= duration:
+            break
+
+        try:
+            task()
+        except Exception:
+            print(f"[{datetime.now():%H:%M:%S}] 수집 틱 오류 (다음 틱에서 계속)", file=sys.stderr)
+            traceback.print_exc()
+
+        deadline += interval
+        now = time.monotonic()
+        if now > deadline:
+            missed = int((now - deadline) // interval) + 1
+            deadline += missed * interval
+        time.sleep(deadline - now)
+
+
+class Sampler:
+    """백그라운드 수집 스레드 (항상 하나만 실행)"""
+
+    def __init__(self, task, interval):
+        self.task = task
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.started_at = None
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive() and not self.stop_event.is_set()
+
+    def start(self):
+        """수집 시작 (이미 실행 중이면 아무것도 하지 않고 False)"""
+        with self.lock:
+            if self.running:
+                return False
+
+            # 이전 스레드가 아직 종료 중이면 끝날 때까지 대기
+            if self.thread is not None:
+                self.thread.join()
+
+            self.stop_event = threading.Event()
+            stop_event = self.stop_event
+            self.thread = threading.Thread(
+                target=run_periodic,
+                args=(self.task, self.interval, lambda: not stop_event.is_set()),
+                daemon=True
+            )
+            self.started_at = datetime.now()
+            self.thread.start()
+            return True
+
+    def stop(self):
+        with self.lock:
+            self.stop_event.set()
@@ -0,0 +1,244 @@
+"""
+프로세스 그룹 집계기
+이름 / 부모 트리 / 사용자 / cgroup별 CPU, 메모리, 디스크 I/O, 파일 디스크립터 합계
+"""
+
+import threading
+import time
+from urllib.parse import quote, unquote
+
+import psutil
+
+
+GROUP_BY = ('name', 'parent', 'user', 'cgroup')
+
+MB = 1024 * 1024
+
+
+def read_pid_cgroup(pid):
+    """/proc/<pid>/cgroup의 v2 경로 (Linux 외에는 None)"""
+    try:
+        with open(f'/proc/{pid}/cgroup') as f:
+            for line in f:
+                if line.startswith('0::'):
+                    return line[3:].strip() or '/'
+    except OSError:
+        pass
+    return None
+
+
+class ProcessAggregator:
+    """PID별로 증분 샘플링하고 그룹별로 합산
+
+    PID마다 psutil.Process 객체와 정적 정보(이름, 부모, 사용자, cgroup)를 처음 볼 때 한 번만
+    읽어 캐시하고, 매 틱에는 CPU 시간 / RSS / I/O 카운터 / fd 수만 읽어 델타를 계산한다.
+    부모 트리도 캐시하며 프로세스가 사라지면 그 프로세스와 자손의 항목만 지운다.
+    수집 스레드(sample)와 API 요청 스레드(groups)가 같은 상태를 쓰므로 lock으로 직렬화한다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.procs = {}
+        self.info = {}
+        self.last = {}
+        self.current = {}
+        self.root_cache = {}
+
+    def _add(self, pid):
+        try:
+            proc = psutil.Process(pid)
+            with proc.oneshot():
+                info = {'name': proc.name(), 'ppid': proc.ppid()}
+                try:
+                    info['user'] = proc.username()
+                except (psutil.AccessDenied, KeyError):
+                    info['user'] = '?'
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return
+        info['cgroup'] = read_pid_cgroup(pid)
+        self.procs[pid] = proc
+        self.info[pid] = info
+
+    def _remove(self, pid):
+        self.procs.pop(pid, None)
+        self.info.pop(pid, None)
+        self.last.pop(pid, None)
+        self.current.pop(pid, None)
+
+    def _refresh_tree(self, dead):
+        """부모가 사라진 프로세스는 재배치되므로 ppid를 다시 읽음 → 부모가 바뀐 PID"""
+        moved = set()
+        for pid, info in self.info.items():
+            if info['ppid'] in dead:
+                moved.add(pid)
+                try:
+                    info['ppid'] = self.procs[pid].ppid()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+        return moved
+
+    def _forget(self, gone):
+        """사라지거나 부모가 바뀐 PID와 그 자손의 루트 캐시만 삭제 (나머지 트리는 유지)"""
+        roots = gone | {self.root_cache[pid] for pid in gone if pid in self.root_cache}
+        for pid, root in list(self.root_cache.items()):
+            if root not in roots:
+                continue
+            # 같은 트리 안에서 부모를 따라 올라가다 gone을 만나면 자손
+            node, seen = pid, set()
+            while node not in gone and node != root and node in self.info and node not in seen:
+                seen.add(node)
+                node = self.info[node]['ppid']
+            if node in gone:
+                del self.root_cache[pid]
+
+    def sample(self):
+        """모든 프로세스의 사용량 갱신 → {pid: {...}} (복사본)"""
+        with self.lock:
+            return dict(self._sample())
+
+    def _sample(self):
+        pids = set(psutil.pids())
+        known = set(self.procs)
+
+        dead = known - pids
+        for pid in dead:
+            self._remove(pid)
+        for pid in pids - known:
+            self._add(pid)
+
+        now = time.monotonic()
+        vanished = []
+        for pid, proc in self.procs.items():
+            try:
+                with proc.oneshot():
+                    cpu = proc.cpu_times()
+                    counters = {
+                        'time': now,
+                        'cpu': cpu.user + cpu.system,
+                        'rss': proc.memory_info().rss
+                    }
+                    try:
+                        io = proc.io_counters()
+                        counters['read_bytes'] = io.read_bytes
+                        counters['write_bytes'] = io.write_bytes
+                    except (psutil.AccessDenied, AttributeError):
+                        pass
+                    try:
+                        counters['fds'] = proc.num_fds() if hasattr(proc, 'num_fds') else proc.num_handles()
+                    except psutil.AccessDenied:
+                        pass
+            except psutil.NoSuchProcess:
+                vanished.append(pid)
+                continue
+            except psutil.AccessDenied:
+                continue
+
+            last = self.last.get(pid)
+            usage = {'rss': counters['rss'], 'fds': counters.get('fds', 0),
+                     'cpu_percent': 0.0, 'read_rate': 0.0, 'write_rate': 0.0}
+            if last:
+                elapsed = max(now - last['time'], 1e-3)
+                usage['cpu_percent'] = max(0.0, counters['cpu'] - last['cpu']) / elapsed * 100
+                if 'read_bytes' in counters and 'read_bytes' in last:
+                    usage['read_rate'] = max(0, counters['read_bytes'] - last['read_bytes']) / MB / elapsed
+                    usage['write_rate'] = max(0, counters['write_bytes'] - last['write_bytes']) / MB / elapsed
+
+            self.last[pid] = counters
+            self.current[pid] = usage
+
+        for pid in vanished:
+            self._remove(pid)
+
+        # 새 PID는 처음 조회할 때 루트를 계산하므로 사라진 쪽만 캐시에서 정리
+        gone = dead | set(vanished)
+        if gone:
+            self._forget(gone | self._refresh_tree(gone))
+
+        return self.current
+
+    def _root(self, pid):
+        """부모 트리에서 PID 1(또는 최상위) 바로 아래 조상 (캐시)"""
+        if pid in self.root_cache:
+            return self.root_cache[pid]
+
+        path = []
+        node = pid
+        while True:
+            if node in self.root_cache:
+                root = self.root_cache[node]
+                break
+            path.append(node)
+            parent = self.info[node]['ppid'] if node in self.info else 0
+            if parent in (0, 1) or parent not in self.info or parent in path:
+                root = node
+                break
+            node = parent
+
+        for node in path:
+            self.root_cache[node] = root
+        return root
+
+    def _key(self, pid, by):
+        info = self.info[pid]
+        if by == 'parent':
+            # 최상위 조상 이름 (PID는 재시작마다 바뀌므로 그룹 키에 넣지 않음)
+            return self.info.get(self._root(pid), info)['name']
+        if by == 'user':
+            return info['user']
+        if by == 'cgroup':
+            return info['cgroup'] or '?'
+        return info['name']
+
+    def groups(self, by='name', limit=None):
+        """최근 샘플을 그룹별로 합산 (CPU 사용량 내림차순)"""
+        if by not in GROUP_BY:
+            raise ValueError(f'Unsupported group: {by}')
+
+        with self.lock:
+            groups = self._groups(by)
+
+        result = sorted(groups.values(), key=lambda g: g['cpu_percent'], reverse=True)
+        return result[:limit] if limit else result
+
+    def _groups(self, by):
+        groups = {}
+        for pid, usage in list(self.current.items()):
+            if pid not in self.info:
+                continue
+            key = self._key(pid, by)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = {
+                    'group': key, 'count': 0, 'cpu_percent': 0.0, 'rss': 0,
+                    'read_rate': 0.0, 'write_rate': 0.0, 'num_fds': 0
+                }
+            group['count'] += 1
+            group['cpu_percent'] += usage['cpu_percent']
+            group['rss'] += usage['rss']
+            group['read_rate'] += usage['read_rate']
+            group['write_rate'] += usage['write_rate']
+            group['num_fds'] += usage['fds']
+        return groups
+
+
+def group_series_name(group, metric):
+    """'process:<그룹>:<지표>' (그룹 이름의 ':' / '%'는 퍼센트 인코딩)"""
+    return f"process:{quote(group, safe=' /()[]@.-_')}:{metric}"
+
+
+def parse_group_series(name):
+    """group_series_name()의 역변환 → (그룹, 지표)"""
+    group, metric = name[len('process:'):].rsplit(':', 1)
+    return unquote(group), metric
+
+
+def group_series_values(groups):
+    """상위 그룹을 히스토리 시리즈 값으로 변환 ('process:<그룹>:<지표>')"""
+    values = {}
+    for group in groups:
+        name = group['group']
+        values[group_series_name(name, 'cpu_percent')] = group['cpu_percent']
+        values[group_series_name(name, 'rss_mb')] = group['rss'] / MB
+        values[group_series_name(name, 'read_rate')] = group['read_rate']
+        values[group_series_name(name, 'write_rate')] = group['write_rate']
+    return values
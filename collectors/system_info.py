@@ -44,44 +44,77 @@ def get_memory_info():
     }
 
 
-def get_disk_info():
-    """디스크 정보 수집"""
-    partitions = []
-    for partition in psutil.disk_partitions():
+def list_partitions():
+    """마운트된 파티션 목록 (사용량 제외)"""
+    return [
+        {'device': p.device, 'mountpoint': p.mountpoint, 'fstype': p.fstype}
+        for p in psutil.disk_partitions()
+    ]
+
+
+def get_partition_usage(partitions):
+    """파티션 목록에 현재 사용량을 붙임 (접근할 수 없는 파티션은 제외)"""
+    result = []
+    for partition in partitions:
         try:
-            usage = psutil.disk_usage(partition.mountpoint)
-            partitions.append({
-                'device': partition.device,
-                'mountpoint': partition.mountpoint,
-                'fstype': partition.fstype,
-                'total': usage.total,
-                'used': usage.used,
-                'free': usage.free,
-                'percent': usage.percent
-            })
-        except PermissionError:
+            usage = psutil.disk_usage(partition['mountpoint'])
+        except (PermissionError, FileNotFoundError):
             continue
-    
-    # 디스크 I/O
+        result.append({
+            **partition,
+            'total': usage.total,
+            'used': usage.used,
+            'free': usage.free,
+            'percent': usage.percent
+        })
+    return result
+
+
+def get_disk_io():
+    """디스크 I/O 누적 카운터"""
     io_counters = psutil.disk_io_counters()
-    io_info = {
+    return {
         'read_bytes': io_counters.read_bytes if io_counters else 0,
         'write_bytes': io_counters.write_bytes if io_counters else 0,
         'read_count': io_counters.read_count if io_counters else 0,
         'write_count': io_counters.write_count if io_counters else 0
     }
-    
+
+
+def get_disk_info():
+    """디스크 정보 수집"""
     return {
-        'partitions': partitions,
-        'io': io_info
+        'partitions': get_partition_usage(list_partitions()),
+        'io': get_disk_io()
     }
 
 
-def get_network_info():
-    """네트워크 정보 수집"""
+def get_network_counters():
+    """네트워크 누적 카운터"""
     net_io = psutil.net_io_counters()
-    
-    # 인터페이스별 정보
+    return {
+        'bytes_sent': net_io.bytes_sent,
+        'bytes_recv': net_io.bytes_recv,
+        'packets_sent': net_io.packets_sent,
+        'packets_recv': net_io.packets_recv,
+        'errin': net_io.errin,
+        'errout': net_io.errout,
+        'dropin': net_io.dropin,
+        'dropout': net_io.dropout
+    }
+
+
+def get_nic_counters():
+    """인터페이스별 누적 송수신 바이트 (루프백 제외)"""
+    return {
+        name: {'bytes_sent': counters.bytes_sent, 'bytes_recv': counters.bytes_recv}
+        for name, counters in psutil.net_io_counters(pernic=True).items()
+        if name != 'lo'
+    }
+
+
+def get_interface_info():
+    """인터페이스별 상태 / 주소"""
     interfaces = {}
     net_if_addrs = psutil.net_if_addrs()
     net_if_stats = psutil.net_if_stats()
@@ -94,24 +127,20 @@ def get_network_info():
             'addresses': [{'address': addr.address, 'family': str(addr.family)} 
                          for addr in addrs]
         }
-    
+    return interfaces
+
+
+def get_network_info():
+    """네트워크 정보 수집"""
     return {
-        'bytes_sent': net_io.bytes_sent,
-        'bytes_recv': net_io.bytes_recv,
-        'packets_sent': net_io.packets_sent,
-        'packets_recv': net_io.packets_recv,
-        'errin': net_io.errin,
-        'errout': net_io.errout,
-        'dropin': net_io.dropin,
-        'dropout': net_io.dropout,
-        'interfaces': interfaces
+        **get_network_counters(),
+        'interfaces': get_interface_info()
     }
 
 
-def get_system_info():
-    """시스템 기본 정보"""
+def get_static_system_info():
+    """재부팅 전까지 바뀌지 않는 시스템 정보"""
     boot_time = datetime.fromtimestamp(psutil.boot_time())
-    uptime = time.time() - psutil.boot_time()
     
     return {
         'platform': platform.system(),
@@ -120,8 +149,15 @@ def get_system_info():
         'architecture': platform.machine(),
         'processor': platform.processor(),
         'hostname': platform.node(),
-        'boot_time': boot_time.strftime('%Y-%m-%d %H:%M:%S'),
-        'uptime_seconds': uptime,
+        'boot_time': boot_time.strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+
+def get_system_info():
+    """시스템 기본 정보"""
+    return {
+        **get_static_system_info(),
+        'uptime_seconds': time.time() - psutil.boot_time(),
         'process_count': len(psutil.pids())
     }
 
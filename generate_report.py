@@ -5,70 +5,28 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict
-import time
 
-from collectors.system_info import (
-    get_cpu_info, get_memory_info, get_disk_info, 
-    get_network_info, get_system_info
-)
-from collectors.gpu_info import get_gpu_summary
-from collectors.temperature import get_cpu_temperature
+from collectors.system_info import get_system_info
+from collectors.pipeline import Collector, record, run_periodic
 from report.pdf_generator import generate_pdf_report
 
 def collect_sample_data(duration_seconds=60, interval=1):
-    """샘플 데이터 수집"""
+    """샘플 데이터 수집 (서버와 같은 수집 파이프라인 사용)"""
     print(f"데이터 수집 시작 ({duration_seconds}초)...")
     
     history = defaultdict(list)
-    last_network = None
-    last_disk_io = None
+    collector = Collector()
     
     # 시스템 정보
     history['system_info'] = get_system_info()
     
-    start_time = time.time()
-    while (time.time() - start_time) < duration_seconds:
-        now = datetime.now()
-        elapsed = int(time.time() - start_time)
-        print(f"  수집 중... {elapsed}/{duration_seconds}초", end='\r')
-        
-        # CPU
-        cpu = get_cpu_info()
-        history['cpu'].append({'time': now, 'value': cpu['usage_percent']})
-        
-        # 메모리
-        mem = get_memory_info()
-        history['memory'].append({'time': now, 'value': mem['percent']})
-        
-        # 네트워크
-        net = get_network_info()
-        if last_network:
-            sent_per_sec = (net['bytes_sent'] - last_network['bytes_sent']) / 1024 / 1024
-            recv_per_sec = (net['bytes_recv'] - last_network['bytes_recv']) / 1024 / 1024
-            history['network_sent'].append({'time': now, 'value': max(0, sent_per_sec)})
-            history['network_recv'].append({'time': now, 'value': max(0, recv_per_sec)})
-        last_network = net
-        
-        # 디스크 I/O
-        disk = get_disk_info()
-        if last_disk_io:
-            read_per_sec = (disk['io']['read_bytes'] - last_disk_io['read_bytes']) / 1024 / 1024
-            write_per_sec = (disk['io']['write_bytes'] - last_disk_io['write_bytes']) / 1024 / 1024
-            history['disk_read'].append({'time': now, 'value': max(0, read_per_sec)})
-            history['disk_write'].append({'time': now, 'value': max(0, write_per_sec)})
-        last_disk_io = disk['io']
-        
-        # 디스크 파티션
-        history['disk_partitions'] = disk['partitions']
-        
-        # GPU
-        gpu = get_gpu_summary()
-        if gpu:
-            history['gpu'].append({'time': now, 'value': gpu['usage_percent']})
-        
-        time.sleep(interval)
+    def tick():
+        record(history, collector.sample())
+        print(f"  수집 중... {len(history['cpu'])}개 샘플", end='\r')
+    
+    run_periodic(tick, interval, duration=duration_seconds)
     
     print(f"\n데이터 수집 완료! {len(history['cpu'])}개 데이터 포인트")
     return dict(history)
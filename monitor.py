@@ -0,0 +1,214 @@
+"""
+시스템 모니터 명령줄 도구
+
+사용 예:
+    python monitor.py collect --duration 1h --interval 0.5 --out run.db --report
+    python monitor.py collect --duration 1d --interval 0.5 --max-interval 30 --out day.db
+    python monitor.py report day.db --format html --out day.html
+    python monitor.py collect --duration 1h --burst --out run.db
+    python monitor.py export --db run.db --format parquet --out run.parquet
+    python monitor.py export --format csv --out history.csv
+    python monitor.py export --series cpu,memory --from 2024-01-01T09:00:00 --format ndjson
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+import argparse
+import queue
+import shutil
+from datetime import datetime
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+from collectors.system_info import get_system_info
+from collectors.pipeline import AdaptiveScheduler, Collector, run_periodic, sample_due
+from collectors.burst import BurstCapture
+from storage.captures import CaptureStore
+from storage.sqlite_store import SampleWriter, iter_points, load_history
+from storage.forecast import forecast_history
+from report.exporter import EXPORT_FORMATS, parse_time, export_stream, write_parquet
+from report.html_generator import REPORT_FORMATS, generate_html_report
+
+
+DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_duration(value):
+    """'90', '90s', '30m', '1h', '2d' 형식을 초 단위로 변환"""
+    value = value.strip().lower()
+    if value and value[-1] in DURATION_UNITS:
+        return float(value[:-1]) * DURATION_UNITS[value[-1]]
+    return float(value)
+
+
+def cmd_collect(args):
+    """샘플을 파일에 바로 기록하며 수집 (메모리에 쌓지 않음)"""
+    collector = Collector(cgroup_children=args.cgroup_children)
+    scheduler = AdaptiveScheduler(args.interval, args.max_interval or args.interval)
+    count = 0
+
+    # 버스트 캡처는 별도 스레드에서 끝나므로 큐에 모았다가 수집 스레드에서 기록 (SQLite 연결 공유 불가)
+    finished = queue.SimpleQueue()
+    burst = BurstCapture(CaptureStore(), args.burst_interval, args.burst_seconds, args.burst_seconds,
+                         on_capture=finished.put)
+
+    with SampleWriter(args.out) as writer:
+        writer.set_meta('system_info', get_system_info())
+
+        def write_finished():
+            while not finished.empty():
+                event = finished.get()
+                capture_id = writer.write_capture(event)
+                print(f"\n  버스트 캡처 #{capture_id}: {event['trigger']['reason']}", file=sys.stderr)
+
+        def tick():
+            nonlocal count
+            write_finished()
+
+            sample = sample_due(collector, scheduler)
+            if not sample:
+                return
+            writer.write(sample)
+            count += 1
+            print(f"  수집 중... {count}개 샘플", end='\r', file=sys.stderr)
+
+        print(f"데이터 수집 시작 ({args.duration:.0f}초, {args.interval}초 간격) → {args.out}",
+              file=sys.stderr)
+        if args.burst:
+            burst.start()
+        try:
+            run_periodic(tick, args.interval, duration=args.duration)
+        except KeyboardInterrupt:
+            print("\n수집 중단", file=sys.stderr)
+        finally:
+            # 마지막 틱 이후 끝난 캡처와 진행 중이던 캡처까지 기록한 뒤 파일을 닫음
+            burst.stop(flush=True)
+            write_finished()
+
+    print(f"\n데이터 수집 완료! {count}개 샘플", file=sys.stderr)
+
+    if args.report is not None:
+        build_report(args.out, args.report, args.report_format)
+
+
+def build_report(db_path, output_path='', fmt=None):
+    """수집 파일로부터 보고서 생성 (형식 생략 시 확장자로 판단, 기본 PDF)"""
+    if not fmt:
+        fmt = 'html' if output_path.lower().endswith(('.html', '.htm')) else 'pdf'
+
+    if not output_path:
+        output_dir = os.path.join(os.path.dirname(__file__), 'reports')
+        os.makedirs(output_dir, exist_ok=True)
+        filename = f"system_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{fmt}"
+        output_path = os.path.join(output_dir, filename)
+
+    history_data = load_history(db_path)
+    history_data['forecasts'] = forecast_history(history_data)
+    if fmt == 'html':
+        generate_html_report(history_data, output_path)
+    else:
+        # matplotlib / reportlab은 PDF를 만들 때만 로드
+        from report.pdf_generator import generate_pdf_report
+        generate_pdf_report(history_data, output_path)
+    print(f"✅ {fmt.upper()} 보고서 생성 완료: {output_path}", file=sys.stderr)
+    return output_path
+
+
+def cmd_report(args):
+    build_report(args.db, args.out, args.format)
+
+
+def cmd_export(args):
+    """히스토리 내보내기 (--db 지정 시 수집 파일, 아니면 실행 중인 서버)"""
+    if args.db:
+        export_file(args)
+        return
+
+    params = {'format': args.format}
+    if args.series:
+        params['series'] = args.series
+    if args.start:
+        params['from'] = args.start
+    if args.end:
+        params['to'] = args.end
+
+    url = f"{args.url.rstrip('/')}/api/export?{urlencode(params)}"
+
+    with urlopen(url) as response:
+        if args.out == '-':
+            shutil.copyfileobj(response, sys.stdout.buffer)
+        else:
+            with open(args.out, 'wb') as f:
+                shutil.copyfileobj(response, f)
+            print(f"✅ 내보내기 완료: {args.out}")
+
+
+def export_file(args):
+    """수집 파일에서 직접 스트리밍 내보내기"""
+    series = [s for s in args.series.split(',') if s] if args.series else None
+    rows = iter_points(args.db, series, parse_time(args.start), parse_time(args.end))
+
+    if args.format == 'parquet':
+        if args.out == '-':
+            raise SystemExit('parquet 형식은 --out 파일 경로가 필요합니다')
+        write_parquet(rows, args.out)
+    else:
+        out = sys.stdout if args.out == '-' else open(args.out, 'w', newline='', encoding='utf-8')
+        try:
+            for chunk in export_stream(rows, args.format):
+                out.write(chunk)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+    if args.out != '-':
+        print(f"✅ 내보내기 완료: {args.out}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='monitor', description='시스템 리소스 모니터')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    collect = subparsers.add_parser('collect', help='서버 없이 데이터 수집')
+    collect.add_argument('--duration', type=parse_duration, default=300, help='수집 시간 (예: 300, 30m, 1h)')
+    collect.add_argument('--interval', type=float, default=1.0, help='수집 주기 (초, 적응형일 때 최소값)')
+    collect.add_argument('--max-interval', type=float, help='적응형 수집의 최대 주기 (초, 기본: 고정 주기)')
+    collect.add_argument('--out', default='run.db', help='샘플 기록 파일 (SQLite)')
+    collect.add_argument('--cgroup-children', action='store_true', help='하위 cgroup까지 수집')
+    collect.add_argument('--burst', action='store_true', help='급등 시 트리거 전후 구간을 고해상도로 캡처')
+    collect.add_argument('--burst-interval', type=float, default=0.1, help='버스트 링 버퍼 주기 (초)')
+    collect.add_argument('--burst-seconds', type=float, default=10, help='트리거 전후 캡처 구간 (초)')
+    collect.add_argument('--report', nargs='?', const='', default=None, metavar='PATH',
+                         help='수집 후 보고서 생성 (경로 생략 시 reports/)')
+    collect.add_argument('--report-format', choices=REPORT_FORMATS,
+                         help='보고서 형식 (기본: 경로 확장자, 없으면 pdf)')
+    collect.set_defaults(func=cmd_collect)
+
+    report = subparsers.add_parser('report', help='수집 파일로 보고서 생성')
+    report.add_argument('db', help='샘플 기록 파일 (SQLite)')
+    report.add_argument('--out', default='', help='보고서 경로 (기본: reports/)')
+    report.add_argument('--format', choices=REPORT_FORMATS,
+                        help='보고서 형식 (기본: 경로 확장자, 없으면 pdf)')
+    report.set_defaults(func=cmd_report)
+
+    export = subparsers.add_parser('export', help='히스토리 내보내기')
+    export.add_argument('--url', default='http://localhost:5000', help='모니터링 서버 주소')
+    export.add_argument('--db', help='서버 대신 읽을 샘플 기록 파일 (SQLite)')
+    export.add_argument('--series', help='쉼표로 구분한 시리즈 이름 (기본: 전체)')
+    export.add_argument('--from', dest='start', help='시작 시간 (ISO 8601)')
+    export.add_argument('--to', dest='end', help='종료 시간 (ISO 8601)')
+    export.add_argument('--format', choices=EXPORT_FORMATS, default='csv')
+    export.add_argument('--out', default='-', help='출력 파일 (기본: 표준 출력)')
+    export.set_defaults(func=cmd_export)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
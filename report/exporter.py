@@ -0,0 +1,143 @@
+"""
+히스토리 데이터 내보내기
+CSV / NDJSON / Parquet 스트리밍 출력
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+
+from storage.series import is_time_series, iter_range
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+EXPORT_FORMATS = ('csv', 'ndjson', 'parquet')
+
+# 한 번에 직렬화하는 행 수 (응답 청크 단위)
+CHUNK_ROWS = 1000
+
+# Parquet row group 크기
+PARQUET_ROW_GROUP = 65536
+
+CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+    'parquet': 'application/vnd.apache.parquet'
+}
+
+
+def parse_time(value):
+    """ISO 8601 문자열을 datetime으로 변환 (빈 값은 None)
+
+    히스토리 시각은 타임존 없는 로컬 시간이므로, 'Z' / '+09:00'처럼 타임존이 있는 값은
+    로컬 시간으로 바꾼 뒤 타임존을 뗀다 (스트리밍 중 비교 오류 방지).
+    """
+    if not value:
+        return None
+    t = datetime.fromisoformat(value)
+    if t.tzinfo is not None:
+        t = t.astimezone().replace(tzinfo=None)
+    return t
+
+
+def series_names(history):
+    """시계열로 저장된 히스토리 키 목록"""
+    names = []
+    # 수집 스레드가 새 시리즈를 추가해도 순회가 깨지지 않도록 항목을 먼저 복사
+    for name, data in list(history.items()):
+        if is_time_series(data):
+            names.append(name)
+    return names
+
+
+def iter_points(history, series=None, start=None, end=None):
+    """(시리즈, 시간, 값) 행을 하나씩 생성
+
+    리스트 전체를 복사하지 않고 순회하며, 압축 블록은 하나씩 디코딩하므로 메모리 사용량이 일정하다.
+    수집 스레드가 계속 추가하므로 시작 시점의 길이까지만 읽는다.
+    """
+    if series is None:
+        series = series_names(history)
+
+    for name in series:
+        data = history.get(name)
+        if not is_time_series(data):
+            continue
+
+        for point in iter_range(data, start, end):
+            yield name, point['time'], point['value']
+
+
+def iter_csv(rows):
+    """CSV 텍스트를 청크 단위로 생성"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['series', 'time', 'value'])
+
+    pending = 0
+    for name, t, value in rows:
+        writer.writerow([name, t.isoformat(), value])
+        pending += 1
+        if pending >= CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    yield buffer.getvalue()
+
+
+def iter_ndjson(rows):
+    """NDJSON 텍스트를 청크 단위로 생성"""
+    lines = []
+    for name, t, value in rows:
+        lines.append(json.dumps({'series': name, 'time': t.isoformat(), 'value': value}))
+        if len(lines) >= CHUNK_ROWS:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def write_parquet(rows, output_path):
+    """Parquet 파일을 row group 단위로 점진적으로 기록"""
+    if not PARQUET_AVAILABLE:
+        raise RuntimeError('pyarrow not installed')
+
+    schema = pa.schema([
+        ('series', pa.string()),
+        ('time', pa.timestamp('us')),
+        ('value', pa.float64())
+    ])
+
+    with pq.ParquetWriter(output_path, schema) as writer:
+        names, times, values = [], [], []
+        for name, t, value in rows:
+            names.append(name)
+            times.append(t)
+            values.append(value)
+            if len(names) >= PARQUET_ROW_GROUP:
+                writer.write_table(pa.table([names, times, values], schema=schema))
+                names, times, values = [], [], []
+
+        if names:
+            writer.write_table(pa.table([names, times, values], schema=schema))
+
+    return output_path
+
+
+def export_stream(rows, fmt):
+    """텍스트 형식(csv/ndjson)의 청크 생성기"""
+    if fmt == 'csv':
+        return iter_csv(rows)
+    if fmt == 'ndjson':
+        return iter_ndjson(rows)
+    raise ValueError(f'Unsupported stream format: {fmt}')
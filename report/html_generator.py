@@ -0,0 +1,215 @@
+"""
+HTML 보고서 생성기
+다운샘플링한 구간 데이터로 인라인 SVG 차트를 직접 그리는 단일 HTML 파일 (matplotlib 불필요)
+"""
+
+from datetime import datetime
+from html import escape
+
+from storage.rollup import downsample
+from report.statistics import (
+    REPORT_CAPTURES, monitoring_period, system_info_rows, resource_stats_rows, partition_rows,
+    capture_rows, process_snapshot_rows, forecast_rows
+)
+from storage.captures import capture_label
+
+
+# 보고서 형식 (PDF는 matplotlib / reportlab, HTML은 이 모듈)
+REPORT_FORMATS = ('pdf', 'html')
+
+# 차트 하나당 구간 수 (SVG 포인트 수)
+CHART_POINTS = 400
+
+CHART_WIDTH = 800
+CHART_HEIGHT = 220
+MARGIN_LEFT = 50
+MARGIN_RIGHT = 10
+MARGIN_TOP = 10
+MARGIN_BOTTOM = 30
+
+COLORS = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c']
+
+STYLE = """
+body { font-family: -apple-system, 'Segoe UI', 'Noto Sans KR', 'Malgun Gothic', sans-serif;
+       color: #2c3e50; max-width: 900px; margin: 0 auto; padding: 24px; }
+h1 { text-align: center; }
+h2 { color: #34495e; margin-top: 32px; }
+.center { text-align: center; }
+table { border-collapse: collapse; width: 100%; margin: 8px 0; }
+th, td { border: 1px solid #bdc3c7; padding: 6px 10px; font-size: 0.9rem; }
+th { color: #fff; }
+tr:nth-child(even) td { background: #ecf0f1; }
+table.info th { background: #3498db; text-align: left; }
+table.stats th { background: #27ae60; }
+table.stats td, table.disk td { text-align: center; }
+table.disk th { background: #9b59b6; }
+table.capture th { background: #e67e22; }
+table.capture td { text-align: center; }
+table.forecast th { background: #c0392b; }
+table.forecast td { text-align: center; }
+h3 { color: #7f8c8d; margin-top: 24px; }
+svg { width: 100%; height: auto; }
+svg text { font-size: 11px; fill: #7f8c8d; }
+"""
+
+# 보고서 차트 (PDF 보고서와 같은 구성): (제목, [(시리즈, 범례)], 백분율 여부)
+CHARTS = [
+    ('CPU 사용량 (%)', [('cpu', 'CPU')], True),
+    ('메모리 사용량 (%)', [('memory', '메모리')], True),
+    ('네트워크 트래픽 (MB/s)', [('network_sent', '송신'), ('network_recv', '수신')], False),
+    ('디스크 I/O (MB/s)', [('disk_read', '읽기'), ('disk_write', '쓰기')], False),
+    ('GPU 사용량 (%)', [('gpu', 'GPU')], True),
+]
+
+# 버스트 캡처 확대 차트: CPU (%) / I/O (MB/s)
+CAPTURE_CPU = [('cpu', 'CPU'), ('iowait', 'iowait')]
+CAPTURE_IO = [('disk_read', '디스크 읽기'), ('disk_write', '디스크 쓰기'),
+              ('network_sent', '송신'), ('network_recv', '수신')]
+
+
+def html_table(rows, css_class):
+    """첫 행을 헤더로 하는 HTML 표"""
+    head = ''.join(f'<th>{escape(str(c))}</th>' for c in rows[0])
+    body = ''.join(
+        '<tr>' + ''.join(f'<td>{escape(str(c))}</td>' for c in row) + '</tr>'
+        for row in rows[1:]
+    )
+    return f'<table class="{css_class}"><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>\n'
+
+
+def svg_chart(datasets, percent=False):
+    """[(범례, 포인트 리스트, 색)] → 인라인 SVG (구간 평균 선 + 최소/최대 밴드)"""
+    start = min(data[0]['time'] for _, data, _ in datasets)
+    end = max(data[-1]['time'] for _, data, _ in datasets)
+    span = (end - start).total_seconds() or 1
+
+    rolled = [(label, downsample(data, start, end, CHART_POINTS), color) for label, data, color in datasets]
+    peak = max((b['max'] for _, buckets, _ in rolled for b in buckets), default=0)
+    ymax = max(peak * 1.1, 100) if percent else (peak * 1.1 or 1)
+
+    plot_w = CHART_WIDTH - MARGIN_LEFT - MARGIN_RIGHT
+    plot_h = CHART_HEIGHT - MARGIN_TOP - MARGIN_BOTTOM
+
+    def x(t):
+        return MARGIN_LEFT + (t - start).total_seconds() / span * plot_w
+
+    def y(v):
+        return MARGIN_TOP + plot_h * (1 - v / ymax)
+
+    parts = [f'<svg viewBox="0 0 {CHART_WIDTH} {CHART_HEIGHT}" xmlns="http://www.w3.org/2000/svg">']
+
+    # 가로 격자 + y축 값
+    for i in range(5):
+        value = ymax * i / 4
+        yy = y(value)
+        parts.append(f'<line x1="{MARGIN_LEFT}" y1="{yy:.1f}" x2="{CHART_WIDTH - MARGIN_RIGHT}" y2="{yy:.1f}" '
+                     f'stroke="#ecf0f1"/>')
+        parts.append(f'<text x="{MARGIN_LEFT - 6}" y="{yy + 4:.1f}" text-anchor="end">{value:.4g}</text>')
+
+    # x축 시간
+    time_format = '%H:%M:%S' if span < 3600 else '%H:%M'
+    for i in range(6):
+        t = start + (end - start) * i / 5
+        parts.append(f'<text x="{x(t):.1f}" y="{CHART_HEIGHT - 8}" text-anchor="middle">'
+                     f'{t.strftime(time_format)}</text>')
+
+    for label, buckets, color in rolled:
+        if not buckets:
+            continue
+        upper = ' '.join(f"{x(b['time']):.1f},{y(b['max']):.1f}" for b in buckets)
+        lower = ' '.join(f"{x(b['time']):.1f},{y(b['min']):.1f}" for b in reversed(buckets))
+        line = ' '.join(f"{x(b['time']):.1f},{y(b['value']):.1f}" for b in buckets)
+        parts.append(f'<polygon points="{upper} {lower}" fill="{color}" fill-opacity="0.2" stroke="none"/>')
+        parts.append(f'<polyline points="{line}" fill="none" stroke="{color}" stroke-width="1.5"/>')
+
+    # 범례 (시리즈가 여러 개일 때)
+    if len(rolled) > 1:
+        for i, (label, _, color) in enumerate(rolled):
+            lx = CHART_WIDTH - MARGIN_RIGHT - 90 * (len(rolled) - i)
+            parts.append(f'<rect x="{lx}" y="{MARGIN_TOP}" width="10" height="10" fill="{color}"/>')
+            parts.append(f'<text x="{lx + 14}" y="{MARGIN_TOP + 9}">{escape(label)}</text>')
+
+    parts.append('</svg>\n')
+    return ''.join(parts)
+
+
+def iter_capture_section(event):
+    """캡처 하나의 확대 차트 + 프로세스 스냅샷"""
+    series = event['series']
+    yield f'<h3>{escape(capture_label(event))}</h3>\n'
+
+    for series_list, percent in ((CAPTURE_CPU, True), (CAPTURE_IO, False)):
+        datasets = [
+            (label, series[key], COLORS[i % len(COLORS)])
+            for i, (key, label) in enumerate(series_list)
+            if len(series.get(key) or []) > 1
+        ]
+        if datasets:
+            yield svg_chart(datasets, percent)
+
+    rows = process_snapshot_rows(event)
+    if rows:
+        yield html_table(rows, 'capture')
+
+
+def iter_html_report(history_data, title="시스템 리소스 모니터링 보고서"):
+    """HTML 보고서를 섹션 단위로 생성 (스트리밍 응답 / 파일 쓰기 공용)"""
+    yield (f'<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="UTF-8">\n'
+           f'<title>{escape(title)}</title>\n<style>{STYLE}</style>\n</head>\n<body>\n')
+    yield f'<h1>{escape(title)}</h1>\n'
+    yield f'<p class="center">생성 시간: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>\n'
+
+    # 모니터링 기간
+    period = monitoring_period(history_data)
+    if period:
+        start, end, duration = period
+        yield (f'<p>모니터링 기간: {start.strftime("%Y-%m-%d %H:%M:%S")} ~ '
+               f'{end.strftime("%Y-%m-%d %H:%M:%S")} ({duration:.0f}초)</p>\n')
+
+    # 시스템 정보
+    rows = system_info_rows(history_data)
+    if rows:
+        yield '<h2>시스템 정보</h2>\n' + html_table(rows, 'info')
+
+    # 통계 요약
+    rows = resource_stats_rows(history_data)
+    if len(rows) > 1:
+        yield '<h2>리소스 사용량 통계</h2>\n' + html_table(rows, 'stats')
+
+    # 차트
+    for chart_title, series, percent in CHARTS:
+        datasets = [
+            (label, history_data[key], COLORS[i % len(COLORS)])
+            for i, (key, label) in enumerate(series)
+            if history_data.get(key) and len(history_data[key]) > 1
+        ]
+        if datasets:
+            yield f'<h2>{escape(chart_title)}</h2>\n' + svg_chart(datasets, percent)
+
+    # 디스크 파티션
+    rows = partition_rows(history_data)
+    if rows:
+        yield '<h2>디스크 파티션 상태</h2>\n' + html_table(rows, 'disk')
+
+    # 추세 / 용량 예측
+    rows = forecast_rows(history_data)
+    if rows:
+        yield ('<h2>추세 / 용량 예측</h2>\n<p>선형 추세 + 하루 주기 기준, 한계 도달은 하루 중 최고점이 '
+               '100%에 닿는 날짜입니다.</p>\n' + html_table(rows, 'forecast'))
+
+    # 버스트 캡처 (최근 캡처는 원래 해상도로 확대)
+    rows = capture_rows(history_data)
+    if rows:
+        yield '<h2>버스트 캡처</h2>\n' + html_table(rows, 'capture')
+        for event in history_data['captures'][-REPORT_CAPTURES:]:
+            yield from iter_capture_section(event)
+
+    yield '</body>\n</html>\n'
+
+
+def generate_html_report(history_data, output_path):
+    """HTML 보고서 파일 생성"""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for chunk in iter_html_report(history_data):
+            f.write(chunk)
+    return output_path
@@ -18,6 +18,12 @@ import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from collections import defaultdict
 
+from report.statistics import (
+    REPORT_CAPTURES, monitoring_period, system_info_rows, resource_stats_rows, partition_rows,
+    capture_rows, process_snapshot_rows, forecast_rows
+)
+from storage.captures import capture_label
+
 
 # 한글 폰트 설정
 plt.rcParams['font.family'] = 'Malgun Gothic'
@@ -130,25 +136,18 @@ def generate_pdf_report(history_data, output_path):
     elements.append(Spacer(1, 20))
     
     # 모니터링 기간
-    if history_data['cpu']:
-        start_time = history_data['cpu'][0]['time'].strftime('%H:%M:%S')
-        end_time = history_data['cpu'][-1]['time'].strftime('%H:%M:%S')
-        duration = len(history_data['cpu'])
-        elements.append(Paragraph(f"모니터링 기간: {start_time} ~ {end_time} ({duration}초)", normal_style))
+    period = monitoring_period(history_data)
+    if period:
+        start, end, duration = period
+        elements.append(Paragraph(f"모니터링 기간: {start.strftime('%H:%M:%S')} ~ {end.strftime('%H:%M:%S')} "
+                                  f"({duration:.0f}초)", normal_style))
     
     elements.append(Spacer(1, 20))
     
     # 시스템 정보 테이블
-    if history_data.get('system_info'):
+    sys_data = system_info_rows(history_data)
+    if sys_data:
         elements.append(Paragraph("시스템 정보", heading_style))
-        sys_info = history_data['system_info']
-        sys_data = [
-            ['항목', '값'],
-            ['호스트명', sys_info.get('hostname', 'N/A')],
-            ['OS', f"{sys_info.get('platform', 'N/A')} {sys_info.get('platform_release', '')}"],
-            ['프로세서', sys_info.get('processor', 'N/A')],
-            ['부팅 시간', sys_info.get('boot_time', 'N/A')],
-        ]
         
         sys_table = Table(sys_data, colWidths=[4*cm, 12*cm])
         sys_table.setStyle(TableStyle([
@@ -167,17 +166,7 @@ def generate_pdf_report(history_data, output_path):
     # 통계 요약
     elements.append(Paragraph("리소스 사용량 통계", heading_style))
     
-    stats_data = [['리소스', '평균', '최소', '최대']]
-    
-    for key, label in [('cpu', 'CPU (%)'), ('memory', '메모리 (%)'), 
-                       ('network_sent', '네트워크 송신 (MB/s)'), 
-                       ('network_recv', '네트워크 수신 (MB/s)')]:
-        if history_data.get(key) and len(history_data[key]) > 0:
-            values = [d['value'] for d in history_data[key]]
-            avg = sum(values) / len(values)
-            min_val = min(values)
-            max_val = max(values)
-            stats_data.append([label, f"{avg:.2f}", f"{min_val:.2f}", f"{max_val:.2f}"])
+    stats_data = resource_stats_rows(history_data)
     
     if len(stats_data) > 1:
         stats_table = Table(stats_data, colWidths=[5*cm, 3*cm, 3*cm, 3*cm])
@@ -197,11 +186,13 @@ def generate_pdf_report(history_data, output_path):
     
     # 차트 섹션
     temp_dir = os.path.dirname(output_path)
+    # 동시에 여러 보고서(세션)를 만들 수 있으므로 임시 차트 파일 이름에 보고서 이름을 붙임
+    chart_prefix = os.path.splitext(os.path.basename(output_path))[0]
     
     # CPU 사용량 차트
     if history_data.get('cpu') and len(history_data['cpu']) > 1:
         elements.append(Paragraph("CPU 사용량 추이", heading_style))
-        cpu_chart = os.path.join(temp_dir, 'cpu_chart.png')
+        cpu_chart = os.path.join(temp_dir, f'{chart_prefix}_cpu_chart.png')
         create_chart(history_data['cpu'], 'CPU 사용량 (%)', '사용률 (%)', cpu_chart)
         elements.append(Image(cpu_chart, width=16*cm, height=6*cm))
         elements.append(Spacer(1, 20))
@@ -209,7 +200,7 @@ def generate_pdf_report(history_data, output_path):
     # 메모리 사용량 차트
     if history_data.get('memory') and len(history_data['memory']) > 1:
         elements.append(Paragraph("메모리 사용량 추이", heading_style))
-        mem_chart = os.path.join(temp_dir, 'memory_chart.png')
+        mem_chart = os.path.join(temp_dir, f'{chart_prefix}_memory_chart.png')
         create_chart(history_data['memory'], '메모리 사용량 (%)', '사용률 (%)', mem_chart)
         elements.append(Image(mem_chart, width=16*cm, height=6*cm))
         elements.append(Spacer(1, 20))
@@ -218,7 +209,7 @@ def generate_pdf_report(history_data, output_path):
     if (history_data.get('network_sent') and history_data.get('network_recv') and 
         len(history_data['network_sent']) > 1):
         elements.append(Paragraph("네트워크 트래픽 추이", heading_style))
-        net_chart = os.path.join(temp_dir, 'network_chart.png')
+        net_chart = os.path.join(temp_dir, f'{chart_prefix}_network_chart.png')
         create_multi_chart(
             [history_data['network_sent'], history_data['network_recv']],
             '네트워크 트래픽 (MB/s)',
@@ -234,7 +225,7 @@ def generate_pdf_report(history_data, output_path):
         len(history_data['disk_read']) > 1):
         elements.append(PageBreak())
         elements.append(Paragraph("디스크 I/O 추이", heading_style))
-        disk_chart = os.path.join(temp_dir, 'disk_chart.png')
+        disk_chart = os.path.join(temp_dir, f'{chart_prefix}_disk_chart.png')
         create_multi_chart(
             [history_data['disk_read'], history_data['disk_write']],
             '디스크 I/O (MB/s)',
@@ -248,25 +239,16 @@ def generate_pdf_report(history_data, output_path):
     # GPU 정보
     if history_data.get('gpu') and len(history_data['gpu']) > 1:
         elements.append(Paragraph("GPU 사용량 추이", heading_style))
-        gpu_chart = os.path.join(temp_dir, 'gpu_chart.png')
+        gpu_chart = os.path.join(temp_dir, f'{chart_prefix}_gpu_chart.png')
         create_chart(history_data['gpu'], 'GPU 사용량 (%)', '사용률 (%)', gpu_chart)
         elements.append(Image(gpu_chart, width=16*cm, height=6*cm))
     
     # 디스크 사용량 테이블
-    if history_data.get('disk_partitions'):
+    disk_data = partition_rows(history_data)
+    if disk_data:
         elements.append(PageBreak())
         elements.append(Paragraph("디스크 파티션 상태", heading_style))
         
-        disk_data = [['드라이브', '파일시스템', '전체', '사용', '사용률']]
-        for part in history_data['disk_partitions']:
-            disk_data.append([
-                part['mountpoint'],
-                part['fstype'],
-                f"{part['total'] / (1024**3):.1f} GB",
-                f"{part['used'] / (1024**3):.1f} GB",
-                f"{part['percent']:.1f}%"
-            ])
-        
         disk_table = Table(disk_data, colWidths=[3*cm, 3*cm, 3*cm, 3*cm, 2.5*cm])
         disk_table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#9b59b6')),
@@ -280,13 +262,78 @@ def generate_pdf_report(history_data, output_path):
         ]))
         elements.append(disk_table)
     
+    # 추세 / 용량 예측
+    forecast_data = forecast_rows(history_data)
+    if forecast_data:
+        elements.append(Spacer(1, 20))
+        elements.append(Paragraph("추세 / 용량 예측", heading_style))
+        elements.append(Paragraph("선형 추세 + 하루 주기 기준, 한계 도달은 하루 중 최고점이 100%에 닿는 날짜입니다.",
+                                  normal_style))
+        forecast_table = Table(forecast_data, colWidths=[3.8*cm, 2*cm, 2*cm, 2.2*cm, 3.6*cm, 2*cm])
+        forecast_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#c0392b')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#ecf0f1')]),
+        ]))
+        elements.append(forecast_table)
+    
+    # 버스트 캡처 (최근 캡처는 원래 해상도 차트 + 프로세스 스냅샷)
+    capture_charts = []
+    capture_data = capture_rows(history_data)
+    if capture_data:
+        capture_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e67e22')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#ecf0f1')]),
+        ])
+        elements.append(PageBreak())
+        elements.append(Paragraph("버스트 캡처", heading_style))
+        capture_table = Table(capture_data, colWidths=[4*cm, 2*cm, 2.5*cm, 2*cm, 2*cm, 2.5*cm])
+        capture_table.setStyle(capture_style)
+        elements.append(capture_table)
+        
+        for event in history_data['captures'][-REPORT_CAPTURES:]:
+            series = event['series']
+            elements.append(Paragraph(capture_label(event), normal_style))
+            if len(series.get('cpu') or []) > 1:
+                chart = os.path.join(temp_dir, f"{chart_prefix}_capture_{event['id']}_chart.png")
+                create_multi_chart(
+                    [series['cpu'], series['iowait']],
+                    'CPU (%)',
+                    '사용률 (%)',
+                    chart,
+                    legends=['CPU', 'iowait']
+                )
+                capture_charts.append(chart)
+                elements.append(Image(chart, width=16*cm, height=6*cm))
+            
+            proc_data = process_snapshot_rows(event)
+            if proc_data:
+                proc_table = Table(proc_data, colWidths=[2*cm, 5*cm, 3*cm, 2.5*cm, 2.5*cm])
+                proc_table.setStyle(capture_style)
+                elements.append(proc_table)
+            elements.append(Spacer(1, 20))
+    
     # PDF 생성
     doc.build(elements)
     
     # 임시 차트 파일 삭제
     for f in ['cpu_chart.png', 'memory_chart.png', 'network_chart.png', 
               'disk_chart.png', 'gpu_chart.png']:
-        path = os.path.join(temp_dir, f)
+        path = os.path.join(temp_dir, f'{chart_prefix}_{f}')
+        if os.path.exists(path):
+            os.remove(path)
+    for path in capture_charts:
         if os.path.exists(path):
             os.remove(path)
     
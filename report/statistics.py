@@ -0,0 +1,172 @@
+"""
+보고서 공용 통계
+PDF / HTML 보고서가 같은 표를 사용하도록 히스토리에서 표 데이터를 계산
+"""
+
+from storage.blocks import NUMPY_AVAILABLE
+from storage.series import Series
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+# 보고서에 확대 차트를 넣는 최근 버스트 캡처 수
+REPORT_CAPTURES = 5
+
+# 예측 표에 넣는 시리즈 수 (한계 도달이 가까운 순)
+REPORT_FORECASTS = 20
+
+# 통계 표에 표시하는 기본 시리즈
+STAT_SERIES = [
+    ('cpu', 'CPU (%)'),
+    ('memory', '메모리 (%)'),
+    ('network_sent', '네트워크 송신 (MB/s)'),
+    ('network_recv', '네트워크 수신 (MB/s)')
+]
+
+
+def monitoring_period(history_data):
+    """(시작, 종료, 초) - 데이터가 없으면 None
+
+    적응형 수집은 샘플 간격이 일정하지 않으므로 실제 시간 범위로 계산한다.
+    """
+    cpu = history_data.get('cpu')
+    if not cpu:
+        return None
+    start = cpu[0]['time']
+    end = cpu[-1]['time']
+    return start, end, (end - start).total_seconds()
+
+
+def system_info_rows(history_data):
+    """시스템 정보 표 (헤더 포함, 정보가 없으면 빈 리스트)"""
+    sys_info = history_data.get('system_info')
+    if not sys_info:
+        return []
+    return [
+        ['항목', '값'],
+        ['호스트명', sys_info.get('hostname', 'N/A')],
+        ['OS', f"{sys_info.get('platform', 'N/A')} {sys_info.get('platform_release', '')}"],
+        ['프로세서', sys_info.get('processor', 'N/A')],
+        ['부팅 시간', sys_info.get('boot_time', 'N/A')],
+    ]
+
+
+def series_stats(data):
+    """(평균, 최소, 최대) - 샘플이 대표하는 수집 간격으로 가중 평균 (고정 주기면 단순 평균과 같음)"""
+    if isinstance(data, Series) and NUMPY_AVAILABLE:
+        # 압축 시리즈는 포인트 dict를 만들지 않고 블록을 배열로 바로 디코딩
+        _, values, intervals = data.arrays()
+        weights = np.where(intervals > 0, intervals, 1)
+        return float(np.dot(values, weights) / weights.sum()), float(values.min()), float(values.max())
+
+    values = [d['value'] for d in data]
+    weights = [d.get('interval', 1) for d in data]
+    avg = sum(v * w for v, w in zip(values, weights)) / sum(weights)
+    return avg, min(values), max(values)
+
+
+def resource_stats_rows(history_data):
+    """리소스 사용량 통계 표 (헤더 포함, cgroup 시리즈 포함)"""
+    # cgroup 시리즈 ('cgroup:<경로>:<지표>')
+    cgroup_keys = sorted(k for k in history_data if k.startswith('cgroup:'))
+
+    rows = [['리소스', '평균', '최소', '최대']]
+    for key, label in STAT_SERIES + [(k, k[len('cgroup:'):]) for k in cgroup_keys]:
+        if history_data.get(key):
+            avg, min_val, max_val = series_stats(history_data[key])
+            rows.append([label, f"{avg:.2f}", f"{min_val:.2f}", f"{max_val:.2f}"])
+    return rows
+
+
+def partition_rows(history_data):
+    """디스크 파티션 표 (헤더 포함, 정보가 없으면 빈 리스트)"""
+    partitions = history_data.get('disk_partitions')
+    if not partitions:
+        return []
+
+    rows = [['드라이브', '파일시스템', '전체', '사용', '사용률']]
+    for part in partitions:
+        rows.append([
+            part['mountpoint'],
+            part['fstype'],
+            f"{part['total'] / (1024**3):.1f} GB",
+            f"{part['used'] / (1024**3):.1f} GB",
+            f"{part['percent']:.1f}%"
+        ])
+    return rows
+
+
+def capture_rows(history_data):
+    """버스트 캡처 표 (헤더 포함, 캡처가 없으면 빈 리스트)"""
+    captures = history_data.get('captures')
+    if not captures:
+        return []
+
+    rows = [['시각', '트리거', '시리즈', '값', '구간', '최대 CPU (%)']]
+    for event in captures:
+        trigger = event['trigger']
+        cpu = event['series'].get('cpu') or [{'value': 0.0}]
+        rows.append([
+            event['time'].strftime('%Y-%m-%d %H:%M:%S'),
+            trigger['reason'],
+            trigger['series'] or '-',
+            f"{trigger['value']:.1f}" if trigger['value'] is not None else '-',
+            f"{(event['end'] - event['start']).total_seconds():.1f}초",
+            f"{max(d['value'] for d in cpu):.1f}"
+        ])
+    return rows
+
+
+def process_snapshot_rows(event, limit=10):
+    """캡처 시점 프로세스 표 (헤더 포함, 스냅샷이 없으면 빈 리스트)"""
+    processes = event.get('processes')
+    if not processes:
+        return []
+
+    rows = [['PID', '이름', '사용자', 'CPU (%)', '메모리 (%)']]
+    for proc in processes[:limit]:
+        rows.append([
+            proc['pid'],
+            proc['name'],
+            proc['user'] or '-',
+            f"{proc['cpu_percent']:.1f}",
+            f"{proc['memory_percent']:.1f}"
+        ])
+    return rows
+
+
+def forecast_label(result):
+    """예측 시리즈 이름 → 표시 이름 ('disk_usage:/data' → '디스크 /data (%)')"""
+    name = result['series']
+    if result['kind'] == 'disk_usage':
+        label = f"디스크 {name[len('disk_usage:'):]}"
+    elif result['kind'] == 'nic':
+        interface, direction = name[len('nic:'):].rsplit(':', 1)
+        label = f"{interface} {'송신' if direction == 'sent' else '수신'}"
+    else:
+        label = '메모리'
+    return f"{label} ({result['unit']})"
+
+
+def forecast_rows(history_data, limit=REPORT_FORECASTS):
+    """추세 / 용량 예측 표 (헤더 포함, 예측이 없으면 빈 리스트)"""
+    forecasts = history_data.get('forecasts')
+    if not forecasts:
+        return []
+
+    rows = [['시리즈', '현재 추세', '주당 변화', '하루 변동 폭', '한계 도달', '관측 기간']]
+    for result in forecasts[:limit]:
+        if result['limit_at'] is not None:
+            limit_text = f"{result['limit_at'].strftime('%Y-%m-%d')} ({result['days_to_limit']:.0f}일)"
+        else:
+            limit_text = '-'
+        rows.append([
+            forecast_label(result),
+            f"{result['baseline']:.2f}",
+            f"{result['per_week']:+.2f}",
+            f"{result['daily_range']:.2f}" if result['seasonal'] else '-',
+            limit_text,
+            f"{result['span_days']:.1f}일"
+        ])
+    return rows
@@ -9,29 +9,93 @@ Chart.defaults.borderColor = 'rgba(255, 255, 255, 0.1)';
 // 차트 인스턴스
 let cpuChart, memoryChart, networkChart, diskChart;
 
-// 차트 데이터 히스토리
+/**
+ * 고정 크기 링 버퍼 (typed array)
+ * push는 O(1)이며, 가득 차면 가장 오래된 값을 덮어쓴다.
+ */
+class RingBuffer {
+    constructor(capacity) {
+        this.capacity = capacity;
+        this.times = new Float64Array(capacity);
+        this.values = new Float32Array(capacity);
+        this.start = 0;
+        this.length = 0;
+    }
+
+    push(time, value) {
+        const index = (this.start + this.length) % this.capacity;
+        this.times[index] = time;
+        this.values[index] = value;
+        if (this.length < this.capacity) {
+            this.length++;
+        } else {
+            this.start = (this.start + 1) % this.capacity;
+        }
+    }
+
+    clear() {
+        this.start = 0;
+        this.length = 0;
+    }
+
+    // 최근 count개를 Chart.js용 {x, y} 배열로 (parsing: false)
+    toPoints(count = this.length) {
+        const n = Math.min(count, this.length);
+        const offset = this.start + this.length - n;
+        const points = new Array(n);
+        for (let i = 0; i < n; i++) {
+            const index = (offset + i) % this.capacity;
+            points[i] = { x: this.times[index], y: this.values[index] };
+        }
+        return points;
+    }
+}
+
+// 실시간 모드에서 표시하는 포인트 수 (1초 간격)
 const maxDataPoints = 60;
+
+// 링 버퍼 용량 (히스토리 모드 구간 수 이상)
+const bufferCapacity = 2048;
+
+// 히스토리 모드에서 서버에 요청하는 구간 수
+const historyPoints = 600;
+
+// 차트 데이터 히스토리
 const chartData = {
-    cpu: [],
-    memory: [],
-    networkSent: [],
-    networkRecv: [],
-    diskRead: [],
-    diskWrite: [],
-    labels: []
+    cpu: new RingBuffer(bufferCapacity),
+    memory: new RingBuffer(bufferCapacity),
+    networkSent: new RingBuffer(bufferCapacity),
+    networkRecv: new RingBuffer(bufferCapacity),
+    diskRead: new RingBuffer(bufferCapacity),
+    diskWrite: new RingBuffer(bufferCapacity)
 };
 
+// 표시 기간 (초, 0 = 실시간, -1 = 버스트 캡처)
+let historyWindow = 0;
+let historyTimer = null;
+let historyCapture = null;
+
+// 한 프레임에 한 번만 차트를 갱신하기 위한 플래그
+let chartUpdatePending = false;
+
 // 차트 초기화
 function initCharts() {
     const chartOptions = {
         responsive: true,
         maintainAspectRatio: false,
-        animation: { duration: 300 },
+        animation: false,
+        parsing: false,
+        normalized: true,
         scales: {
             x: {
+                type: 'time',
                 display: true,
                 grid: { display: false },
-                ticks: { maxTicksLimit: 10 }
+                time: {
+                    tooltipFormat: 'HH:mm:ss',
+                    displayFormats: { second: 'HH:mm:ss', minute: 'HH:mm', hour: 'HH:mm' }
+                },
+                ticks: { maxTicksLimit: 10, maxRotation: 0 }
             },
             y: {
                 beginAtZero: true,
@@ -40,7 +104,9 @@ function initCharts() {
             }
         },
         plugins: {
-            legend: { display: false }
+            legend: { display: false },
+            // 긴 기간은 LTTB로 간추려 그림
+            decimation: { enabled: true, algorithm: 'lttb', samples: 500 }
         },
         elements: {
             point: { radius: 0 },
@@ -52,7 +118,6 @@ function initCharts() {
     cpuChart = new Chart(document.getElementById('cpuChart'), {
         type: 'line',
         data: {
-            labels: [],
             datasets: [{
                 label: 'CPU %',
                 data: [],
@@ -69,7 +134,6 @@ function initCharts() {
     memoryChart = new Chart(document.getElementById('memoryChart'), {
         type: 'line',
         data: {
-            labels: [],
             datasets: [{
                 label: 'Memory %',
                 data: [],
@@ -82,14 +146,15 @@ function initCharts() {
         options: { ...chartOptions }
     });
 
-    // 네트워크 차트
-    const networkOptions = { ...chartOptions };
-    networkOptions.scales.y.max = undefined;
+    // 네트워크 차트 (y축 상한 없음)
+    const networkOptions = {
+        ...chartOptions,
+        scales: { ...chartOptions.scales, y: { ...chartOptions.scales.y, max: undefined } }
+    };
     
     networkChart = new Chart(document.getElementById('networkChart'), {
         type: 'line',
         data: {
-            labels: [],
             datasets: [
                 {
                     label: '송신 MB/s',
@@ -112,6 +177,7 @@ function initCharts() {
         options: {
             ...networkOptions,
             plugins: {
+                ...chartOptions.plugins,
                 legend: { display: true, position: 'top' }
             }
         }
@@ -121,7 +187,6 @@ function initCharts() {
     diskChart = new Chart(document.getElementById('diskChart'), {
         type: 'line',
         data: {
-            labels: [],
             datasets: [
                 {
                     label: '읽기 MB/s',
@@ -144,6 +209,7 @@ function initCharts() {
         options: {
             ...networkOptions,
             plugins: {
+                ...chartOptions.plugins,
                 legend: { display: true, position: 'top' }
             }
         }
@@ -159,6 +225,13 @@ function formatBytes(bytes) {
     return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
 }
 
+// HTML 이스케이프 (프로세스 / cgroup 이름, 캡처 사유 등 외부에서 온 문자열을 innerHTML에 넣을 때)
+function escapeHtml(text) {
+    return String(text).replace(/[&<>"']/g, ch => ({
+        '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+    })[ch]);
+}
+
 // 시간 포맷
 function formatTime(seconds) {
     const mins = Math.floor(seconds / 60);
@@ -166,14 +239,28 @@ function formatTime(seconds) {
     return `${mins.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
 }
 
+// 호스트 메타데이터 (시스템 정보, 인터페이스, 파티션 목록) - 버전이 바뀔 때만 다시 받음
+let hostMeta = null;
+let metaVersion = null;
+
+async function loadMeta(version) {
+    try {
+        const response = await fetch('/api/meta');
+        hostMeta = await response.json();
+        metaVersion = version;
+        document.getElementById('hostname').textContent = hostMeta.system.hostname;
+    } catch (error) {
+        console.error('메타데이터 로드 오류:', error);
+    }
+}
+
 // 데이터 업데이트
 async function updateData() {
     try {
         const response = await fetch('/api/data');
         const data = await response.json();
         
-        const now = new Date();
-        const timeLabel = now.toLocaleTimeString('ko-KR', { hour12: false });
+        const now = Date.now();
         
         // CPU 업데이트
         document.getElementById('cpuValue').textContent = data.cpu.usage_percent.toFixed(1);
@@ -210,76 +297,152 @@ async function updateData() {
         document.getElementById('netTotalSent').textContent = formatBytes(data.network.bytes_sent);
         document.getElementById('netTotalRecv').textContent = formatBytes(data.network.bytes_recv);
         
-        // 차트 데이터 추가
-        chartData.labels.push(timeLabel);
-        chartData.cpu.push(data.cpu.usage_percent);
-        chartData.memory.push(data.memory.percent);
-        chartData.networkSent.push(data.network.speed_sent);
-        chartData.networkRecv.push(data.network.speed_recv);
-        
-        // 디스크 I/O (간단히 0으로 설정, 실제로는 이전 값과 비교 필요)
-        chartData.diskRead.push(0);
-        chartData.diskWrite.push(0);
-        
-        // 최대 데이터 포인트 유지
-        if (chartData.labels.length > maxDataPoints) {
-            chartData.labels.shift();
-            chartData.cpu.shift();
-            chartData.memory.shift();
-            chartData.networkSent.shift();
-            chartData.networkRecv.shift();
-            chartData.diskRead.shift();
-            chartData.diskWrite.shift();
+        // 차트 데이터 추가 (히스토리 모드에서는 서버 다운샘플링 데이터를 주기적으로 다시 받음)
+        if (historyWindow === 0) {
+            chartData.cpu.push(now, data.cpu.usage_percent);
+            chartData.memory.push(now, data.memory.percent);
+            chartData.networkSent.push(now, data.network.speed_sent);
+            chartData.networkRecv.push(now, data.network.speed_recv);
+            chartData.diskRead.push(now, data.disk.speed_read);
+            chartData.diskWrite.push(now, data.disk.speed_write);
+            
+            scheduleChartUpdate();
         }
         
-        // 차트 업데이트
-        updateCharts();
-        
         // 디스크 파티션
         updateDiskPartitions(data.disk.partitions);
         
         // 프로세스 테이블
         updateProcessTable(data.processes);
+        updateProcessGroups();
         
-        // 시스템 정보
-        updateSystemInfo(data.system);
+        // cgroup 테이블
+        updateCgroupTable(data.cgroups || {});
         
-        // 호스트명
-        document.getElementById('hostname').textContent = data.system.hostname;
+        // 시스템 정보 (정적 정보 + 가동 시간 / 프로세스 수)
+        if (data.meta_version !== metaVersion) {
+            await loadMeta(data.meta_version);
+        }
+        if (hostMeta) {
+            updateSystemInfo({ ...hostMeta.system, ...data.system });
+        }
         
     } catch (error) {
         console.error('데이터 업데이트 오류:', error);
     }
 }
 
+// 차트 업데이트 예약 (여러 번 호출돼도 다음 프레임에 한 번만 그림, 백그라운드 탭에서는 멈춤)
+function scheduleChartUpdate() {
+    if (chartUpdatePending) return;
+    chartUpdatePending = true;
+    requestAnimationFrame(updateCharts);
+}
+
 // 차트 업데이트
 function updateCharts() {
-    cpuChart.data.labels = chartData.labels;
-    cpuChart.data.datasets[0].data = chartData.cpu;
+    chartUpdatePending = false;
+    const count = historyWindow === 0 ? maxDataPoints : bufferCapacity;
+    
+    cpuChart.data.datasets[0].data = chartData.cpu.toPoints(count);
     cpuChart.update('none');
     
-    memoryChart.data.labels = chartData.labels;
-    memoryChart.data.datasets[0].data = chartData.memory;
+    memoryChart.data.datasets[0].data = chartData.memory.toPoints(count);
     memoryChart.update('none');
     
-    networkChart.data.labels = chartData.labels;
-    networkChart.data.datasets[0].data = chartData.networkSent;
-    networkChart.data.datasets[1].data = chartData.networkRecv;
+    networkChart.data.datasets[0].data = chartData.networkSent.toPoints(count);
+    networkChart.data.datasets[1].data = chartData.networkRecv.toPoints(count);
     networkChart.update('none');
     
-    diskChart.data.labels = chartData.labels;
-    diskChart.data.datasets[0].data = chartData.diskRead;
-    diskChart.data.datasets[1].data = chartData.diskWrite;
+    diskChart.data.datasets[0].data = chartData.diskRead.toPoints(count);
+    diskChart.data.datasets[1].data = chartData.diskWrite.toPoints(count);
     diskChart.update('none');
 }
 
+// 서버 다운샘플링 히스토리로 링 버퍼 채우기
+async function loadHistory() {
+    try {
+        const url = historyCapture !== null
+            ? `/api/history?capture=${historyCapture}`
+            : `/api/history?window=${historyWindow}&points=${historyPoints}`;
+        const response = await fetch(url);
+        const history = await response.json();
+        
+        const series = {
+            cpu: 'cpu',
+            memory: 'memory',
+            networkSent: 'network_sent',
+            networkRecv: 'network_recv',
+            diskRead: 'disk_read',
+            diskWrite: 'disk_write'
+        };
+        for (const [key, name] of Object.entries(series)) {
+            const buffer = chartData[key];
+            buffer.clear();
+            for (const point of history[name] || []) {
+                buffer.push(Date.parse(point.time), point.value);
+            }
+        }
+        
+        scheduleChartUpdate();
+    } catch (error) {
+        console.error('히스토리 로드 오류:', error);
+    }
+}
+
+// 표시 기간 변경 ('capture:<id>'는 버스트 캡처 구간을 원래 해상도로 한 번만 받음)
+function changeHistoryWindow(value) {
+    historyCapture = value.startsWith('capture:') ? Number(value.slice(8)) : null;
+    historyWindow = historyCapture !== null ? -1 : Number(value);
+    clearInterval(historyTimer);
+    historyTimer = null;
+    
+    for (const buffer of Object.values(chartData)) {
+        buffer.clear();
+    }
+    
+    if (historyCapture !== null) {
+        loadHistory();
+    } else if (historyWindow > 0) {
+        loadHistory();
+        // 구간 폭마다 (최소 10초) 다시 받아옴
+        const refresh = Math.max(historyWindow / historyPoints, 10) * 1000;
+        historyTimer = setInterval(loadHistory, refresh);
+    }
+    scheduleChartUpdate();
+}
+
+// 버스트 캡처 목록으로 표시 기간 선택지 갱신
+async function updateCaptureOptions() {
+    try {
+        const response = await fetch('/api/captures');
+        const captures = await response.json();
+        
+        const group = document.getElementById('captureOptions');
+        const select = document.getElementById('historyWindow');
+        const selected = select.value;
+        group.innerHTML = captures.slice().reverse().map(c => {
+            const time = new Date(c.time).toLocaleTimeString('ko-KR', { hour12: false });
+            const detail = c.series ? ` ${escapeHtml(c.series)} ${c.value.toFixed(1)}` : '';
+            return `<option value="capture:${c.id}">${time} ${escapeHtml(c.reason)}${detail}</option>`;
+        }).join('');
+        group.hidden = captures.length === 0;
+        // 선택했던 캡처가 밀려났으면 목록에서 사라져도 차트는 그대로 둠
+        if ([...select.options].some(o => o.value === selected)) {
+            select.value = selected;
+        }
+    } catch (error) {
+        console.error('캡처 목록 오류:', error);
+    }
+}
+
 // 디스크 파티션 업데이트
 function updateDiskPartitions(partitions) {
     const container = document.getElementById('diskPartitions');
     container.innerHTML = partitions.map(p => `
         <div class="disk-item">
             <div class="disk-item-header">
-                <span class="drive">${p.mountpoint}</span>
+                <span class="drive">${escapeHtml(p.mountpoint)}</span>
                 <span>${formatBytes(p.used)} / ${formatBytes(p.total)}</span>
             </div>
             <div class="disk-progress">
@@ -295,13 +458,71 @@ function updateProcessTable(processes) {
     tbody.innerHTML = processes.map(p => `
         <tr>
             <td>${p.pid}</td>
-            <td>${p.name.substring(0, 30)}</td>
+            <td>${escapeHtml(p.name.substring(0, 30))}</td>
             <td>${p.cpu_percent.toFixed(1)}%</td>
             <td>${p.memory_percent.toFixed(1)}%</td>
         </tr>
     `).join('');
 }
 
+// 프로세스 그룹 기준 ('' = 개별 프로세스)
+let processGroupBy = '';
+
+// 프로세스 그룹 테이블 업데이트
+async function updateProcessGroups() {
+    if (!processGroupBy) return;
+    try {
+        const response = await fetch(`/api/processes/groups?by=${processGroupBy}&limit=10`);
+        const groups = await response.json();
+        
+        const tbody = document.getElementById('processGroupTable');
+        tbody.innerHTML = groups.map(g => `
+        <tr>
+            <td>${escapeHtml(g.group.substring(0, 40))}</td>
+            <td>${g.count}</td>
+            <td>${g.cpu_percent.toFixed(1)}%</td>
+            <td>${formatBytes(g.rss)}</td>
+            <td>${g.read_rate.toFixed(2)} / ${g.write_rate.toFixed(2)}</td>
+            <td>${g.num_fds}</td>
+        </tr>
+    `).join('');
+    } catch (error) {
+        console.error('프로세스 그룹 업데이트 오류:', error);
+    }
+}
+
+// 프로세스 그룹 기준 변경
+function changeProcessGroupBy(by) {
+    processGroupBy = by;
+    document.getElementById('processView').style.display = by ? 'none' : '';
+    document.getElementById('processGroupView').style.display = by ? '' : 'none';
+    updateProcessGroups();
+}
+
+// cgroup 테이블 업데이트
+function updateCgroupTable(cgroups) {
+    const names = Object.keys(cgroups);
+    document.getElementById('cgroupSection').style.display = names.length ? '' : 'none';
+    
+    const fmt = (value, digits = 1) => value === undefined || value === null ? '-' : value.toFixed(digits);
+    const tbody = document.getElementById('cgroupTable');
+    tbody.innerHTML = names.map(name => {
+        const c = cgroups[name];
+        const memory = c.memory_current === undefined ? '-' :
+            formatBytes(c.memory_current) + (c.memory_max ? ` / ${formatBytes(c.memory_max)}` : '');
+        return `
+        <tr>
+            <td>${escapeHtml(name)}</td>
+            <td>${fmt(c.cpu_percent)}%</td>
+            <td>${fmt(c.throttled_percent)}%</td>
+            <td>${memory}</td>
+            <td>${fmt(c.io_read, 2)} / ${fmt(c.io_write, 2)}</td>
+            <td>${fmt(c.cpu_pressure)} / ${fmt(c.memory_pressure)} / ${fmt(c.io_pressure)}</td>
+        </tr>
+    `;
+    }).join('');
+}
+
 // 시스템 정보 업데이트
 function updateSystemInfo(system) {
     const container = document.getElementById('systemInfo');
@@ -427,9 +648,11 @@ document.addEventListener('DOMContentLoaded', () => {
     updateData();
     updateStatus();
     updateDateTime();
+    updateCaptureOptions();
     
     // 1초마다 데이터 업데이트
     setInterval(updateData, 1000);
     setInterval(updateStatus, 1000);
     setInterval(updateDateTime, 1000);
+    setInterval(updateCaptureOptions, 10000);
 });
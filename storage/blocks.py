@@ -0,0 +1,208 @@
+"""
+압축 시계열 블록
+가득 찬 구간을 Gorilla 방식(시간은 delta-of-delta, 값은 직전 값과 XOR)으로 봉인한 바이트 블록
+
+비트 단위 Gorilla 인코딩은 순차적으로만 풀 수 있으므로, 필드를 바이트 단위로 정렬해
+numpy로 블록 전체를 한 번에 디코딩한다. 대신 바이트 스트림에 zlib를 한 번 더 적용해
+변하지 않는 값(헤더 0 바이트의 연속)을 비트 단위 인코딩과 비슷한 크기로 줄인다.
+
+블록 구조 (zlib 압축 전):
+    헤더        <개수 uint32><첫 시간 int64 ms>
+    시간        delta-of-delta의 zigzag varint (개수 - 1개)
+    값          XOR 헤더 n바이트 (상위 4비트: 뒤쪽 0 바이트 수, 하위 4비트: 유효 바이트 수) + 유효 바이트
+    수집 간격    값과 같은 형식 (간격이 없는 포인트는 0)
+"""
+
+import struct
+import zlib
+from datetime import datetime, timedelta
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# 블록 하나에 봉인하는 포인트 수
+BLOCK_SIZE = 256
+
+# 블록에 저장하는 시간 해상도 (밀리초)
+EPOCH = datetime(1970, 1, 1)
+MILLISECOND = timedelta(milliseconds=1)
+
+HEADER = struct.Struct('<Iq')
+SECTION = struct.Struct('<III')
+
+ZLIB_LEVEL = 6
+
+
+def to_millis(t):
+    """datetime → EPOCH 기준 밀리초 (타임존 없는 로컬 시간 그대로)"""
+    return (t - EPOCH) // MILLISECOND
+
+
+def require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError('numpy is required for compressed series blocks')
+
+
+# ---------- varint (zigzag) ----------
+
+def encode_varints(values):
+    """int64 배열 → zigzag varint 바이트"""
+    zigzag = ((values << 1) ^ (values >> 63)).astype(np.uint64)
+    groups = np.empty((len(zigzag), 10), dtype=np.uint8)
+    lengths = np.ones(len(zigzag), dtype=np.int64)
+    for k in range(10):
+        part = (zigzag >> np.uint64(7 * k)) & np.uint64(0x7F)
+        groups[:, k] = part
+        if k:
+            lengths[(zigzag >> np.uint64(7 * k)) != 0] = k + 1
+
+    column = np.arange(10)
+    groups[column < (lengths[:, None] - 1)] |= 0x80
+    return groups[column < lengths[:, None]].tobytes()
+
+
+def decode_varints(data, count):
+    """zigzag varint 바이트 → int64 배열"""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if count == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    ends = (raw & 0x80) == 0
+    starts = np.flatnonzero(np.concatenate(([True], ends[:-1])))
+    group = np.cumsum(ends) - ends
+    position = np.arange(len(raw)) - starts[group]
+
+    parts = (raw & 0x7F).astype(np.uint64) << (np.uint64(7) * position.astype(np.uint64))
+    zigzag = np.add.reduceat(parts, starts)
+    return ((zigzag >> np.uint64(1)).astype(np.int64)) ^ -((zigzag & np.uint64(1)).astype(np.int64))
+
+
+# ---------- XOR float ----------
+
+def encode_floats(values):
+    """float64 배열 → (XOR 헤더, 유효 바이트)"""
+    bits = values.astype('<f8').view('<u8')
+    xor = bits ^ np.concatenate(([np.uint64(0)], bits[:-1]))
+    octets = xor.view(np.uint8).reshape(-1, 8)
+
+    nonzero = octets != 0
+    present = nonzero.any(axis=1)
+    trailing = np.where(present, nonzero.argmax(axis=1), 0)
+    highest = np.where(present, 7 - nonzero[:, ::-1].argmax(axis=1), -1)
+    lengths = highest - trailing + 1
+
+    column = np.arange(8)
+    mask = (column >= trailing[:, None]) & (column <= highest[:, None])
+    headers = ((trailing << 4) | lengths).astype(np.uint8)
+    return headers.tobytes(), octets[mask].tobytes()
+
+
+def decode_floats(headers, payload):
+    """(XOR 헤더, 유효 바이트) → float64 배열"""
+    headers = np.frombuffer(headers, dtype=np.uint8)
+    trailing = (headers >> 4).astype(np.int64)
+    lengths = (headers & 0x0F).astype(np.int64)
+
+    # 유효 바이트 각각이 들어갈 위치 (값 i의 바이트 trailing[i]부터)
+    offsets = np.cumsum(lengths) - lengths
+    positions = np.repeat(np.arange(len(headers)) * 8 + trailing - offsets, lengths) + np.arange(len(payload))
+    octets = np.zeros(len(headers) * 8, dtype=np.uint8)
+    octets[positions] = np.frombuffer(payload, dtype=np.uint8)
+
+    bits = np.bitwise_xor.accumulate(octets.view('<u8'))
+    return bits.view('<f8')
+
+
+# ---------- 블록 ----------
+
+def encode_block(times, values, intervals):
+    """(ms int64, 값, 간격) 배열 → 압축 블록 바이트"""
+    require_numpy()
+    times = np.asarray(times, dtype=np.int64)
+    count = len(times)
+
+    deltas = np.diff(times)
+    dod = np.diff(deltas, prepend=0)
+    time_bytes = encode_varints(dod)
+    value_headers, value_bytes = encode_floats(np.asarray(values, dtype=np.float64))
+    interval_headers, interval_bytes = encode_floats(np.asarray(intervals, dtype=np.float64))
+
+    body = b''.join((
+        SECTION.pack(len(time_bytes), len(value_bytes), len(interval_bytes)),
+        time_bytes, value_headers, value_bytes, interval_headers, interval_bytes
+    ))
+    return HEADER.pack(count, int(times[0])) + zlib.compress(body, ZLIB_LEVEL)
+
+
+def decode_block(data):
+    """압축 블록 바이트 → (ms int64, 값, 간격) 배열"""
+    require_numpy()
+    count, first = HEADER.unpack_from(data)
+    body = zlib.decompress(data[HEADER.size:])
+
+    time_len, value_len, interval_len = SECTION.unpack_from(body)
+    offset = SECTION.size
+    time_bytes = body[offset:offset + time_len]
+    offset += time_len
+    value_headers = body[offset:offset + count]
+    offset += count
+    value_bytes = body[offset:offset + value_len]
+    offset += value_len
+    interval_headers = body[offset:offset + count]
+    offset += count
+    interval_bytes = body[offset:offset + interval_len]
+
+    deltas = np.cumsum(decode_varints(time_bytes, count - 1))
+    times = np.empty(count, dtype=np.int64)
+    times[0] = first
+    times[1:] = first + np.cumsum(deltas)
+
+    return times, decode_floats(value_headers, value_bytes), decode_floats(interval_headers, interval_bytes)
+
+
+def to_points(times, values, intervals):
+    """디코딩한 배열 → 포인트 dict 리스트 (간격이 0이면 생략)"""
+    datetimes = times.astype('datetime64[ms]').tolist()
+    points = []
+    for t, value, interval in zip(datetimes, values.tolist(), intervals.tolist()):
+        point = {'time': t, 'value': value}
+        if interval:
+            point['interval'] = interval
+        points.append(point)
+    return points
+
+
+def from_points(points):
+    """포인트 dict 리스트 → (ms int64, 값, 간격) 배열"""
+    count = len(points)
+    times = np.fromiter((to_millis(p['time']) for p in points), dtype=np.int64, count=count)
+    values = np.fromiter((p['value'] for p in points), dtype=np.float64, count=count)
+    intervals = np.fromiter((p.get('interval', 0) for p in points), dtype=np.float64, count=count)
+    return times, values, intervals
+
+
+class Block:
+    """봉인된 블록 (시간 범위는 디코딩 없이 범위 검색에 사용)"""
+
+    __slots__ = ('start', 'end', 'count', 'data')
+
+    def __init__(self, start, end, count, data):
+        self.start = start
+        self.end = end
+        self.count = count
+        self.data = data
+
+    @classmethod
+    def from_points(cls, points):
+        times, values, intervals = from_points(points)
+        return cls(int(times[0]), int(times[-1]), len(points), encode_block(times, values, intervals))
+
+    def decode(self):
+        return decode_block(self.data)
+
+    def points(self):
+        return to_points(*self.decode())
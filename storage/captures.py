@@ -0,0 +1,97 @@
+"""
+버스트 캡처 저장소
+트리거 전후 고해상도 구간을 일반 히스토리와 분리된 이벤트로 보관
+"""
+
+import threading
+from collections import deque
+from datetime import datetime
+
+
+# 메모리에 보관하는 최근 캡처 수
+MAX_CAPTURES = 50
+
+
+class CaptureStore:
+    """id → 캡처 이벤트 {'id', 'time', 'trigger', 'start', 'end', 'interval', 'series', 'processes'}"""
+
+    def __init__(self, max_captures=MAX_CAPTURES):
+        self.lock = threading.Lock()
+        self.captures = deque(maxlen=max_captures)
+        self.next_id = 1
+
+    def add(self, event):
+        """이벤트에 id를 붙여 저장 (가장 오래된 캡처부터 밀려남)"""
+        with self.lock:
+            event = {'id': self.next_id, **event}
+            self.next_id += 1
+            self.captures.append(event)
+            return event
+
+    def get(self, capture_id):
+        with self.lock:
+            for event in self.captures:
+                if event['id'] == capture_id:
+                    return event
+        return None
+
+    def between(self, start=None, end=None):
+        """트리거 시각이 [start, end]인 캡처 목록"""
+        with self.lock:
+            return [
+                event for event in self.captures
+                if (start is None or event['time'] >= start) and (end is None or event['time'] <= end)
+            ]
+
+
+def capture_summary(event):
+    """API 응답용 캡처 요약 (포인트 제외)"""
+    trigger = event['trigger']
+    return {
+        'id': event['id'],
+        'time': event['time'].isoformat(),
+        'start': event['start'].isoformat(),
+        'end': event['end'].isoformat(),
+        'interval': event['interval'],
+        'reason': trigger['reason'],
+        'series': trigger['series'],
+        'value': trigger['value'],
+        'points': len(next(iter(event['series'].values()), []))
+    }
+
+
+def capture_label(event):
+    """보고서 / 대시보드 표시용 한 줄 설명"""
+    trigger = event['trigger']
+    label = f"{event['time'].strftime('%Y-%m-%d %H:%M:%S')} {trigger['reason']}"
+    if trigger['series']:
+        label += f" ({trigger['series']} = {trigger['value']:.1f})"
+    return label
+
+
+def capture_to_json(event):
+    """파일 저장용 직렬화 (시간은 ISO 8601)"""
+    return {
+        **event,
+        'time': event['time'].isoformat(),
+        'start': event['start'].isoformat(),
+        'end': event['end'].isoformat(),
+        'series': {
+            name: [{'time': d['time'].isoformat(), 'value': d['value']} for d in data]
+            for name, data in event['series'].items()
+        }
+    }
+
+
+def capture_from_json(data):
+    """capture_to_json()의 역변환"""
+    return {
+        **data,
+        'time': datetime.fromisoformat(data['time']),
+        'start': datetime.fromisoformat(data['start']),
+        'end': datetime.fromisoformat(data['end']),
+        'series': {
+            name: [{'time': datetime.fromisoformat(d['time']), 'value': d['value']} for d in points]
+            for name, points in data['series'].items()
+        }
+    }
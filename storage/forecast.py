@@ -0,0 +1,342 @@
+"""
+추세 / 용량 예측
+장기 롤업(고정 폭 구간 평균) 위에서 시리즈별로 선형 추세 + 하루 주기 계절성을 맞추고
+한계(사용률 100%)에 도달하는 시점을 추정
+
+모든 시리즈가 같은 구간 격자와 설계 행렬을 공유하므로, 시리즈 수백 개의 가중 최소제곱을
+정규방정식 배치 하나(numpy.linalg.solve)로 푼다.
+"""
+
+import threading
+from datetime import timedelta
+
+from storage.blocks import EPOCH, NUMPY_AVAILABLE, from_points, to_millis
+from storage.series import Series, is_time_series, iter_range
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+FORECAST_AVAILABLE = NUMPY_AVAILABLE
+
+
+# 롤업 구간 폭 (초) / 롤업 보존 기간 (일, 원본 히스토리보다 길게 유지)
+FORECAST_BUCKET = 900
+ROLLUP_RETENTION_DAYS = 28
+
+# 맞추기에 필요한 최소 구간 수 / 하루 주기를 함께 맞추는 최소 관측 기간 (일)
+MIN_BUCKETS = 8
+SEASONAL_MIN_DAYS = 2
+
+# 하루 주기 푸리에 차수 (sin / cos 쌍 개수)
+SEASONAL_HARMONICS = 2
+
+# 하루 주기를 맞추려면 관측이 하루를 SEASONAL_BINS개로 나눈 시간대 중 2×차수+1개 이상에 걸치고,
+# 관측이 없는 시간대가 연속으로 SEASONAL_MAX_GAP개를 넘지 않아야 함 (하루의 절반 이상을 덮도록)
+SEASONAL_BINS = 24
+SEASONAL_MAX_GAP = 12
+
+# 정규방정식 대각에 더하는 릿지 (관측 구간 수에 비례, 거의 특이한 시리즈 안정화)
+RIDGE = 1e-6
+
+# 예측 경로 기본 기간 (일) / 한계 도달 시점을 보고하는 최대 기간 (일)
+FORECAST_HORIZON_DAYS = 7
+MAX_LIMIT_DAYS = 365
+
+DAY = 86400
+
+# 예측 대상 시리즈 종류 → (단위, 한계값)
+FORECAST_KINDS = {
+    'memory': ('%', 100.0),
+    'disk_usage': ('%', 100.0),
+    'nic': ('MB/s', None)
+}
+
+
+def forecast_kind(name):
+    """예측 대상 시리즈의 종류 ('memory', 'disk_usage:<마운트>', 'nic:<인터페이스>:<방향>', 아니면 None)"""
+    kind = name.split(':', 1)[0]
+    if kind not in FORECAST_KINDS or (kind == 'memory') != (name == 'memory'):
+        return None
+    return kind
+
+
+def series_arrays(data, start=None):
+    """시계열(리스트 / Series)의 start 이후 (ms, 값, 가중치) 배열 (간격이 없으면 가중치 1)"""
+    if isinstance(data, Series):
+        times, values, intervals = data.arrays(start)
+    else:
+        times, values, intervals = from_points(list(iter_range(data, start)))
+    return times, values, np.where(intervals > 0, intervals, 1.0)
+
+
+class Rollups:
+    """시리즈별 고정 폭 구간의 (가중 합계, 가중치)
+
+    닫힌 구간(현재 구간 이전)만 더하고, 다음 갱신에서는 마지막으로 닫은 구간 이후
+    포인트만 디코딩한다. 원본 히스토리가 정리돼도 롤업은 retention_days 동안 남는다.
+    """
+
+    def __init__(self, bucket_seconds=FORECAST_BUCKET, retention_days=ROLLUP_RETENTION_DAYS):
+        self.bucket_ms = bucket_seconds * 1000
+        self.retention = int(retention_days * DAY / bucket_seconds)
+        self.series = {}
+        self.closed = None
+        self.version = 0
+
+    def update(self, history, now):
+        """now가 속한 구간 직전까지 새로 닫힌 구간을 더함 (새 구간이 생기면 version 증가)"""
+        current = to_millis(now) // self.bucket_ms
+        if current == self.closed:
+            return self.version
+
+        start = EPOCH + timedelta(milliseconds=int(self.closed * self.bucket_ms)) if self.closed is not None else None
+        limit = current * self.bucket_ms
+        changed = False
+
+        for name, data in list(history.items()):
+            if not forecast_kind(name) or not is_time_series(data):
+                continue
+            times, values, weights = series_arrays(data, start)
+            keep = times < limit
+            if not keep.any():
+                continue
+
+            buckets, inverse = np.unique(times[keep] // self.bucket_ms, return_inverse=True)
+            sums = np.bincount(inverse, values[keep] * weights[keep])
+            totals = np.bincount(inverse, weights[keep])
+            if name in self.series:
+                old = self.series[name]
+                buckets, sums, totals = (np.concatenate((a, b)) for a, b in zip(old, (buckets, sums, totals)))
+            self.series[name] = (buckets, sums, totals)
+            changed = True
+
+        # 보존 기간이 지난 구간 / 롤업이 비어 버린 시리즈 정리
+        oldest = current - self.retention
+        for name, (buckets, sums, totals) in list(self.series.items()):
+            first = np.searchsorted(buckets, oldest)
+            if first == len(buckets):
+                del self.series[name]
+            elif first:
+                self.series[name] = (buckets[first:], sums[first:], totals[first:])
+
+        self.closed = current
+        if changed:
+            self.version += 1
+        return self.version
+
+    def matrix(self, names):
+        """(첫 구간 번호, 평균 행렬, 관측 마스크, 시리즈별 관측 구간 폭) - 행은 시리즈, 열은 구간
+
+        관측이 없는 칸은 평균 0, 마스크 0이다.
+        """
+        rollups = [self.series[name] for name in names]
+        first = min(int(buckets[0]) for buckets, _, _ in rollups)
+        shape = (len(names), self.closed - first)
+
+        rows = np.repeat(np.arange(len(names)), [len(buckets) for buckets, _, _ in rollups])
+        columns = np.concatenate([buckets for buckets, _, _ in rollups]) - first
+        means = np.zeros(shape)
+        observed = np.zeros(shape)
+        means[rows, columns] = np.concatenate([sums / totals for _, sums, totals in rollups])
+        observed[rows, columns] = 1.0
+        spans = np.array([buckets[-1] - buckets[0] + 1 for buckets, _, _ in rollups])
+        return first, means, observed, spans
+
+
+def design(buckets, bucket_ms, reference):
+    """구간 번호 → 설계 행렬 [1, t(일), sin/cos(하루 주기 k차)...]
+
+    t는 reference(마지막으로 닫은 구간 끝) 기준이므로 절편이 곧 현재 추세 값이다.
+    """
+    centers = (buckets + 0.5) * bucket_ms
+    days = (centers - reference) / (DAY * 1000)
+    phase = 2 * np.pi * (centers % (DAY * 1000)) / (DAY * 1000)
+    columns = [np.ones_like(days), days]
+    for k in range(1, SEASONAL_HARMONICS + 1):
+        columns += [np.sin(k * phase), np.cos(k * phase)]
+    return np.stack(columns, axis=1)
+
+
+def seasonal_coverage(first, observed, bucket_ms):
+    """시리즈별로 하루 주기를 맞출 만큼 여러 시간대를 관측했는지 (bool 배열)
+
+    관측한 시간대 수가 2×SEASONAL_HARMONICS+1 이상이고, 하루를 한 바퀴 돌며 관측이 없는
+    시간대가 연속으로 SEASONAL_MAX_GAP개를 넘지 않아야 한다.
+    """
+    width = observed.shape[1]
+    centers = (np.arange(first, first + width) + 0.5) * bucket_ms
+    bins = (centers % (DAY * 1000) * SEASONAL_BINS // (DAY * 1000)).astype(np.int64)
+    onehot = np.zeros((width, SEASONAL_BINS))
+    onehot[np.arange(width), bins] = 1.0
+    occupied = (observed @ onehot) > 0
+
+    # 비어 있는 시간대의 최장 연속 길이 (자정을 넘어 이어지도록 두 바퀴)
+    run = np.zeros(len(observed), dtype=np.int64)
+    gap = np.zeros(len(observed), dtype=np.int64)
+    for column in np.concatenate((occupied, occupied), axis=1).T:
+        run = np.where(column, 0, run + 1)
+        gap = np.maximum(gap, run)
+    return (occupied.sum(axis=1) >= 2 * SEASONAL_HARMONICS + 1) & (gap <= SEASONAL_MAX_GAP)
+
+
+def fit(first, means, observed, spans, bucket_ms):
+    """시리즈별 가중 최소제곱을 한 번에 풀어 (계수, 잔차 표준편차, 계절 항 사용 여부) 반환
+
+    관측 기간이 SEASONAL_MIN_DAYS보다 짧거나 관측한 시간대가 부족한 시리즈는 계절 항을 빼고
+    추세만 맞춘다 (정규방정식에서 해당 행 / 열을 단위 행렬로 바꿔 계수가 0이 되도록).
+    대각에 작은 릿지를 더하고, 그래도 풀리지 않는 시리즈는 하나씩 최소제곱으로 다시 푼다.
+    잔차 제곱합은 정규방정식 값으로 계산해 행렬을 한 번 더 훑지 않는다.
+    """
+    count, width = means.shape
+    X = design(np.arange(first, first + width), bucket_ms, (first + width) * bucket_ms)
+    size = X.shape[1]
+
+    seasonal = (spans * bucket_ms >= SEASONAL_MIN_DAYS * DAY * 1000) & seasonal_coverage(first, observed, bucket_ms)
+    mask = np.ones((count, size))
+    mask[~seasonal, 2:] = 0.0
+
+    # Σ w·x·xᵀ 를 시리즈 전체에 대해 행렬곱 하나로
+    counts = observed.sum(axis=1)
+    gram = (observed @ (X[:, :, None] * X[:, None, :]).reshape(width, size * size)).reshape(count, size, size)
+    gram = gram * mask[:, :, None] * mask[:, None, :] + np.eye(size) * (1 - mask)[:, None, :]
+    gram = gram + np.eye(size) * (RIDGE * counts)[:, None, None]
+    moments = (means @ X) * mask
+    try:
+        coef = np.linalg.solve(gram, moments[:, :, None])[:, :, 0]
+    except np.linalg.LinAlgError:
+        coef = np.full((count, size), np.nan)
+
+    # 배치가 특이 행렬로 실패했거나 값이 유한하지 않은 시리즈만 따로 풂
+    for row in np.flatnonzero(~np.isfinite(coef).all(axis=1)):
+        coef[row] = np.linalg.lstsq(gram[row], moments[row], rcond=None)[0]
+
+    # Σ w·(y - xβ)² = Σ w·y² - 2β·(Xᵀwy) + βᵀ(XᵀwX)β
+    squares = np.einsum('st,st->s', means, means)
+    residual = squares - 2 * np.einsum('sp,sp->s', coef, moments) + np.einsum('sp,spq,sq->s', coef, gram, coef)
+    dof = np.maximum(counts - mask.sum(axis=1), 1)
+    return coef, np.sqrt(np.maximum(residual, 0) / dof), seasonal
+
+
+def seasonal_profile(coef, points=96):
+    """하루 주기 성분 (하루를 points개로 나눈 값)"""
+    phase = 2 * np.pi * np.arange(points) / points
+    profile = np.zeros((len(coef), points))
+    for k in range(1, SEASONAL_HARMONICS + 1):
+        profile += coef[:, 2 * k, None] * np.sin(k * phase) + coef[:, 2 * k + 1, None] * np.cos(k * phase)
+    return profile
+
+
+def forecast_rollups(rollups):
+    """롤업의 모든 시리즈 예측 결과 목록 (한계 도달이 가까운 순)"""
+    usable = sorted(name for name, data in rollups.series.items() if len(data[0]) >= MIN_BUCKETS)
+    if not usable:
+        return []
+
+    first, means, observed, spans = rollups.matrix(usable)
+    coef, std, seasonal = fit(first, means, observed, spans, rollups.bucket_ms)
+    span_days = spans * rollups.bucket_ms / (DAY * 1000)
+
+    profile = seasonal_profile(coef)
+    reference = EPOCH + timedelta(milliseconds=int(rollups.closed * rollups.bucket_ms))
+    results = []
+    for row, name in enumerate(usable):
+        kind = forecast_kind(name)
+        unit, limit = FORECAST_KINDS[kind]
+        baseline, per_day = float(coef[row, 0]), float(coef[row, 1])
+        peak = float(profile[row].max())
+
+        # 하루 중 최고점(추세 + 계절 최댓값)이 한계에 닿는 시점
+        days_to_limit = None
+        if limit is not None and per_day > 0:
+            days = (limit - baseline - peak) / per_day
+            if days <= MAX_LIMIT_DAYS:
+                days_to_limit = max(days, 0.0)
+
+        results.append({
+            'series': name,
+            'kind': kind,
+            'unit': unit,
+            'limit': limit,
+            'time': reference,
+            'baseline': baseline,
+            'per_day': per_day,
+            'per_week': per_day * 7,
+            'daily_range': float(profile[row].max() - profile[row].min()),
+            'std': float(std[row]),
+            'buckets': len(rollups.series[name][0]),
+            'span_days': float(span_days[row]),
+            'seasonal': bool(seasonal[row]),
+            'days_to_limit': days_to_limit,
+            'limit_at': reference + timedelta(days=days_to_limit) if days_to_limit is not None else None,
+            'coef': coef[row].tolist()
+        })
+
+    results.sort(key=lambda r: (r['days_to_limit'] is None, r['days_to_limit'] or 0, r['series']))
+    return results
+
+
+def forecast_path(result, horizon_days=FORECAST_HORIZON_DAYS, bucket_seconds=FORECAST_BUCKET):
+    """예측 결과의 미래 경로 [{'time', 'value', 'min', 'max'}] (±2σ)"""
+    reference = to_millis(result['time'])
+    bucket_ms = bucket_seconds * 1000
+    first = reference // bucket_ms
+    buckets = np.arange(first, first + int(horizon_days * DAY / bucket_seconds))
+    values = design(buckets, bucket_ms, reference) @ np.asarray(result['coef'])
+    band = 2 * result['std']
+    times = ((buckets + 0.5) * bucket_ms).astype('datetime64[ms]').tolist()
+    return [
+        {'time': t, 'value': value, 'min': value - band, 'max': value + band}
+        for t, value in zip(times, values.tolist())
+    ]
+
+
+def forecast_summary(result):
+    """API 응답용 예측 결과 (계수 제외, 시간은 ISO 8601)"""
+    summary = {key: value for key, value in result.items() if key != 'coef'}
+    summary['time'] = result['time'].isoformat()
+    summary['limit_at'] = result['limit_at'].isoformat() if result['limit_at'] else None
+    return summary
+
+
+def forecast_history(history, bucket_seconds=FORECAST_BUCKET):
+    """기록 파일 등 고정된 히스토리의 예측 (마지막 포인트가 속한 구간 전까지)"""
+    if not NUMPY_AVAILABLE:
+        return []
+    ends = [data[-1]['time'] for name, data in history.items() if forecast_kind(name) and is_time_series(data)]
+    if not ends:
+        return []
+    rollups = Rollups(bucket_seconds, retention_days=ROLLUP_RETENTION_DAYS)
+    rollups.update(history, max(ends))
+    return forecast_rollups(rollups)
+
+
+class Forecaster:
+    """공유 히스토리 위의 롤업 + 예측 캐시 (새 구간이 닫힐 때만 다시 맞춤)"""
+
+    def __init__(self, history, bucket_seconds=FORECAST_BUCKET, retention_days=ROLLUP_RETENTION_DAYS):
+        self.history = history
+        self.rollups = Rollups(bucket_seconds, retention_days)
+        self.lock = threading.Lock()
+        self.cache = (None, [])
+
+    def update(self, now):
+        """수집 루프에서 기록 직후 호출 (구간이 바뀔 때만 실제로 롤업)
+
+        구간은 수집 루프만 닫는다. 요청 스레드가 닫으면 아직 기록되지 않은 그 구간의
+        샘플이 롤업에서 빠진다.
+        """
+        if not NUMPY_AVAILABLE:
+            return
+        with self.lock:
+            self.rollups.update(self.history, now)
+
+    def forecast(self):
+        """마지막으로 닫힌 구간까지의 예측 결과 목록 (롤업 version이 같으면 캐시 반환)"""
+        if not NUMPY_AVAILABLE:
+            return []
+        with self.lock:
+            cached_version, results = self.cache
+            if cached_version != self.rollups.version:
+                results = forecast_rollups(self.rollups)
+                self.cache = (self.rollups.version, results)
+            return results
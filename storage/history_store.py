@@ -0,0 +1,55 @@
+"""
+공유 히스토리 저장소
+항상 켜져 있는 수집기 하나가 기록하고, 여러 세션 / API가 시간 범위로 읽는 메모리 저장소
+"""
+
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from storage.series import Series
+
+
+# 오래된 포인트 정리 주기 (초)
+TRIM_INTERVAL = 60
+
+
+class HistoryStore(defaultdict):
+    """시리즈 이름 → Series (기존 history dict와 같은 형태)
+
+    쓰기(record / 정리)는 lock으로 직렬화한다. Series는 뒤에만 추가되고 봉인 / 정리 시
+    상태를 통째로 바꿔 끼우므로 읽기는 lock 없이 하면 된다.
+    오래된 포인트는 압축 블록으로 봉인되어 같은 메모리로 더 긴 기간을 보존한다.
+    """
+
+    def __init__(self, retention_seconds=None):
+        super().__init__(Series)
+        self.lock = threading.Lock()
+        self.retention_seconds = retention_seconds
+        self.last_trim = time.monotonic()
+
+    def trim(self, now=None):
+        """보존 기간이 지난 포인트 삭제 (TRIM_INTERVAL마다 한 번)"""
+        if not self.retention_seconds or time.monotonic() - self.last_trim < TRIM_INTERVAL:
+            return
+
+        cutoff = (now or datetime.now()) - timedelta(seconds=self.retention_seconds)
+        with self.lock:
+            for data in self.values():
+                if isinstance(data, Series):
+                    data.trim(cutoff)
+            self.last_trim = time.monotonic()
+
+    def window(self, start=None, end=None):
+        """[start, end] 구간만 담은 일반 dict (보고서용, 시계열이 아닌 항목은 그대로)
+
+        시리즈는 구간만 담은 Series 뷰로 돌려주므로 블록은 실제로 읽는 시리즈만 디코딩한다.
+        """
+        result = {}
+        for name, data in list(self.items()):
+            if isinstance(data, Series):
+                result[name] = data.window(start, end)
+            else:
+                result[name] = data
+        return result
@@ -0,0 +1,88 @@
+"""
+시계열 다운샘플링
+긴 기간의 히스토리를 고정 개수의 구간(평균/최소/최대)으로 요약
+"""
+
+from bisect import bisect_left, bisect_right
+
+from storage.blocks import NUMPY_AVAILABLE, to_millis
+from storage.series import Series
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+def downsample(data, start, end, buckets):
+    """[start, end] 구간의 포인트를 buckets개 구간으로 요약
+
+    반환: [{'time': 구간 중앙 시각, 'value': 평균, 'min': 최소, 'max': 최대}, ...]
+    포인트가 없는 구간은 생략한다. 포인트에 'interval'이 있으면 가중 평균을 사용한다.
+    """
+    if isinstance(data, Series) and NUMPY_AVAILABLE:
+        times, values, intervals = data.arrays(start, end)
+        return downsample_arrays(times, values, intervals, start, end, buckets)
+
+    count = len(data)
+    lo = bisect_left(data, start, hi=count, key=lambda d: d['time'])
+    hi = bisect_right(data, end, lo=lo, hi=count, key=lambda d: d['time'])
+    if lo >= hi:
+        return []
+
+    # 구간 경계를 이분 탐색으로 찾고 구간마다 슬라이스 단위로 집계 (포인트별 시간 연산 없음)
+    width = (end - start) / buckets
+    result = []
+    left = lo
+    for index in range(buckets):
+        if left >= hi:
+            break
+        if index == buckets - 1:
+            right = hi
+        else:
+            right = bisect_left(data, start + width * (index + 1), lo=left, hi=hi, key=lambda d: d['time'])
+        if right == left:
+            continue
+
+        values = [d['value'] for d in data[left:right]]
+        weights = [d.get('interval', 1) for d in data[left:right]]
+        total = sum(weights)
+        if total:
+            result.append({
+                'time': start + width * (index + 0.5),
+                'value': sum(v * w for v, w in zip(values, weights)) / total,
+                'min': min(values),
+                'max': max(values)
+            })
+        left = right
+    return result
+
+
+def downsample_arrays(times, values, intervals, start, end, buckets):
+    """downsample()의 배열 버전 (압축 블록을 벡터화 디코딩한 [start, end] 구간)
+
+    times는 ms 단위, intervals가 0인 포인트는 가중치 1로 계산한다.
+    """
+    if not len(times):
+        return []
+
+    weights = np.where(intervals > 0, intervals, 1.0)
+    lo = to_millis(start)
+    edges = lo + (to_millis(end) - lo) / buckets * np.arange(1, buckets)
+    bounds = np.searchsorted(times, edges, 'left')
+    firsts = np.concatenate(([0], bounds))
+    lasts = np.concatenate((bounds, [len(times)]))
+
+    # 빈 구간을 빼고 reduceat (각 구간은 다음 비어 있지 않은 구간 시작까지)
+    filled = np.flatnonzero(lasts > firsts)
+    offsets = firsts[filled]
+    sums = np.add.reduceat(values * weights, offsets)
+    totals = np.add.reduceat(weights, offsets)
+    mins = np.minimum.reduceat(values, offsets)
+    maxs = np.maximum.reduceat(values, offsets)
+
+    width = (end - start) / buckets
+    return [
+        {'time': start + width * (index + 0.5), 'value': total_sum / total, 'min': low, 'max': high}
+        for index, total_sum, total, low, high in zip(
+            filled.tolist(), sums.tolist(), totals.tolist(), mins.tolist(), maxs.tolist()
+        )
+    ]
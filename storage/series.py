@@ -0,0 +1,249 @@
+"""
+압축 시계열
+최근 포인트는 dict 리스트로 두고, BLOCK_SIZE개가 차면 압축 블록으로 봉인하는 시리즈
+(기존 히스토리의 포인트 리스트와 같은 방식으로 읽을 수 있음)
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+
+from storage.blocks import BLOCK_SIZE, EPOCH, MILLISECOND, NUMPY_AVAILABLE, Block, to_millis
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+class Series(Sequence):
+    """봉인된 블록 + 아직 봉인하지 않은 최근 포인트(head)
+
+    상태 (blocks, 봉인된 포인트 수, head)를 튜플 하나로 바꿔 끼우므로, 수집 스레드가
+    블록을 봉인하거나 정리하는 중에도 읽는 쪽은 lock 없이 일관된 상태를 본다.
+    numpy가 없으면 봉인하지 않고 리스트처럼 동작한다.
+    """
+
+    def __init__(self, block_size=BLOCK_SIZE):
+        self.block_size = block_size
+        self.state = ((), 0, [])
+        self.cache = (None, None)
+
+    # ---------- 쓰기 ----------
+
+    def append(self, point):
+        blocks, sealed, head = self.state
+        head.append(point)
+        if NUMPY_AVAILABLE and len(head) >= self.block_size:
+            self.state = (blocks + (Block.from_points(head),), sealed + len(head), [])
+
+    def trim(self, cutoff):
+        """cutoff 이전 포인트 삭제 (블록은 통째로, 마지막 시각이 cutoff 이전인 것만)"""
+        blocks, sealed, head = self.state
+        limit = to_millis(cutoff)
+        keep = 0
+        while keep < len(blocks) and blocks[keep].end < limit:
+            keep += 1
+
+        if keep < len(blocks):
+            if keep:
+                dropped = sum(block.count for block in blocks[:keep])
+                self.state = (blocks[keep:], sealed - dropped, head)
+            return
+
+        index = bisect_left(head, cutoff, key=lambda d: d['time'])
+        if keep or index:
+            self.state = ((), 0, head[index:])
+
+    # ---------- 읽기 ----------
+
+    def __len__(self):
+        _, sealed, head = self.state
+        return sealed + len(head)
+
+    def _block_points(self, block):
+        """최근 디코딩한 블록 하나는 캐시 (bisect / 마지막 값 조회용)"""
+        cached_block, points = self.cache
+        if cached_block is not block:
+            points = block.points()
+            self.cache = (block, points)
+        return points
+
+    def __getitem__(self, index):
+        blocks, sealed, head = self.state
+        total = sealed + len(head)
+
+        if isinstance(index, slice):
+            start, stop, step = index.indices(total)
+            if step != 1:
+                return self._points(blocks, sealed, head, 0, total)[index]
+            return self._points(blocks, sealed, head, start, stop)
+
+        if index < 0:
+            index += total
+        if not 0 <= index < total:
+            raise IndexError('Series index out of range')
+        if index >= sealed:
+            return head[index - sealed]
+
+        for block in blocks:
+            if index < block.count:
+                return self._block_points(block)[index]
+            index -= block.count
+
+    def __iter__(self):
+        blocks, sealed, head = self.state
+        for block in blocks:
+            yield from block.points()
+        yield from list(head)
+
+    def _points(self, blocks, sealed, head, start, stop):
+        """[start, stop) 위치의 포인트 리스트 (필요한 블록만 디코딩)"""
+        result = []
+        offset = 0
+        for block in blocks:
+            if offset >= stop:
+                break
+            if offset + block.count > start:
+                points = block.points()
+                result.extend(points[max(start - offset, 0):stop - offset])
+            offset += block.count
+        if stop > sealed:
+            result.extend(head[max(start - sealed, 0):stop - sealed])
+        return result
+
+    def iter_range(self, start=None, end=None):
+        """[start, end] 포인트를 블록 단위로 디코딩하며 생성 (메모리 사용량 일정)"""
+        blocks, _, head = self.state
+        overlaps, _ = self._in_range(start, end)
+
+        for block in blocks:
+            if not overlaps(block):
+                continue
+            for point in block.points():
+                if (start and point['time'] < start) or (end and point['time'] > end):
+                    continue
+                yield point
+
+        yield from self._head_range(head, start, end)
+
+    @staticmethod
+    def _millis_range(start, end):
+        """[start, end]에 들어가는 ms 범위 (블록 시간은 ms 단위이므로 start는 올림, end는 내림)"""
+        lo = -((EPOCH - start) // MILLISECOND) if start else None
+        hi = to_millis(end) if end else None
+        return lo, hi
+
+    def _in_range(self, start, end):
+        """(블록 필터, 경계 판정) - [start, end]와 겹치는 블록 / 통째로 들어가는 블록"""
+        lo, hi = self._millis_range(start, end)
+
+        def overlaps(block):
+            return not ((lo is not None and block.end < lo) or (hi is not None and block.start > hi))
+
+        def inside(block):
+            return (lo is None or block.start >= lo) and (hi is None or block.end <= hi)
+
+        return overlaps, inside
+
+    def _head_range(self, head, start, end):
+        count = len(head)
+        first = bisect_left(head, start, hi=count, key=lambda d: d['time']) if start else 0
+        last = bisect_right(head, end, lo=first, hi=count, key=lambda d: d['time']) if end else count
+        return head[first:last]
+
+    def window(self, start=None, end=None):
+        """[start, end] 구간만 담은 읽기 전용 Series (보고서용 스냅샷)
+
+        구간 안에 통째로 들어가는 블록은 디코딩 없이 공유하고, 경계에 걸친 블록만 풀어서
+        구간 안의 포인트로 다시 봉인한다. 최근 포인트(head)는 구간만 복사한다.
+        """
+        blocks, _, head = self.state
+        overlaps, inside = self._in_range(start, end)
+
+        kept = []
+        for block in blocks:
+            if not overlaps(block):
+                continue
+            if inside(block):
+                kept.append(block)
+                continue
+            points = [p for p in block.points()
+                      if not ((start and p['time'] < start) or (end and p['time'] > end))]
+            if points:
+                kept.append(Block.from_points(points))
+
+        view = Series(self.block_size)
+        view.state = (tuple(kept), sum(block.count for block in kept), self._head_range(list(head), start, end))
+        return view
+
+    def count(self, start=None, end=None):
+        """[start, end] 포인트 수 (경계 블록의 시간만 디코딩)"""
+        blocks, _, head = self.state
+        overlaps, inside = self._in_range(start, end)
+        lo, hi = self._millis_range(start, end)
+
+        total = 0
+        for block in blocks:
+            if not overlaps(block):
+                continue
+            if inside(block):
+                total += block.count
+                continue
+            times = block.decode()[0]
+            first = np.searchsorted(times, lo, 'left') if lo is not None else 0
+            last = np.searchsorted(times, hi, 'right') if hi is not None else len(times)
+            total += int(last - first)
+        return total + len(self._head_range(list(head), start, end))
+
+    def points(self, start=None, end=None):
+        """[start, end] 포인트 리스트"""
+        return list(self.iter_range(start, end))
+
+    def arrays(self, start=None, end=None):
+        """[start, end] 구간을 (ms int64, 값, 간격) numpy 배열로 (블록은 벡터화 디코딩)"""
+        blocks, sealed, head = self.state
+        overlaps, _ = self._in_range(start, end)
+        lo, hi = self._millis_range(start, end)
+
+        parts = [block.decode() for block in blocks if overlaps(block)]
+        if head:
+            head = list(head)
+            count = len(head)
+            parts.append((
+                np.fromiter((to_millis(p['time']) for p in head), dtype=np.int64, count=count),
+                np.fromiter((p['value'] for p in head), dtype=np.float64, count=count),
+                np.fromiter((p.get('interval', 0) for p in head), dtype=np.float64, count=count)
+            ))
+
+        if not parts:
+            empty = np.zeros(0)
+            return empty.astype(np.int64), empty, empty
+
+        times, values, intervals = (np.concatenate(column) for column in zip(*parts))
+        first = np.searchsorted(times, lo, 'left') if lo is not None else 0
+        last = np.searchsorted(times, hi, 'right') if hi is not None else len(times)
+        return times[first:last], values[first:last], intervals[first:last]
+
+    def nbytes(self):
+        """봉인된 블록의 바이트 수"""
+        blocks, _, _ = self.state
+        return sum(len(block.data) for block in blocks)
+
+
+def is_time_series(data):
+    """히스토리 값이 시계열(포인트 리스트 / Series)인지"""
+    if isinstance(data, Series):
+        return len(data) > 0
+    return (isinstance(data, list) and bool(data) and isinstance(data[0], dict)
+            and 'time' in data[0] and 'value' in data[0])
+
+
+def iter_range(data, start=None, end=None):
+    """시계열(리스트 / Series)의 [start, end] 포인트 생성"""
+    if isinstance(data, Series):
+        yield from data.iter_range(start, end)
+        return
+
+    count = len(data)
+    lo = bisect_left(data, start, hi=count, key=lambda d: d['time']) if start else 0
+    hi = bisect_right(data, end, lo=lo, hi=count, key=lambda d: d['time']) if end else count
+    for i in range(lo, hi):
+        yield data[i]
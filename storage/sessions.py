@@ -0,0 +1,59 @@
+"""
+녹화 세션
+공유 수집기 위의 이름 있는 시간 범위 북마크 (세션마다 수집 비용 없음)
+"""
+
+import threading
+from datetime import datetime
+
+
+class SessionManager:
+    """이름 → {'name', 'start', 'end'} (end가 None이면 진행 중)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sessions = {}
+
+    def start(self, name, now=None):
+        """세션 시작 (같은 이름이 진행 중이면 ValueError)"""
+        with self.lock:
+            session = self.sessions.get(name)
+            if session and session['end'] is None:
+                raise ValueError(f'Session already running: {name}')
+
+            session = {'name': name, 'start': now or datetime.now(), 'end': None}
+            self.sessions[name] = session
+            return dict(session)
+
+    def stop(self, name, now=None):
+        """세션 종료 (없으면 KeyError, 이미 끝났으면 그대로 반환)"""
+        with self.lock:
+            session = self.sessions[name]
+            if session['end'] is None:
+                session['end'] = now or datetime.now()
+            return dict(session)
+
+    def get(self, name):
+        with self.lock:
+            session = self.sessions.get(name)
+            return dict(session) if session else None
+
+    def list(self):
+        with self.lock:
+            return [dict(s) for s in self.sessions.values()]
+
+    def remove(self, name):
+        with self.lock:
+            return self.sessions.pop(name, None)
+
+
+def session_status(session, now=None):
+    """API 응답용 세션 상태"""
+    end = session['end'] or now or datetime.now()
+    return {
+        'name': session['name'],
+        'active': session['end'] is None,
+        'start': session['start'].isoformat(),
+        'end': session['end'].isoformat() if session['end'] else None,
+        'elapsed_seconds': (end - session['start']).total_seconds()
+    }
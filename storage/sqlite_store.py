@@ -0,0 +1,216 @@
+"""
+SQLite 샘플 저장소
+수집 중 샘플을 파일에 바로 기록하고, 보고서/내보내기용으로 다시 읽기
+
+샘플은 먼저 samples 테이블에 한 행씩 기록하고, 시리즈마다 BLOCK_SIZE개가 모이면
+압축 블록(storage/blocks.py)으로 봉인해 blocks 테이블로 옮긴다.
+"""
+
+import heapq
+import json
+import sqlite3
+from collections import defaultdict
+from datetime import datetime
+
+from storage.blocks import BLOCK_SIZE, NUMPY_AVAILABLE, Block, decode_block, to_points
+from storage.captures import capture_from_json, capture_to_json
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    series TEXT NOT NULL,
+    time REAL NOT NULL,
+    value REAL,
+    interval REAL
+);
+CREATE INDEX IF NOT EXISTS idx_samples_series_time ON samples (series, time);
+CREATE TABLE IF NOT EXISTS blocks (
+    series TEXT NOT NULL,
+    start REAL NOT NULL,
+    end REAL NOT NULL,
+    count INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_blocks_series_start ON blocks (series, start);
+CREATE TABLE IF NOT EXISTS captures (
+    id INTEGER PRIMARY KEY,
+    time REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SampleWriter:
+    """수집 샘플을 SQLite 파일에 순차 기록"""
+
+    def __init__(self, path, commit_every=10, block_size=BLOCK_SIZE):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        self.commit_every = commit_every
+        self.pending = 0
+        self.block_size = block_size
+        self.buffers = defaultdict(list)
+
+    def write(self, sample):
+        """파이프라인 샘플 하나 기록 (commit_every개마다 커밋)"""
+        ts = sample['time'].timestamp()
+        intervals = sample.get('intervals', {})
+        self.conn.executemany(
+            'INSERT INTO samples (series, time, value, interval) VALUES (?, ?, ?, ?)',
+            [(name, ts, value, intervals.get(name)) for name, value in sample['values'].items()]
+        )
+
+        if NUMPY_AVAILABLE:
+            for name, value in sample['values'].items():
+                buffer = self.buffers[name]
+                buffer.append({'time': sample['time'], 'value': value, 'interval': intervals.get(name, 0)})
+                if len(buffer) >= self.block_size:
+                    self.seal(name)
+        if sample['partitions'] is not None:
+            self.set_meta('disk_partitions', sample['partitions'], commit=False)
+
+        self.pending += 1
+        if self.pending >= self.commit_every:
+            self.conn.commit()
+            self.pending = 0
+
+    def seal(self, name):
+        """버퍼의 포인트를 블록으로 봉인하고 같은 트랜잭션에서 원본 행 삭제"""
+        points = self.buffers.pop(name)
+        block = Block.from_points(points)
+        first = points[0]['time'].timestamp()
+        last = points[-1]['time'].timestamp()
+        self.conn.execute(
+            'INSERT INTO blocks (series, start, end, count, data) VALUES (?, ?, ?, ?, ?)',
+            (name, first, last, block.count, block.data)
+        )
+        self.conn.execute(
+            'DELETE FROM samples WHERE series = ? AND time >= ? AND time <= ?',
+            (name, first, last)
+        )
+
+    def write_capture(self, event):
+        """버스트 캡처 이벤트 하나 기록하고 파일 안의 id 반환
+
+        수집할 때마다 CaptureStore id가 1부터 다시 시작하므로, 기존 파일에 이어 기록해도
+        덮어쓰지 않도록 id는 SQLite가 정한다.
+        """
+        cursor = self.conn.execute(
+            'INSERT INTO captures (time, data) VALUES (?, ?)',
+            (event['time'].timestamp(), json.dumps(capture_to_json(event)))
+        )
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def set_meta(self, key, value, commit=True):
+        """JSON 메타데이터 저장 (시스템 정보 등)"""
+        self.conn.execute(
+            'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+            (key, json.dumps(value))
+        )
+        if commit:
+            self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def has_table(conn, name):
+    """이전 버전에서 만든 파일에는 blocks / captures 테이블이 없음"""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ).fetchone() is not None
+
+
+def iter_series_points(conn, name, start=None, end=None):
+    """시리즈 하나의 포인트를 시간순으로 생성
+
+    여러 번 실행해 기록한 파일은 실행마다 봉인하지 못한 행이 samples에 남으므로,
+    봉인된 블록과 행을 각각 시간순으로 읽어 시간 기준으로 병합한다.
+    """
+    params = [name]
+    block_query = 'SELECT data FROM blocks WHERE series = ?'
+    row_query = 'SELECT time, value, interval FROM samples WHERE series = ?'
+    if start:
+        block_query += ' AND end >= ?'
+        row_query += ' AND time >= ?'
+        params.append(start.timestamp())
+    if end:
+        block_query += ' AND start <= ?'
+        row_query += ' AND time <= ?'
+        params.append(end.timestamp())
+
+    def block_points():
+        # 블록 안의 시간은 타임존 없는 로컬 시간이므로 경계도 같은 형태로 비교
+        lo = datetime.fromtimestamp(start.timestamp()) if start else None
+        hi = datetime.fromtimestamp(end.timestamp()) if end else None
+        for (data,) in conn.execute(block_query + ' ORDER BY start', params).fetchall():
+            for point in to_points(*decode_block(data)):
+                if (lo and point['time'] < lo) or (hi and point['time'] > hi):
+                    continue
+                yield point
+
+    def row_points():
+        for ts, value, interval in conn.execute(row_query + ' ORDER BY time', params):
+            point = {'time': datetime.fromtimestamp(ts), 'value': value}
+            if interval is not None:
+                point['interval'] = interval
+            yield point
+
+    if not has_table(conn, 'blocks'):
+        yield from row_points()
+        return
+    yield from heapq.merge(block_points(), row_points(), key=lambda point: point['time'])
+
+
+def stored_series(conn):
+    """파일에 기록된 시리즈 이름 (정렬)"""
+    query = 'SELECT DISTINCT series FROM samples'
+    if has_table(conn, 'blocks'):
+        query += ' UNION SELECT DISTINCT series FROM blocks'
+    return [name for (name,) in conn.execute(query + ' ORDER BY 1')]
+
+
+def iter_points(path, series=None, start=None, end=None):
+    """(시리즈, 시간, 값) 행을 하나씩 생성 (report.exporter와 같은 형식, 블록 단위로 디코딩)"""
+    conn = sqlite3.connect(path)
+    try:
+        for name in sorted(series) if series else stored_series(conn):
+            for point in iter_series_points(conn, name, start, end):
+                yield name, point['time'], point['value']
+    finally:
+        conn.close()
+
+
+def load_history(path):
+    """파일 전체를 보고서용 히스토리(dict of list)로 읽기"""
+    history = defaultdict(list)
+
+    conn = sqlite3.connect(path)
+    try:
+        for name in stored_series(conn):
+            history[name] = list(iter_series_points(conn, name))
+
+        if has_table(conn, 'captures'):
+            history['captures'] = [
+                {**capture_from_json(json.loads(data)), 'id': capture_id}
+                for capture_id, data in conn.execute('SELECT id, data FROM captures ORDER BY time')
+            ]
+
+        for key, value in conn.execute('SELECT key, value FROM meta'):
+            history[key] = json.loads(value)
+    finally:
+        conn.close()
+
+    return history
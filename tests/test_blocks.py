@@ -0,0 +1,129 @@
+"""압축 블록 / 시리즈 (storage/blocks.py, storage/series.py)"""
+
+import math
+from datetime import datetime, timedelta
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from storage.blocks import Block, decode_block, encode_block, to_millis
+from storage.series import Series
+
+
+START = datetime(2026, 10, 1, 9)
+
+
+def points(count, step=1.0, value=lambda i: float(i)):
+    """START부터 step초 간격 포인트 (간격 0은 블록에 저장되지 않으므로 step > 0)"""
+    return [
+        {'time': START + timedelta(seconds=i * step), 'value': value(i), 'interval': step}
+        for i in range(count)
+    ]
+
+
+def same_values(actual, expected):
+    """NaN까지 비트 단위로 같은지"""
+    return np.array_equal(np.asarray(actual, dtype=np.float64).view('<u8'),
+                          np.asarray(expected, dtype=np.float64).view('<u8'))
+
+
+@pytest.mark.parametrize('count', [1, 2, 3, 256])
+def test_block_round_trip(count):
+    """특수 값 / 음수 / 시간 역행까지 디코딩 결과가 원본과 같음"""
+    special = [math.nan, -1.5, 0.0, -0.0, math.inf, -math.inf, 1e308, -2.5e-300, 42.0]
+    values = np.array([special[i % len(special)] for i in range(count)])
+    # 불규칙 간격 + 역행하는 시간 (음수 delta / delta-of-delta)
+    steps = np.array([1000, -250, 3, 86_400_000, -7, 0])
+    times = 1_790_000_000_000 + np.cumsum([steps[i % len(steps)] for i in range(count)])
+    intervals = np.array([(i % 4) * 0.5 for i in range(count)])
+
+    decoded = decode_block(encode_block(times, values, intervals))
+    assert np.array_equal(decoded[0], times)
+    assert same_values(decoded[1], values)
+    assert same_values(decoded[2], intervals)
+
+
+@pytest.mark.parametrize('count', [1, 2])
+def test_short_block_points(count):
+    """포인트 1~2개 블록: 시간 범위와 포인트 dict가 원본과 같음"""
+    original = points(count, step=0.5, value=lambda i: -3.25 * (i + 1))
+    original[-1]['value'] = math.nan
+    block = Block.from_points(original)
+
+    assert block.count == count
+    assert block.start == to_millis(original[0]['time'])
+    assert block.end == to_millis(original[-1]['time'])
+
+    decoded = block.points()
+    assert [p['time'] for p in decoded] == [p['time'] for p in original]
+    assert [p['interval'] for p in decoded] == [p['interval'] for p in original]
+    assert same_values([p['value'] for p in decoded], [p['value'] for p in original])
+
+
+def filled(count, block_size=8):
+    series = Series(block_size)
+    original = points(count, value=lambda i: (-1) ** i * i / 3)
+    for point in original:
+        series.append(point)
+    return series, original
+
+
+def test_series_matches_list():
+    """블록 + head에 걸친 인덱스 / 슬라이스 / 반복이 리스트와 같음"""
+    series, original = filled(29)
+    assert len(series) == len(original)
+    assert list(series) == original
+    assert series[0] == original[0] and series[-1] == original[-1] and series[12] == original[12]
+
+    for index in [slice(None), slice(3, 20), slice(-5, None), slice(7, 8), slice(30, 40), slice(None, None, 3)]:
+        assert series[index] == original[index]
+    with pytest.raises(IndexError):
+        series[29]
+
+
+def test_series_range_reads():
+    """구간 읽기 (points / iter_range / window / count / arrays)가 리스트 필터와 같음"""
+    series, original = filled(29)
+    # 밀리초 아래 자릿수가 있는 경계 (블록 시간은 ms 단위)
+    start = START + timedelta(seconds=5, microseconds=500)
+    end = START + timedelta(seconds=21)
+    expected = [p for p in original if start <= p['time'] <= end]
+
+    assert series.points(start, end) == expected
+    assert list(series.iter_range(start, end)) == expected
+    assert series.count(start, end) == len(expected)
+
+    view = series.window(start, end)
+    assert len(view) == len(expected)
+    assert list(view) == expected
+    assert view.count() == len(expected)
+
+    times, values, _ = series.arrays(start, end)
+    assert len(times) == len(expected)
+    assert values.tolist() == [p['value'] for p in expected]
+
+    assert series.count() == len(original)
+    assert list(series.window()) == original
+
+
+def test_series_trim():
+    """trim은 cutoff 이전에 끝난 블록만 통째로 버리고 head는 포인트 단위로 정리"""
+    series, original = filled(29)
+
+    series.trim(START + timedelta(seconds=10))
+    assert list(series) == original[8:]
+
+    # 마지막 포인트가 cutoff와 같은 블록은 남김
+    series.trim(START + timedelta(seconds=15))
+    assert list(series) == original[8:]
+
+    series.trim(START + timedelta(seconds=15.5))
+    assert list(series) == original[16:]
+
+    series.trim(START + timedelta(seconds=26))
+    assert list(series) == original[26:]
+    assert len(series) == 3
+
+    series.trim(START + timedelta(hours=1))
+    assert len(series) == 0 and list(series) == []
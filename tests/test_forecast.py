@@ -0,0 +1,45 @@
+"""추세 / 용량 예측 (storage/forecast.py)"""
+
+import math
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from storage.forecast import forecast_history
+
+
+def session(start, hours, value, step=60):
+    """start부터 hours시간 동안 step초 간격 포인트"""
+    return [
+        {'time': start + timedelta(seconds=i * step), 'value': value(i), 'interval': step}
+        for i in range(int(hours * 3600 / step))
+    ]
+
+
+def test_sparse_sessions_fit_trend_only():
+    """48시간 떨어진 2시간짜리 세션 두 개: 시간대가 부족하므로 하루 주기 없이 추세만"""
+    start = datetime(2026, 10, 1, 9)
+    points = session(start, 2, lambda i: 50 + (i % 30) / 10)
+    points += session(start + timedelta(hours=48), 2, lambda i: 50 + (i % 30) / 10)
+
+    (result,) = forecast_history({'memory': points})
+    assert not result['seasonal']
+    assert result['daily_range'] == 0
+    assert 49 < result['baseline'] < 54
+    assert result['days_to_limit'] is None or result['days_to_limit'] > 30
+
+
+def test_full_days_fit_trend_and_season():
+    """10일 연속 관측: 추세와 하루 주기를 모두 복원"""
+    start = datetime(2026, 10, 1)
+    points = session(
+        start, 240,
+        lambda i: 40 + 2 / 7 * (i / 1440) + 5 * math.sin(2 * math.pi * i / 1440)
+    )
+
+    (result,) = forecast_history({'memory': points})
+    assert result['seasonal']
+    assert result['per_week'] == pytest.approx(2.0, abs=0.05)
+    assert result['daily_range'] == pytest.approx(10.0, abs=0.3)